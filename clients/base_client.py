@@ -77,7 +77,7 @@ class BaseClient:
             response = self._builder.submit_transaction(signed_tx, self._gateway_url)
             
             # [FIX] Verificación de Código de Estado
-            if response and response.status_code == 200:
+            if response and response.status_code in (200, 202): # 202: TX admitida en la cola de ingesta
                 return True
             else:
                 logging.warning(f"Envío fallido. Code: {response.status_code if response else 'No Response'}. Body: {response.text if response else ''}")
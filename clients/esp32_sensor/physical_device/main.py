@@ -59,7 +59,7 @@ def run():
                     # 3. Enviar al Servidor
                     res = requests.post("{}/submit_data".format(config.GATEWAY_URL), json=payload)
                     
-                    if res.status_code == 200:
+                    if res.status_code in (200, 202): # 202: lectura admitida en la cola de ingesta
                         print(" ✅ OK")
                         # [DELEGACIÓN POO] Llama al controlador para el Feedback Físico
                         feedback.indicate_success() 
@@ -48,7 +48,7 @@ class GatewayConnector:
                 "metadata": {"origin": "WebUI"}
             }
             response = requests.post(f"{self._gateway_url}/submit_data", json=payload, timeout=5)
-            if response.status_code == 200:
+            if response.status_code in (200, 202):
                 return {"success": True, "data": response.json()}
             return {"success": False, "error": response.text}
         except Exception as e:
@@ -44,12 +44,107 @@ class Config:
 
 # config.py - MODO DEMO RÁPIDO
 
+import os
+
 class Config:
     # --- RED P2P ---
-    NETWORK_MAX_PAYLOAD_SIZE: int = 100 * 1024 * 1024 
+    # Límite por mensaje (8 MB). Los bloques grandes viajan fragmentados ('blockchunk'),
+    # así que ya no hace falta reservar 100 MB por mensaje.
+    NETWORK_MAX_PAYLOAD_SIZE: int = 8 * 1024 * 1024 
     NETWORK_DEFAULT_PORT: int = 8000
     NETWORK_STARTUP_DELAY: int = 2
 
+    # Tamaño objetivo de cada fragmento de bloque (1 MB)
+    NETWORK_BLOCK_CHUNK_SIZE: int = 1 * 1024 * 1024
+    # Presupuesto de memoria por conexión para reensamblar bloques fragmentados (32 MB)
+    NETWORK_BLOCK_ASSEMBLY_BUDGET: int = 32 * 1024 * 1024
+    # Tiempo máximo para recibir todos los fragmentos de un bloque
+    NETWORK_BLOCK_ASSEMBLY_TIMEOUT_SEC: int = 60
+    # Bloques fragmentados en ensamblaje a la vez por conexión (>= SYNC_MAX_BLOCKS_IN_FLIGHT_PER_PEER)
+    NETWORK_MAX_ASSEMBLIES_PER_PEER: int = 20
+    # Bloques compactos a la espera de 'blocktxn' por conexión (al superarlo se descarta el más viejo)
+    NETWORK_MAX_PENDING_COMPACT_PER_PEER: int = 4
+    # Hashes de inventario (bloques y TXs) que se recuerdan por par para no re-anunciárselos
+    PEER_KNOWN_INVENTORY_SIZE: int = 50000
+    # Los anuncios de TXs se encolan por par y se envían juntos en un 'inv' cada ~intervalo
+    # (aleatorizado entre 0.5x y 1.5x) o en cuanto la cola de un par llega al tamaño de lote.
+    # Los bloques se siguen anunciando de inmediato.
+    NETWORK_TX_TRICKLE_INTERVAL_SEC: float = 0.5
+    NETWORK_TX_INV_BATCH_SIZE: int = 1000
+    # Un item anunciado por varios pares se pide a uno solo; si no llega en este tiempo, se pide al siguiente
+    NETWORK_GETDATA_TIMEOUT_SEC: float = 5.0
+    # Pedidos 'getdata' en curso que se registran como máximo
+    NETWORK_MAX_TRACKED_REQUESTS: int = 50000
+    # Modo de alto ancho de banda: pares (pedidos en nuestro 'version' y aceptados en el suyo) a los que
+    # se empuja cada bloque nuevo validado como 'cmpctblock', sin 'inv'/'getdata' previos. 0 lo desactiva.
+    NETWORK_HIGH_BANDWIDTH_PEERS: int = 3
+    # Libreta de direcciones de pares ('{port}' = puerto de escucha del nodo)
+    NETWORK_PEERS_FILE: str = 'data_node_{port}/peers.dat'
+    NETWORK_MAX_KNOWN_ADDRESSES: int = 10000
+    # Conexiones: salientes que se mantienen (elegidas de la libreta) y entrantes máximas aceptadas
+    NETWORK_TARGET_OUTBOUND_PEERS: int = 8
+    NETWORK_MAX_INBOUND_PEERS: int = 32
+    # Cada cuánto se revisan las conexiones salientes (y se guarda la libreta)
+    NETWORK_CONNECTION_CHECK_INTERVAL_SEC: float = 5.0
+    NETWORK_CONNECT_TIMEOUT_SEC: float = 5.0
+    # Reintento de una dirección que falló: espera base * 2^(fallos - 1), con tope
+    NETWORK_RECONNECT_BASE_SEC: float = 2.0
+    NETWORK_RECONNECT_MAX_SEC: float = 300.0
+    # Fallos seguidos tras los que se olvida una dirección que nunca funcionó
+    NETWORK_ADDR_MAX_FAILURES: int = 10
+    # Direcciones por 'addr'; solo se comparten las vistas dentro del horizonte
+    NETWORK_MAX_ADDR_PER_MESSAGE: int = 1000
+    NETWORK_ADDR_HORIZON_SEC: int = 24 * 3600
+    # Un 'addr' con hasta este número de direcciones (un anuncio, no una respuesta a 'getaddr')
+    # se reenvía a NETWORK_ADDR_RELAY_FANOUT pares al azar
+    NETWORK_ADDR_RELAY_MAX: int = 10
+    NETWORK_ADDR_RELAY_FANOUT: int = 2
+    # Vida y latencia de los pares: un 'ping' cada intervalo; se desconecta al par que no responde el 'ping'
+    # a tiempo o que no envía nada durante el tiempo de inactividad
+    NETWORK_PING_INTERVAL_SEC: float = 10.0
+    NETWORK_PING_TIMEOUT_SEC: float = 20.0
+    NETWORK_IDLE_TIMEOUT_SEC: float = 60.0
+    # RTT asumido para un par aún sin medir (reparto de la descarga de bloques)
+    NETWORK_DEFAULT_RTT_MS: float = 100.0
+
+    # --- SEGURIDAD P2P (Mal comportamiento y vetos) ---
+    # Puntos por clase de falta; al llegar al umbral el par se desconecta y su IP se veta (persistido)
+    P2P_MISBEHAVIOR_PENALTIES: dict[str, int] = {
+        'invalid_block': 100,       # Bloque corrupto o que no pasa la validación sin estado (PoW, Merkle, firmas)
+        'invalid_headers': 50,      # Cadena de headers que no pasa la validación
+        'malformed_message': 20,    # Checksum, JSON o campos incorrectos; fragmentos o TXs de bloque compacto corruptos
+        'invalid_tx': 10,           # TX corrupta o con firma inválida (no cuenta la de firmante aún sin clave registrada)
+        'unknown_command': 5        # Comando que el protocolo no define
+    }
+    P2P_BAN_THRESHOLD: int = 100
+    P2P_BAN_DURATION_SEC: int = 24 * 3600
+    # La puntuación se reduce a la mitad cada este tiempo (las faltas aisladas se olvidan)
+    P2P_MISBEHAVIOR_HALF_LIFE_SEC: float = 600.0
+    P2P_BANLIST_FILE: str = 'data_node_{port}/banlist.json'
+    # Límite de entrada por par y clase de comando (token buckets):
+    # (mensajes/s, ráfaga de mensajes, bytes/s, ráfaga de bytes). La ráfaga de bytes de 'block' debe admitir
+    # un frame de Config.NETWORK_MAX_PAYLOAD_SIZE; un frame mayor que la ráfaga de su clase se descarta
+    P2P_RATE_LIMITS: dict[str, tuple[float, float, float, float]] = {
+        'control': (20, 100, 64 * 1024, 256 * 1024),                    # version, ping, pong
+        'request': (50, 500, 1024 * 1024, 4 * 1024 * 1024),             # getdata, getheaders, getblocktxn, getaddr
+        'announce': (100, 1000, 2 * 1024 * 1024, 8 * 1024 * 1024),      # inv, addr (y comandos desconocidos)
+        'tx': (2000, 10000, 4 * 1024 * 1024, 16 * 1024 * 1024),         # tx
+        'block': (50, 200, 16 * 1024 * 1024, 64 * 1024 * 1024)         # headers, block, blockchunk, cmpctblock, blocktxn
+    }
+    # Espera máxima de un frame fuera de presupuesto (el par deja de leerse); si se necesita más, se descarta
+    P2P_RATE_LIMIT_MAX_DELAY_SEC: float = 5.0
+
+    # --- SINCRONIZACIÓN (Headers First) ---
+    # Headers máximos por respuesta 'headers' (una página llena implica pedir la siguiente)
+    SYNC_MAX_HEADERS_PER_MESSAGE: int = 2000
+    # Headers validados que se recuerdan para anclar las páginas siguientes mientras llegan los bloques
+    SYNC_HEADER_CACHE_SIZE: int = 100000
+    # Descarga de bloques: ventana deslizante repartida entre los pares, límite en vuelo por par
+    # y espera máxima antes de pedir el bloque a otro par
+    SYNC_BLOCK_DOWNLOAD_WINDOW: int = 1024
+    SYNC_MAX_BLOCKS_IN_FLIGHT_PER_PEER: int = 16
+    SYNC_BLOCK_TIMEOUT_SEC: float = 10.0
+
     # --- CONSENSO (Ajustado para DEMO) ---
     PROTOCOL_VERSION: int = 1
     
@@ -61,6 +156,62 @@ class Config:
     
     # --- VALIDACIÓN ---
     BLOCK_MAX_FUTURE_TIME_SEC: int = 7200 
+    # Tamaño máximo de un bloque (regla de consenso; TransactionUtils.estimate_size). Debe caber en el
+    # presupuesto de ensamblaje de una conexión: un bloque mayor no podría recibirse por fragmentos.
+    BLOCK_MAX_SIZE_BYTES: int = NETWORK_BLOCK_ASSEMBLY_BUDGET // 2
+    # Hilos del pool de validación sin estado (hashes, Merkle, PoW, firmas ECDSA)
+    VALIDATION_WORKERS: int = 4
+    # Hilos para verificar en paralelo las firmas de un bloque (escala con los núcleos)
+    SIGNATURE_VERIFY_WORKERS: int = os.cpu_count() or 1
+    # Por debajo de este número de firmas se verifica en el hilo actual
+    SIGNATURE_BATCH_MIN_PARALLEL: int = 16
+    # Motor de verificación ECDSA: 'auto' (benchmark al arrancar), 'pycryptodome' o 'ecdsa'
+    SIGNATURE_BACKEND: str = 'auto'
+    # Firmas usadas por el benchmark de arranque (en un hilo y repartidas entre SIGNATURE_VERIFY_WORKERS hilos)
+    SIGNATURE_BENCHMARK_SAMPLES: int = 200
+    # Contextos de verificación (tablas precalculadas) que se mantienen por clave pública
+    SIGNATURE_KEY_CONTEXT_CACHE_SIZE: int = 4096
+    # Entradas de la caché LRU de TXs ya verificadas (hash + firma)
+    VERIFIED_TX_CACHE_SIZE: int = 100000
+    # Filtros rodantes de TXs recién confirmadas (el gossip no las vuelve a pedir) / rechazadas (por hash y firma: no se re-validan)
+    RECENT_CONFIRMED_TX_FILTER_SIZE: int = 100000
+    RECENT_REJECTED_TX_FILTER_SIZE: int = 20000
+    # Filtro rodante de bloques y TXs inválidos (no se re-validan: quien los reenvía es penalizado)
+    RECENT_INVALID_FILTER_SIZE: int = 20000
+
+    # --- IDENTIDAD ---
+    # Registro persistente de claves públicas (dirección -> DER), compartido por los nodos del directorio
+    KEY_REGISTRY_PATH: str = 'key_registry.db'
+    # Claves públicas parseadas (EccKey) que se mantienen en memoria
+    KEY_REGISTRY_CACHE_SIZE: int = 4096
+
+    # --- API ---
+    # Máximo de elementos por petición en '/submit_batch' y '/submit_signed_batch'
+    API_MAX_BATCH_ITEMS: int = 1000
+    # Alta de claves en caliente ('/api/keys/register'): exige este token (del operador) en la cabecera 'X-Registration-Token'.
+    # Sin token configurado el endpoint queda deshabilitado (403): el alta sigue el camino del operador ('*.pem', provision_fleet).
+    API_KEY_REGISTRATION_TOKEN: str | None = os.environ.get('KEY_REGISTRATION_TOKEN') or None
+    # Altas por segundo sostenidas / ráfaga máxima por la API (las que excedan responden 429)
+    API_KEY_REGISTRATION_RATE: float = 1.0
+    API_KEY_REGISTRATION_BURST: int = 10
+
+    # Cola de admisión de la API: la validación y firma ocurren fuera del handler HTTP.
+    # Con la cola llena la API responde 429.
+    INGESTION_QUEUE_SIZE: int = 10000
+    # Tareas que drenan la cola y lecturas/TXs que toma cada una por lote
+    INGESTION_WORKERS: int = 2
+    INGESTION_BATCH_SIZE: int = 256
+    # Estados (ID de seguimiento -> resultado) que se recuerdan para consulta
+    INGESTION_TRACKING_CACHE_SIZE: int = 100000
+
+    # --- AGREGACIÓN (Gateway) ---
+    # Las lecturas delegadas se agrupan en una sola TX firmada; la ventana se cierra al cumplirse
+    # el primero de estos límites: tiempo de espera, número de entries o bytes de datos.
+    AGGREGATION_MAX_WAIT_SEC: float = 2.0
+    AGGREGATION_MAX_ENTRIES: int = 500
+    AGGREGATION_MAX_BYTES: int = 256 * 1024
+    # Recibos (receipt_id -> tx_hash) que se recuerdan para consulta
+    AGGREGATION_RECEIPT_CACHE_SIZE: int = 100000
 
     # --- MEMPOOL ---
     MEMPOOL_EXPIRY_SEC: int = 14 * 24 * 60 * 60 
@@ -4,9 +4,14 @@ class ConsensusManager:
     Servicio que aplica las reglas de consenso y gestiona la Blockchain.
 
     *** CORRECCIÓN: Usa Config.DIFFICULTY_ADJUSTMENT_INTERVAL en lugar de la constante eliminada. ***
+
+    'prevalidated=True' indica que las reglas sin estado (PoW, integridad y firmas) ya se verificaron
+    en el pool de validación (StatelessValidator); aquí solo se aplican las reglas de contexto.
+    Un huérfano guarda esa marca junto al bloque (_OrphanEntry): se descarta con él.
 '''
 
 import logging
+from dataclasses import dataclass
 from typing import Dict, Any, List, Optional, TYPE_CHECKING
 from Crypto.PublicKey.ECC import EccKey
 
@@ -14,7 +19,7 @@ from Crypto.PublicKey.ECC import EccKey
 from core.models.blockchain import Blockchain
 from core.models.block import Block
 from core.validators.block_validator import BlockValidator
-from core.validators.transaction_verifier import TransactionVerifier
+from core.validators.batch_signature_verifier import BatchSignatureVerifier
 from core.consensus.difficulty_adjuster import DifficultyAdjuster
 
 # --- IMPORTACIÓN CLAVE ---
@@ -25,26 +30,31 @@ if TYPE_CHECKING:
 else:
     EccKeyType = EccKey
 
+@dataclass(frozen = True, slots = True)
+class _OrphanEntry:
+    block: Block
+    prevalidated: bool
+
 class ConsensusManager:
 
     def __init__(self, blockchain: Blockchain):
         self._blockchain = blockchain
-        self._orphan_blocks: Dict[str, List[Block]] = {}
+        self._orphan_blocks: Dict[str, List[_OrphanEntry]] = {}
         self._side_blocks: Dict[str, Block] = {} 
 
-    def add_block(self, new_block: Block, public_key_map: Dict[str, EccKeyType]) -> bool:
+    def add_block(self, new_block: Block, public_key_map: Dict[str, EccKeyType], prevalidated: bool = False) -> bool:
         
         last_block: Block | None = self._blockchain.last_block
         
-        # 1. Validación Estructural
-        if not BlockValidator.verify(new_block):
+        # 1. Validación Estructural (omitida si ya se hizo en el pool de validación)
+        if not prevalidated and not BlockValidator.verify(new_block):
             logging.warning(f'Error Consenso: Bloque {new_block.index} inválido (PoW o Integridad).')
             return False
 
         # 2. Lógica de Posicionamiento
         # CASO A: Extensión Normal
         if last_block and new_block.previous_hash == last_block.hash:
-            if self._validate_context(new_block, last_block, public_key_map):
+            if self._validate_context(new_block, last_block, public_key_map, prevalidated):
                 self._blockchain.add_block_forced(new_block)
                 self._process_orphans(new_block.hash, public_key_map)
                 return True
@@ -59,13 +69,13 @@ class ConsensusManager:
         parent_block = self._find_block_by_hash(new_block.previous_hash)
         if parent_block:
             logging.info(f"Consenso: Detectada rama lateral (Fork) en bloque {new_block.index}.")
-            return self._handle_fork(new_block, parent_block, public_key_map)
+            return self._handle_fork(new_block, parent_block, public_key_map, prevalidated)
         
         # CASO D: Huérfano
-        self._add_orphan(new_block)
+        self._add_orphan(new_block, prevalidated)
         return False
 
-    def _validate_context(self, block: Block, previous_block: Block, public_key_map: Dict[str, EccKeyType]) -> bool:
+    def _validate_context(self, block: Block, previous_block: Block, public_key_map: Dict[str, EccKeyType], prevalidated: bool = False) -> bool:
         '''Valida reglas que dependen del bloque anterior.'''
         
         # 1. Índice
@@ -87,20 +97,19 @@ class ConsensusManager:
                     logging.warning(f"Dificultad incorrecta. Esperada: {expected_bits}")
                     return False
 
-        # 3. Firmas
-        for tx in block.data:
-            if tx.signature is None or not tx.entries: continue
-            data_owner_id = tx.entries[0].source_id
-            public_key = public_key_map.get(data_owner_id)
-            if public_key:
-                if not TransactionVerifier.verify(public_key, tx.tx_hash, tx.signature):
-                    logging.warning(f"Firma inválida en TX {tx.tx_hash}")
-                    return False
+        # 3. Firmas (ya verificadas si el bloque viene del pool de validación)
+        if prevalidated:
+            return True
+
+        signatures = BatchSignatureVerifier.verify_block_signatures(block, public_key_map)
+        if signatures.first_failure is not None:
+            logging.warning(f"Firma inválida en TX {block.data[signatures.first_failure].tx_hash}")
+            return False
         
         return True
 
-    def _handle_fork(self, new_block: Block, parent_block: Block, public_key_map: Dict[str, EccKeyType]) -> bool:
-        if not self._validate_context(new_block, parent_block, public_key_map):
+    def _handle_fork(self, new_block: Block, parent_block: Block, public_key_map: Dict[str, EccKeyType], prevalidated: bool = False) -> bool:
+        if not self._validate_context(new_block, parent_block, public_key_map, prevalidated):
             return False
 
         self._side_blocks[new_block.hash] = new_block
@@ -155,15 +164,15 @@ class ConsensusManager:
             if b.hash == block_hash: return True
         return False
 
-    def _add_orphan(self, block: Block):
+    def _add_orphan(self, block: Block, prevalidated: bool = False):
         parent_hash = block.previous_hash or "None"
         if parent_hash not in self._orphan_blocks:
             self._orphan_blocks[parent_hash] = []
-        self._orphan_blocks[parent_hash].append(block)
+        self._orphan_blocks[parent_hash].append(_OrphanEntry(block = block, prevalidated = prevalidated))
 
     def _process_orphans(self, parent_hash: str, public_key_map: Dict[str, EccKeyType]):
         if parent_hash in self._orphan_blocks:
             orphans = self._orphan_blocks[parent_hash]
             del self._orphan_blocks[parent_hash]
             for orphan in orphans:
-                self.add_block(orphan, public_key_map)
\ No newline at end of file
+                self.add_block(orphan.block, public_key_map, orphan.prevalidated)
\ No newline at end of file
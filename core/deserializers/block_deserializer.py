@@ -2,6 +2,8 @@
 '''
 class BlockDeserializer:
     Lógica pura para deserializar un dict a un Block.
+    Es CPU (re-hashea las TXs, el Merkle Root y la cabecera): con datos de la red se ejecuta fuera del event loop
+    (IBlockValidatorRole.run_in_validation_pool desde el gossip y el reensamblado de bloques fragmentados o compactos).
 
     Methods:
         from_dict(data: dict) -> Block: Reconstruye un Block desde un diccionario.
@@ -13,8 +15,12 @@ class BlockDeserializer:
             6. Ensamblar el DTO (BlockHashingData) para recalcular el hash del bloque.
             7. Llamar al Hasher para recalcular el hash del bloque.
             8. Verificar la integridad del Hash.
-            9. Construir el objeto Block final.
+            9. Construir el objeto Block final (marcado 'integrity_verified' si todas sus TXs lo están).
             10. Retornar el objeto reconstruido.
+
+        from_header_and_transactions(header: dict, transactions: List[Transaction]) -> Block:
+            Reconstruye un Block a partir de su cabecera (dict) y de transacciones YA deserializadas
+            (ej. reensambladas desde fragmentos 'blockchunk'). Ejecuta los pasos 2 a 10.
 '''
 
 from typing import Any, List, Dict
@@ -38,14 +44,24 @@ class BlockDeserializer:
                 for tx_data in data['data']
             ]
 
-            index: int = int(data['index'])
-            timestamp: int = int(data['timestamp'])
-            previous_hash: str | None = data.get('previous_hash')
-            bits: str = data['bits']
-            merkle_root_stored: str = data['merkle_root']
-            nonce: int = int(data['nonce'])
-            block_hash_stored: str = data['hash']
-            mining_time: float | None = data.get('mining_time')
+        except (KeyError, ValueError, TypeError) as e:
+            # Captura errores de formato (ej. falta 'data') o fallos de verificación
+            raise ValueError(f'Dato corrupto o malformado en Block JSON ({e})')
+
+        return BlockDeserializer.from_header_and_transactions(data, transactions)
+
+    @staticmethod
+    def from_header_and_transactions(header: Dict[str, Any], transactions: List[Transaction]) -> Block:
+
+        try:
+            index: int = int(header['index'])
+            timestamp: int = int(header['timestamp'])
+            previous_hash: str | None = header.get('previous_hash')
+            bits: str = header['bits']
+            merkle_root_stored: str = header['merkle_root']
+            nonce: int = int(header['nonce'])
+            block_hash_stored: str = header['hash']
+            mining_time: float | None = header.get('mining_time')
 
             tx_hashes: List[str] = [tx.tx_hash for tx in transactions]
 
@@ -83,6 +99,8 @@ class BlockDeserializer:
                 hash = block_hash_stored,
                 mining_time = mining_time
             )
+            if all(tx.integrity_verified for tx in transactions):
+                object.__setattr__(reconstructed_block, 'integrity_verified', True)
 
             return reconstructed_block
 
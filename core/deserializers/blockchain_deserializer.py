@@ -10,7 +10,8 @@ class BlockchainDeserializer:
             3. Iterar sobre la lista de diccionarios.
             4. Deserializar cada bloque.
             5. Añadir el bloque reconstruido a la cadena.
-            6. Retornar el objeto Blockchain reconstruido.
+            6. Adoptar el índice de TXs guardado si corresponde a la punta cargada (si no, se reconstruye).
+            7. Retornar el objeto Blockchain reconstruido.
 '''
 
 from typing import Any, List, Dict
@@ -19,6 +20,7 @@ from typing import Any, List, Dict
 from core.models.blockchain import Blockchain
 from core.models.block import Block
 from core.deserializers.block_deserializer import BlockDeserializer
+from core.deserializers.tx_index_deserializer import TxIndexDeserializer
 
 class BlockchainDeserializer:
 
@@ -29,10 +31,14 @@ class BlockchainDeserializer:
             new_blockchain = Blockchain()
 
             blocks_data_list: List[Dict[str, Any]] = data['chain']
+            blocks: List[Block] = []
 
             for block_data in blocks_data_list:
                 reconstructed_block: Block = BlockDeserializer.from_dict(block_data)
-                new_blockchain.add_block_forced(reconstructed_block)
+                blocks.append(reconstructed_block)
+
+            tip_hash = blocks[-1].hash if blocks else None
+            new_blockchain.restore(blocks, TxIndexDeserializer.from_dict(data.get('tx_index'), tip_hash))
             
             return new_blockchain
 
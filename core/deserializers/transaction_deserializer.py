@@ -2,6 +2,8 @@
 '''
 class TransactionDeserializer:
     Contiene la lógica pura para deserializar un dict a una Transaction.
+    Es CPU (re-hashea cada DataEntry y la TX): con datos de la red se ejecuta fuera del event loop
+    (IBlockValidatorRole.run_in_validation_pool desde el gossip, 'asyncio.to_thread' en la ingesta).
 
     Methods:
         from_dict(data: dict) -> Transaction: Reconstruye una Transaction desde un diccionario.
@@ -10,7 +12,7 @@ class TransactionDeserializer:
             3. Ensamblar el DTO (TransactionHashingData) para recalcular el hash.
             4. Llamar al Hasher para recalcular el hash.
             5. Verificar la integridad (hash almacenado vs. hash recalculado).
-            6. Construir el objeto final
+            6. Construir el objeto final y marcarlo como 'integrity_verified' (el validador no repetirá el hasheo).
             7. Retornar el objeto reconstruido  
 '''
 
@@ -54,6 +56,7 @@ class TransactionDeserializer:
                 signature = signature,
                 tx_hash = tx_hash_stored
             )
+            object.__setattr__(reconstructed_Transaction, 'integrity_verified', True)
   
             return reconstructed_Transaction
 
@@ -0,0 +1,39 @@
+# network_of_interactive_nodes/core/deserializers/tx_index_deserializer.py
+'''
+class TxIndexDeserializer:
+    Contiene la lógica pura para deserializar un dict a un TxIndex.
+
+    Methods:
+        from_dict(data: dict, tip_hash: Optional[str]) -> Optional[TxIndex]:
+            1. Verificar que el índice guardado corresponde a la punta de la cadena cargada.
+            2. Si no corresponde (o falta), retornar None (el llamador lo reconstruye desde la cadena).
+            3. Reconstruir cada entrada tx_hash -> TxLocation (y las ubicaciones apiladas; opcionales en índices antiguos).
+            4. Retornar el TxIndex.
+'''
+
+from typing import Any, Dict, List, Optional
+
+# Importaciones de la arquitectura
+from core.models.tx_index import TxIndex
+from core.dto.tx_location import TxLocation
+
+class TxIndexDeserializer:
+
+    @staticmethod
+    def from_dict(data: Optional[Dict[str, Any]], tip_hash: Optional[str]) -> Optional[TxIndex]:
+        if not data or data.get('tip_hash') != tip_hash:
+            return None
+
+        try:
+            entries: Dict[str, TxLocation] = {
+                tx_hash: TxLocation(height = int(height), position = int(position))
+                for tx_hash, (height, position) in data['entries'].items()
+            }
+            shadowed: Dict[str, List[TxLocation]] = {
+                tx_hash: [TxLocation(height = int(height), position = int(position)) for height, position in stack]
+                for tx_hash, stack in data.get('shadowed', {}).items()
+            }
+            return TxIndex(entries, shadowed)
+
+        except (KeyError, ValueError, TypeError):
+            return None
\ No newline at end of file
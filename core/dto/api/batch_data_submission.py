@@ -0,0 +1,17 @@
+# network_of_interactive_nodes/core/dto/api/batch_data_submission.py
+'''
+class BatchDataSubmission(BaseModel):
+    Define la estructura JSON esperada por la API para recibir en una sola petición
+    un lote de lecturas (ej. un concentrador que sube sus muestras acumuladas).
+
+    Attributes:
+        submissions (List[DataSubmission]): Las lecturas, cada una con el mismo formato que '/submit_data'.
+'''
+
+from pydantic import BaseModel
+from typing import List
+
+from core.dto.api.data_submission import DataSubmission
+
+class BatchDataSubmission(BaseModel):
+    submissions: List[DataSubmission]
\ No newline at end of file
@@ -0,0 +1,13 @@
+# network_of_interactive_nodes/core/dto/api/key_registration.py
+'''
+class KeyRegistration(BaseModel):
+    Define la estructura JSON esperada por la API para registrar en caliente la clave pública de un dispositivo.
+
+    Attributes:
+        public_key_pem (str): Clave pública del dispositivo en formato PEM (nunca la clave privada).
+'''
+
+from pydantic import BaseModel
+
+class KeyRegistration(BaseModel):
+    public_key_pem: str
\ No newline at end of file
@@ -0,0 +1,15 @@
+# network_of_interactive_nodes/core/dto/api/signed_batch_submission.py
+'''
+class SignedBatchSubmission(BaseModel):
+    Define la estructura JSON esperada por la API para retransmitir en una sola petición
+    un lote de transacciones ya firmadas por los dispositivos.
+
+    Attributes:
+        transactions (List[Dict]): Las transacciones serializadas (mismo formato que 'tx_data' en '/submit_signed_tx').
+'''
+
+from pydantic import BaseModel
+from typing import List, Dict, Any
+
+class SignedBatchSubmission(BaseModel):
+    transactions: List[Dict[str, Any]]
\ No newline at end of file
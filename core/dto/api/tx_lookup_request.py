@@ -0,0 +1,15 @@
+# network_of_interactive_nodes/core/dto/api/tx_lookup_request.py
+'''
+class TxLookupRequest(BaseModel):
+    Define la estructura JSON esperada por la API para consultar en una sola petición
+    el estado de muchas transacciones (clientes que sondean varias lecturas a la vez).
+
+    Attributes:
+        tx_hashes (List[str]): Hashes de las transacciones a consultar.
+'''
+
+from pydantic import BaseModel
+from typing import List
+
+class TxLookupRequest(BaseModel):
+    tx_hashes: List[str]
\ No newline at end of file
@@ -0,0 +1,25 @@
+# network_of_interactive_nodes/core/dto/batch_verification_result.py
+'''
+class BatchVerificationResult:
+    Resultado de verificar un lote de firmas (BatchSignatureVerifier).
+
+    Attributes:
+        results         (List[Optional[bool]]): Resultado por firma, en el orden del lote.
+                                                None = no verificada (se detuvo antes por un fallo).
+        first_failure   (Optional[int]):        Posición de la primera firma inválida encontrada (None si todas son válidas).
+
+    Properties:
+        all_valid       (bool):                 True si todas las firmas del lote son válidas.
+'''
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+@dataclass(frozen = True, slots = True)
+class BatchVerificationResult:
+    results: List[Optional[bool]]
+    first_failure: Optional[int]
+
+    @property
+    def all_valid(self) -> bool:
+        return self.first_failure is None
\ No newline at end of file
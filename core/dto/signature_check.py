@@ -0,0 +1,19 @@
+# network_of_interactive_nodes/core/dto/signature_check.py
+'''
+class SignatureCheck:
+    Agrupa los datos de UNA verificación de firma dentro de un lote (BatchSignatureVerifier).
+
+    Attributes:
+        public_key      (EccKey):   Clave pública del dueño de la transacción.
+        tx_hash         (str):      Hash de la transacción (mensaje firmado).
+        signature       (str):      Firma ECDSA en hexadecimal.
+'''
+
+from dataclasses import dataclass
+from Crypto.PublicKey.ECC import EccKey
+
+@dataclass(frozen = True, slots = True)
+class SignatureCheck:
+    public_key: EccKey
+    tx_hash: str
+    signature: str
\ No newline at end of file
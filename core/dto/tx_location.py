@@ -0,0 +1,16 @@
+# network_of_interactive_nodes/core/dto/tx_location.py
+'''
+class TxLocation:
+    Ubicación de una transacción confirmada dentro de la cadena principal (TxIndex).
+
+    Attributes:
+        height      (int):  Altura (índice) del bloque que la contiene.
+        position    (int):  Posición de la TX dentro de 'block.data'.
+'''
+
+from dataclasses import dataclass
+
+@dataclass(frozen = True, slots = True)
+class TxLocation:
+    height: int
+    position: int
\ No newline at end of file
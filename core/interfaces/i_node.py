@@ -23,6 +23,12 @@ class INode(ABC):
         initiate_handshake(self, peer: Peer) -> None:   Inicia el protocolo de "apretón de manos" (handshake) con un par recién conectado.
             1. Enviar el mensaje 'VERSION' o 'HELLO' al nuevo par.
             2. Registrar el estado del par como 'HANDSHAKE_PENDING'.   
+
+        handle_peer_disconnected(self, peer_id: str) -> None: Libera lo que el nodo guardaba para un par que se desconectó
+            (ej. bloques a medio reensamblar). Por defecto no hace nada.
+
+        run_maintenance(self) -> None: Mantenimiento periódico (lo invoca el transporte en su revisión de conexiones):
+            descarta lo que venció sin que llegue tráfico nuevo. Por defecto no hace nada.
 '''
 
 from abc import ABC, abstractmethod
@@ -45,4 +51,10 @@ class INode(ABC):
 
     @abstractmethod
     def initiate_handshake(self, peer: Peer) -> None:
+        pass
+
+    def handle_peer_disconnected(self, peer_id: str) -> None:
+        pass
+
+    def run_maintenance(self) -> None:
         pass
\ No newline at end of file
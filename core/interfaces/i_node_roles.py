@@ -17,6 +17,30 @@ Define las Interfaces (Contratos) para los "roles" especializados que un nodo pu
                 2. Validar la firma digital de la TX.
                 3. Retornar True si todas las reglas pasan.
 
+            validate_block_rules_async(self, block) / validate_tx_rules_async(self, tx) -> bool:
+                Versiones para el event loop. Por defecto delegan en las síncronas;
+                un validador completo las sobreescribe para no bloquear el loop (pool de validación).
+
+            validate_txs_rules_async(self, txs) -> List[bool]: Valida un lote de TXs independientes (resultado por TX).
+                Por defecto valida una a una; un validador completo valida el lote en conjunto.
+
+            has_recent_tx(self, tx_hash) -> bool: True si la TX se confirmó recientemente
+                (el gossip no la vuelve a pedir). Por defecto False.
+
+            has_recent_rejection(self, tx) -> bool: True si esta misma TX (hash y firma) se rechazó recientemente
+                (el gossip no la vuelve a validar). El 'tx_hash' no cubre la firma: una copia con la firma
+                alterada no debe bloquear a la original. Por defecto False.
+
+            is_known_invalid_block(self, block) -> bool / is_known_invalid_tx(self, tx) -> bool: True si ESTA copia
+                falló recientemente la validación sin estado por culpa de su contenido (PoW, firma): quien la envía se porta mal.
+                Se consulta con el objeto y no con el hash: el hash no cubre las firmas, y una copia con una firma
+                alterada no debe marcar a la original. Un rechazo que puede ser honesto (ej. firmante aún sin clave
+                registrada, timestamp 'futuro' para nuestro reloj) no cuenta. Por defecto False.
+
+            run_in_validation_pool(self, func, *args) -> T: Ejecuta trabajo de CPU sin estado (ej. deserializar y
+                re-hashear un bloque o TX recibidos) fuera del event loop. Por defecto en un hilo ('asyncio.to_thread');
+                un validador completo usa su pool de validación.
+
     class IMinerRole(ABC):
         Define el rol de un minero (construir bloques).
 
@@ -49,14 +73,17 @@ Define las Interfaces (Contratos) para los "roles" especializados que un nodo pu
                 1. Detener el servidor (ej. Waitress).
 '''
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, Callable, List, TypeVar
 
 # Importaciones de la arquitectura
 from core.models.block import Block
 from core.models.transaction import Transaction
 from core.models.data_entry import DataEntry
 
+T = TypeVar('T')
+
 class IBlockValidatorRole(ABC):
     @abstractmethod
     def validate_block_rules(self, block: Block) -> bool:
@@ -66,6 +93,30 @@ class IBlockValidatorRole(ABC):
     def validate_tx_rules(self, tx: Transaction) -> bool:
         pass
 
+    async def validate_block_rules_async(self, block: Block) -> bool:
+        return self.validate_block_rules(block)
+
+    async def validate_tx_rules_async(self, tx: Transaction) -> bool:
+        return self.validate_tx_rules(tx)
+
+    async def validate_txs_rules_async(self, txs: List[Transaction]) -> List[bool]:
+        return [self.validate_tx_rules(tx) for tx in txs]
+
+    def has_recent_tx(self, tx_hash: str) -> bool:
+        return False
+
+    def has_recent_rejection(self, tx: Transaction) -> bool:
+        return False
+
+    def is_known_invalid_block(self, block: Block) -> bool:
+        return False
+
+    def is_known_invalid_tx(self, tx: Transaction) -> bool:
+        return False
+
+    async def run_in_validation_pool(self, func: Callable[..., T], *args: Any) -> T:
+        return await asyncio.to_thread(func, *args)
+
 class IWalletRole(ABC):
     @abstractmethod
     def create_and_sign_data(self, entries: List[DataEntry]) -> Transaction:
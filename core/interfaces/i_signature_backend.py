@@ -0,0 +1,36 @@
+# core/interfaces/i_signature_backend.py
+'''
+class ISignatureBackend(ABC):
+    Define el contrato de un motor de verificación ECDSA (P-256) intercambiable para TransactionVerifier.
+
+    Cada motor trabaja con un "contexto" por clave pública, construido UNA vez y reutilizado
+    para todas las firmas del mismo dueño (ej. verificador ligado a la clave, tablas de puntos precalculadas).
+
+    Attributes:
+        name (str): Nombre del motor (para configuración y métricas).
+
+    Methods:
+        is_available() -> bool: Indica si las dependencias del motor están instaladas.
+        prepare(public_key: EccKey) -> Any: Construye el contexto de verificación de una clave.
+        verify(context: Any, message: bytes, signature: bytes) -> bool: Verifica una firma (r||s) sobre SHA-256(message).
+'''
+
+from abc import ABC, abstractmethod
+from typing import Any
+from Crypto.PublicKey.ECC import EccKey
+
+class ISignatureBackend(ABC):
+
+    name: str = 'abstract'
+
+    @abstractmethod
+    def is_available(self) -> bool:
+        pass
+
+    @abstractmethod
+    def prepare(self, public_key: EccKey) -> Any:
+        pass
+
+    @abstractmethod
+    def verify(self, context: Any, message: bytes, signature: bytes) -> bool:
+        pass
\ No newline at end of file
@@ -0,0 +1,178 @@
+# network_of_interactive_nodes/core/managers/aggregation_manager.py
+'''
+class AggregationManager:
+    Gestor (Capa 2) del Gateway que agrupa las lecturas delegadas de muchos sensores
+    en UNA transacción multi-entry firmada por el Gateway.
+
+    Antes: una firma ECDSA, un espacio en la Mempool y un 'inv' por lectura.
+    Ahora: una ventana de agregación acotada por tiempo, número de entries y bytes;
+    al cerrarse, todas sus entries viajan en una sola TX (costos de firma y difusión divididos por N).
+
+    Cada lectura recibe un 'receipt_id' que se resuelve al tx_hash final (get_receipt).
+
+    Attributes:
+        _wallet_manager     (WalletManager):                Firma la TX agregada (identidad del Gateway).
+        _full_node          (FullNode):                     Validación (ValidationManager) y difusión (P2PManager).
+        _max_wait_sec       (float):                        Tiempo máximo que una lectura espera en la ventana.
+        _max_entries        (int):                          Entries máximas por TX agregada.
+        _max_bytes          (int):                          Bytes de datos máximos por TX agregada (TransactionUtils).
+        _window             (List[_WindowItem]):            Lecturas de la ventana abierta.
+        _window_bytes       (int):                          Bytes acumulados en la ventana abierta.
+        _timer_task         (asyncio.Task):                 Cierre por tiempo de la ventana abierta.
+        _flush_tasks        (Set[asyncio.Task]):            Ventanas cerradas en proceso (firma, validación, difusión).
+        _receipts           (OrderedDict[str, _Receipt]):   Recibos recientes (acotado por Config.AGGREGATION_RECEIPT_CACHE_SIZE).
+
+    Methods:
+        submit(entry, receipt_id) -> str: Añade una lectura delegada a la ventana. Retorna su 'receipt_id'
+            (se genera uno nuevo si no se indica; el IngestionManager reutiliza su ID de seguimiento).
+            1. Si la entry no cabe en la ventana (bytes), cerrar la ventana actual primero.
+            2. Registrar el recibo ('pending') y añadir la entry.
+            3. Cerrar la ventana si alcanzó el límite de entries o bytes; si no, armar el cierre por tiempo.
+
+        get_receipt(receipt_id) -> Optional[Dict]: Estado del recibo ('pending', 'accepted' + tx_hash, 'rejected' + error).
+
+        stop(): Cierra la ventana abierta y espera a que se procesen todas las ventanas pendientes.
+
+        _flush_window(items): Procesa una ventana cerrada.
+            1. Firmar UNA TX con todas las entries (fuera del event loop).
+            2. Validar la TX (ValidationManager, pool de validación).
+            3. Si es aceptada, difundirla y resolver los recibos con su tx_hash; si no, marcarlos 'rejected'.
+'''
+
+import uuid
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set
+
+# Importaciones de la arquitectura
+from core.models.data_entry import DataEntry
+from core.models.transaction import Transaction
+from core.managers.wallet_manager import WalletManager
+from core.nodes.full_node import FullNode
+from core.utils.transaction_utils import TransactionUtils
+
+# Importacion de la configuracion
+from config import Config
+
+@dataclass(slots = True)
+class _WindowItem:
+    receipt_id: str
+    entry: DataEntry
+
+@dataclass(slots = True)
+class _Receipt:
+    status: str                         # 'pending' | 'accepted' | 'rejected'
+    tx_hash: Optional[str] = None
+    entry_index: Optional[int] = None   # Posición de la lectura dentro de la TX agregada
+    error: Optional[str] = None
+
+class AggregationManager:
+
+    def __init__(self,
+                 wallet_manager: WalletManager,
+                 full_node: FullNode,
+                 max_wait_sec: float = Config.AGGREGATION_MAX_WAIT_SEC,
+                 max_entries: int = Config.AGGREGATION_MAX_ENTRIES,
+                 max_bytes: int = Config.AGGREGATION_MAX_BYTES):
+        self._wallet_manager = wallet_manager
+        self._full_node = full_node
+        self._max_wait_sec = max_wait_sec
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+
+        self._window: List[_WindowItem] = []
+        self._window_bytes: int = 0
+        self._timer_task: Optional[asyncio.Task[None]] = None
+        self._flush_tasks: Set[asyncio.Task[None]] = set()
+        self._receipts: 'OrderedDict[str, _Receipt]' = OrderedDict()
+        logging.info(f'Aggregation Manager listo. Ventana: {max_wait_sec}s / {max_entries} entries / {max_bytes} bytes.')
+
+    # --- API Pública ---
+
+    async def submit(self, entry: DataEntry, receipt_id: Optional[str] = None) -> str:
+        entry_bytes = TransactionUtils.calculate_data_size([entry])
+
+        # 1. Si no cabe, cerrar primero la ventana actual (una entry sola siempre se acepta).
+        if self._window and self._window_bytes + entry_bytes > self._max_bytes:
+            self._close_window()
+
+        # 2. Registrar recibo y añadir a la ventana.
+        receipt_id = receipt_id or uuid.uuid4().hex
+        self._remember(receipt_id, _Receipt(status = 'pending'))
+        self._window.append(_WindowItem(receipt_id = receipt_id, entry = entry))
+        self._window_bytes += entry_bytes
+
+        # 3. Cierre por límite o por tiempo.
+        if len(self._window) >= self._max_entries or self._window_bytes >= self._max_bytes:
+            self._close_window()
+        elif self._timer_task is None:
+            self._timer_task = asyncio.create_task(self._close_after_timeout())
+
+        return receipt_id
+
+    def get_receipt(self, receipt_id: str) -> Optional[Dict[str, Any]]:
+        receipt = self._receipts.get(receipt_id)
+        if receipt is None: return None
+        return {
+            'receipt_id': receipt_id,
+            'status': receipt.status,
+            'tx_hash': receipt.tx_hash,
+            'entry_index': receipt.entry_index,
+            'error': receipt.error
+        }
+
+    async def stop(self) -> None:
+        self._close_window()
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions = True)
+
+    # --- Helpers ---
+
+    def _close_window(self) -> None:
+        if self._timer_task is not None:
+            if self._timer_task is not asyncio.current_task(): self._timer_task.cancel()
+            self._timer_task = None
+
+        if not self._window: return
+        items, self._window, self._window_bytes = self._window, [], 0
+
+        task = asyncio.create_task(self._flush_window(items))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _close_after_timeout(self) -> None:
+        await asyncio.sleep(self._max_wait_sec)
+        self._close_window()
+
+    async def _flush_window(self, items: List[_WindowItem]) -> None:
+        entries = [item.entry for item in items]
+        try:
+            # 1. Una sola firma para toda la ventana (CPU: fuera del event loop).
+            signed_tx: Transaction = await asyncio.to_thread(self._wallet_manager.create_and_sign_data, entries)
+
+            # 2. Validación (pool de validación + commit ordenado).
+            if not await self._full_node.get_validation_manager().validate_tx_rules_async(signed_tx):
+                raise ValueError('Fallo de validación interna.')
+
+            # 3. Difusión y resolución de recibos.
+            self._full_node.get_p2p_manager().broadcast_new_tx(signed_tx)
+            for position, item in enumerate(items):
+                self._resolve(item.receipt_id, _Receipt(status = 'accepted', tx_hash = signed_tx.tx_hash, entry_index = position))
+            logging.info(f'Agregación: {len(items)} lecturas enviadas en la TX {signed_tx.tx_hash[:6]}.')
+
+        except Exception as e:
+            logging.error(f'Agregación: Ventana de {len(items)} lecturas rechazada. {e}')
+            for item in items:
+                self._resolve(item.receipt_id, _Receipt(status = 'rejected', error = str(e)))
+
+    def _resolve(self, receipt_id: str, receipt: _Receipt) -> None:
+        # Si el recibo ya fue desalojado de la caché, no se vuelve a insertar.
+        if receipt_id in self._receipts:
+            self._receipts[receipt_id] = receipt
+
+    def _remember(self, receipt_id: str, receipt: _Receipt) -> None:
+        self._receipts[receipt_id] = receipt
+        while len(self._receipts) > Config.AGGREGATION_RECEIPT_CACHE_SIZE:
+            self._receipts.popitem(last = False)
\ No newline at end of file
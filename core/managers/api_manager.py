@@ -1,28 +1,38 @@
+import hmac
 import logging
 import asyncio
-import base64 
 import uvicorn 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException
 from typing import Dict, Any, List, Optional
 from core.interfaces.i_node_roles import IAPIRole
 from core.managers.wallet_manager import WalletManager
 from core.nodes.full_node import FullNode
 from core.dto.api.data_submission import DataSubmission
-from core.dto.data_entry_creation_params import DataEntryCreationParams
-from core.factories.data_entry_factory import DataEntryFactory
-from core.deserializers.transaction_deserializer import TransactionDeserializer
+from core.dto.api.key_registration import KeyRegistration
+from core.dto.api.batch_data_submission import BatchDataSubmission
+from core.dto.api.signed_batch_submission import SignedBatchSubmission
+from core.dto.api.tx_lookup_request import TxLookupRequest
 from core.managers.mining_manager import MiningManager
+from core.managers.aggregation_manager import AggregationManager
+from core.managers.ingestion_manager import IngestionManager
+from core.p2p.token_bucket import TokenBucket
+from identity.address_factory import AddressFactory
+from Crypto.PublicKey import ECC
+from config import Config
 
 class APIManager(IAPIRole):
 
-    def __init__(self, wallet_manager: WalletManager, full_node: FullNode, api_host: str = "0.0.0.0", api_port: int = 8000, mining_manager: Optional[MiningManager] = None):
+    def __init__(self, wallet_manager: WalletManager, full_node: FullNode, api_host: str = "0.0.0.0", api_port: int = 8000, mining_manager: Optional[MiningManager] = None, aggregation_manager: Optional[AggregationManager] = None, ingestion_manager: Optional[IngestionManager] = None):
         self._wallet_manager = wallet_manager
         self._full_node = full_node
         self._mining_manager = mining_manager
+        self._aggregation_manager = aggregation_manager or AggregationManager(wallet_manager, full_node)
+        self._ingestion_manager = ingestion_manager or IngestionManager(full_node, self._aggregation_manager, wallet_manager.get_address())
         self._api_host = api_host
         self._api_port = api_port
         self._app = FastAPI(title="Blockchain Gateway Node")
         self._server_task: asyncio.Task[None] | None = None 
+        self._key_registration_bucket = TokenBucket(Config.API_KEY_REGISTRATION_RATE, Config.API_KEY_REGISTRATION_BURST)
         self._setup_api_routes()
         logging.info(f'API Manager listo en http://{api_host}:{api_port}')
 
@@ -38,16 +48,26 @@ class APIManager(IAPIRole):
             self._server_task.cancel()
 
     def _setup_api_routes(self):
-        self._app.post('/submit_data')(self.handle_submit_data)
-        self._app.post('/submit_signed_tx')(self.handle_submit_signed_tx)
+        # Las consultas son 'async def': FastAPI ejecuta las 'def' en un pool de hilos, y estas leen estado
+        # que solo modifica el event loop (cadena, Mempool, pares, recibos, métricas).
+        # Admisión: 202 + ID de seguimiento (la validación ocurre en el IngestionManager), 429 si la cola está llena
+        self._app.post('/submit_data', status_code=202)(self.handle_submit_data)
+        self._app.post('/submit_signed_tx', status_code=202)(self.handle_submit_signed_tx)
+        self._app.post('/submit_batch', status_code=202)(self.handle_submit_batch)
+        self._app.post('/submit_signed_batch', status_code=202)(self.handle_submit_signed_batch)
         self._app.get('/health')(self._get_health_status)
         self._app.get('/api/chain')(self._get_chain_data)
         self._app.get('/api/mempool')(self._get_mempool_data)
         self._app.get('/api/peers')(self._get_peers_data)
+        self._app.get('/api/metrics')(self._get_metrics_data)
+        self._app.get('/api/receipts/{receipt_id}')(self._get_receipt_data)
+        self._app.get('/api/tx/{tx_hash}')(self._get_tx_status)
+        self._app.post('/api/tx/lookup')(self._lookup_tx_statuses)
+        self._app.post('/api/keys/register')(self.handle_register_key)
         self._app.post('/api/control/mining/start')(self._start_mining_cmd)
         self._app.post('/api/control/mining/stop')(self._stop_mining_cmd)
 
-    def _get_health_status(self) -> Dict[str, Any]:
+    async def _get_health_status(self) -> Dict[str, Any]:
         blockchain = self._full_node.get_blockchain()
         mempool = self._full_node.get_mempool()
         is_mining = False
@@ -55,38 +75,54 @@ class APIManager(IAPIRole):
         return {"status": "online", "role": "MINER" if is_mining else "GATEWAY", "height": blockchain.last_block.index if blockchain.last_block else 0, "mempool_size": mempool.get_transaction_count(), "address": self._wallet_manager.get_address()}
 
     async def handle_submit_data(self, submission: DataSubmission) -> Dict[str, Any]:
-        try:
-            value_bytes = base64.b64decode(submission.value) 
-            signer_addr = self._wallet_manager.get_address()
-            meta = submission.metadata if submission.metadata else {}
-            meta['original_sensor'] = submission.source_id
-            creation_params = DataEntryCreationParams(source_id=signer_addr, data_type="IOT_DELEGATED", value=value_bytes, nonce=submission.nonce, metadata=meta)
-            entry = DataEntryFactory.create(params=creation_params)
-            signed_tx = self._wallet_manager.create_and_sign_data([entry])
-            validation_manager = self._full_node.get_validation_manager()
-            if validation_manager.validate_tx_rules(signed_tx):
-                p2p = self._full_node.get_p2p_manager()
-                if asyncio.iscoroutinefunction(p2p.broadcast_new_tx): await p2p.broadcast_new_tx(signed_tx)
-                else: p2p.broadcast_new_tx(signed_tx)
-                return {'status': 'broadcasted', 'tx_hash': signed_tx.tx_hash}
-            raise ValueError("Fallo de validación interna.")
-        except Exception as e: raise HTTPException(status_code=400, detail=str(e))
+        tracking_ids = self._admit_or_throttle(self._ingestion_manager.admit_data([submission]))
+        return {'status': 'queued', 'receipt_id': tracking_ids[0]}
 
     async def handle_submit_signed_tx(self, submission: Dict[str, Any]) -> Dict[str, Any]:
+        tx_data = submission.get('tx_data')
+        if not isinstance(tx_data, dict): raise HTTPException(status_code=400, detail="Falta 'tx_data'.")
+        tracking_ids = self._admit_or_throttle(self._ingestion_manager.admit_signed([tx_data]))
+        return {'status': 'queued', 'receipt_id': tracking_ids[0]}
+
+    async def handle_submit_batch(self, batch: BatchDataSubmission) -> Dict[str, Any]:
+        self._check_batch_size(len(batch.submissions))
+        tracking_ids = self._admit_or_throttle(self._ingestion_manager.admit_data(batch.submissions))
+        return {'queued': len(tracking_ids), 'results': [{'index': i, 'status': 'queued', 'receipt_id': t} for i, t in enumerate(tracking_ids)]}
+
+    async def handle_submit_signed_batch(self, batch: SignedBatchSubmission) -> Dict[str, Any]:
+        self._check_batch_size(len(batch.transactions))
+        tracking_ids = self._admit_or_throttle(self._ingestion_manager.admit_signed(batch.transactions))
+        return {'queued': len(tracking_ids), 'results': [{'index': i, 'status': 'queued', 'receipt_id': t} for i, t in enumerate(tracking_ids)]}
+
+    async def handle_register_key(self, registration: KeyRegistration, x_registration_token: Optional[str] = Header(default = None)) -> Dict[str, Any]:
+        # El registro habilita firmantes: solo el operador (token) da altas, y a ritmo acotado (el índice SQLite no crece sin límite).
+        self._authorize_key_registration(x_registration_token)
         try:
-            tx_data = submission.get('tx_data')
-            if not tx_data: raise ValueError("Falta 'tx_data'.")
-            tx_obj = TransactionDeserializer.from_dict(tx_data)
-            validation_manager = self._full_node.get_validation_manager()
-            if validation_manager.validate_tx_rules(tx_obj):
-                p2p = self._full_node.get_p2p_manager()
-                if asyncio.iscoroutinefunction(p2p.broadcast_new_tx): await p2p.broadcast_new_tx(tx_obj)
-                else: p2p.broadcast_new_tx(tx_obj)
-                return {'status': 'relayed', 'tx_hash': tx_obj.tx_hash}
-            raise ValueError("Firma inválida.")
+            public_key = ECC.import_key(registration.public_key_pem)
+            if public_key.has_private(): raise ValueError("Se esperaba una clave PÚBLICA.")
+            address = AddressFactory.generate_p2pkh(public_key)
+            key_map = self._full_node.get_validation_manager().get_public_key_map()
+            key_map[address] = public_key # KeyRegistry: persiste en el índice y queda disponible al instante
+            logging.info(f"API: Clave registrada en caliente para {address}.")
+            return {'status': 'registered', 'address': address}
         except Exception as e: raise HTTPException(status_code=400, detail=str(e))
 
-    def _get_chain_data(self) -> Dict[str, Any]:
+    def _authorize_key_registration(self, token: Optional[str]) -> None:
+        expected = Config.API_KEY_REGISTRATION_TOKEN
+        if not expected: raise HTTPException(status_code=403, detail="Alta de claves por la API deshabilitada (sin API_KEY_REGISTRATION_TOKEN).")
+        if token is None or not hmac.compare_digest(token.encode(), expected.encode()): raise HTTPException(status_code=401, detail="Token de registro inválido.")
+        if self._key_registration_bucket.wait_time(1) > 0: raise HTTPException(status_code=429, detail="Demasiadas altas de claves. Reintente más tarde.")
+        self._key_registration_bucket.consume(1)
+
+    def _check_batch_size(self, count: int) -> None:
+        if count == 0: raise HTTPException(status_code=400, detail="Lote vacío.")
+        if count > Config.API_MAX_BATCH_ITEMS: raise HTTPException(status_code=413, detail=f"Lote demasiado grande (máximo {Config.API_MAX_BATCH_ITEMS}).")
+
+    def _admit_or_throttle(self, tracking_ids: Optional[List[str]]) -> List[str]:
+        if tracking_ids is None: raise HTTPException(status_code=429, detail="Cola de ingesta llena. Reintente más tarde.")
+        return tracking_ids
+
+    async def _get_chain_data(self) -> Dict[str, Any]:
         bc = self._full_node.get_blockchain()
         chain_list = bc.chain
         latest: List[Dict[str, Any]] = []
@@ -96,7 +132,7 @@ class APIManager(IAPIRole):
             latest.append({"index": b.index, "hash": b.hash, "miner": miner, "tx_count": len(b.data), "timestamp": b.timestamp})
         return {"length": len(chain_list), "latest_blocks": latest}
 
-    def _get_mempool_data(self) -> Dict[str, Any]:
+    async def _get_mempool_data(self) -> Dict[str, Any]:
         mp = self._full_node.get_mempool()
         txs = mp.get_transactions_for_block(50)
         t_list: List[Dict[str, Any]] = []
@@ -104,13 +140,36 @@ class APIManager(IAPIRole):
             if t.entries: t_list.append({"tx_hash": t.tx_hash, "type": t.entries[0].data_type, "source": t.entries[0].source_id})
         return {"count": len(t_list), "transactions": t_list}
 
-    def _get_peers_data(self) -> Dict[str, Any]:
-        p2p = self._full_node.get_p2p_manager()
-        count = 0
-        if hasattr(p2p, '_p2p_service'):
-            svc = getattr(p2p, '_p2p_service')
-            if hasattr(svc, '_peers'): count = len(getattr(svc, '_peers'))
-        return {"peers_count": count}
+    async def _get_peers_data(self) -> Dict[str, Any]:
+        peers = self._full_node.get_p2p_manager().get_peer_stats()
+        return {"peers_count": len(peers), "peers": peers}
+
+    async def _get_receipt_data(self, receipt_id: str) -> Dict[str, Any]:
+        receipt = self._ingestion_manager.get_status(receipt_id)
+        if receipt is None: raise HTTPException(status_code=404, detail="Recibo desconocido o expirado.")
+        return receipt
+
+    async def _get_tx_status(self, tx_hash: str) -> Dict[str, Any]:
+        return self._describe_tx(tx_hash)
+
+    async def _lookup_tx_statuses(self, request: TxLookupRequest) -> Dict[str, Any]:
+        self._check_batch_size(len(request.tx_hashes))
+        return {"results": [self._describe_tx(tx_hash) for tx_hash in request.tx_hashes]}
+
+    def _describe_tx(self, tx_hash: str) -> Dict[str, Any]:
+        '''Estado de una TX: 'confirmed' (con profundidad de confirmación), 'pending' (Mempool) o 'unknown'.'''
+        blockchain = self._full_node.get_blockchain()
+        location = blockchain.tx_index.get(tx_hash)
+        tip = blockchain.last_block
+        block = blockchain.get_block_at(location.height) if location is not None else None
+        if location is not None and block is not None and tip is not None:
+            return {"tx_hash": tx_hash, "status": "confirmed", "block_height": location.height, "block_hash": block.hash, "position": location.position, "confirmations": tip.index - location.height + 1}
+        if self._full_node.get_mempool().have_transaction(tx_hash):
+            return {"tx_hash": tx_hash, "status": "pending", "confirmations": 0}
+        return {"tx_hash": tx_hash, "status": "unknown", "confirmations": 0}
+
+    async def _get_metrics_data(self) -> Dict[str, Any]:
+        return {"validation": self._full_node.get_validation_manager().get_metrics(), "ingestion": self._ingestion_manager.get_metrics(), "p2p": self._full_node.get_p2p_manager().get_metrics()}
 
     async def _start_mining_cmd(self) -> Dict[str, str]:
         if self._mining_manager:
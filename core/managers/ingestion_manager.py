@@ -0,0 +1,225 @@
+# network_of_interactive_nodes/core/managers/ingestion_manager.py
+'''
+class IngestionManager:
+    Gestor (Capa 2) de admisión de la API: desacopla la recepción HTTP de la validación.
+
+    Los handlers de FastAPI comparten el event loop con el P2PService: validar y firmar en línea
+    retrasa el manejo de mensajes P2P ante una ráfaga de sensores. Aquí la API solo hace chequeos
+    de esquema baratos, encola el trabajo (cola acotada) y responde 202 con un ID de seguimiento.
+    Si la cola está llena, la API responde 429 (contrapresión).
+
+    Attributes:
+        _full_node              (FullNode):                     Validación (ValidationManager) y difusión (P2PManager).
+        _aggregation_manager    (AggregationManager):           Destino de las lecturas delegadas (ventana de agregación).
+        _queue                  (asyncio.Queue[_Admission]):    Cola acotada de trabajos admitidos (Config.INGESTION_QUEUE_SIZE).
+        _workers                (List[asyncio.Task]):           Tareas que drenan la cola (Config.INGESTION_WORKERS).
+        _tracking               (OrderedDict[str, _Tracking]):  Estado por ID de seguimiento (acotado).
+        _admitted / _throttled  (int):                          Contadores para métricas.
+
+    Methods:
+        admit_data(submissions) -> Optional[List[str]]: Admite lecturas delegadas (None si la cola no tiene espacio para todas).
+        admit_signed(tx_datas) -> Optional[List[str]]: Admite TXs firmadas (None si la cola no tiene espacio para todas).
+
+        get_status(tracking_id) -> Optional[Dict]: Estado del trabajo. Para lecturas ya entregadas a la
+            ventana de agregación, el ID es el mismo 'receipt_id' (se consulta al AggregationManager).
+
+        get_metrics() -> Dict: Profundidad de la cola, admitidos y rechazados por cola llena (429).
+
+        stop(): Procesa lo que queda en la cola y detiene los workers.
+
+        _worker_loop(): Bucle de cada worker.
+            1. Esperar un trabajo y tomar, sin esperar, los siguientes hasta Config.INGESTION_BATCH_SIZE.
+            2. Lecturas delegadas: construir la DataEntry y entregarla al AggregationManager con el mismo ID.
+            3. TXs firmadas: deserializar (verifica hashes) fuera del event loop.
+            4. Validar el lote de TXs en el pool de validación (un lote de firmas, un commit ordenado a la Mempool).
+            5. Anunciar las TXs aceptadas en un único 'inv' y actualizar el estado de cada ID.
+'''
+
+import uuid
+import base64
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Union
+
+# Importaciones de la arquitectura
+from core.models.data_entry import DataEntry
+from core.models.transaction import Transaction
+from core.nodes.full_node import FullNode
+from core.managers.aggregation_manager import AggregationManager
+from core.dto.api.data_submission import DataSubmission
+from core.dto.data_entry_creation_params import DataEntryCreationParams
+from core.factories.data_entry_factory import DataEntryFactory
+from core.deserializers.transaction_deserializer import TransactionDeserializer
+
+# Importacion de la configuracion
+from config import Config
+
+@dataclass(slots = True)
+class _Admission:
+    tracking_id: str
+    payload: Union[DataSubmission, Dict[str, Any]]   # Lectura delegada o 'tx_data' de una TX firmada
+
+@dataclass(slots = True)
+class _Tracking:
+    status: str                         # 'queued' | 'aggregating' | 'accepted' | 'rejected'
+    tx_hash: Optional[str] = None
+    error: Optional[str] = None
+
+class IngestionManager:
+
+    def __init__(self, full_node: FullNode, aggregation_manager: AggregationManager, signer_address: str,
+                 queue_size: int = Config.INGESTION_QUEUE_SIZE,
+                 workers: int = Config.INGESTION_WORKERS,
+                 batch_size: int = Config.INGESTION_BATCH_SIZE):
+        self._full_node = full_node
+        self._aggregation_manager = aggregation_manager
+        self._signer_address = signer_address
+        self._queue_size = queue_size
+        self._worker_count = workers
+        self._batch_size = batch_size
+
+        self._queue: Optional[asyncio.Queue[_Admission]] = None
+        self._workers: List[asyncio.Task[None]] = []
+        self._tracking: 'OrderedDict[str, _Tracking]' = OrderedDict()
+        self._admitted: int = 0
+        self._throttled: int = 0
+        logging.info(f'Ingestion Manager listo. Cola: {queue_size} trabajos, {workers} workers, lotes de {batch_size}.')
+
+    # --- Admisión (llamada desde los handlers HTTP) ---
+
+    def admit_data(self, submissions: List[DataSubmission]) -> Optional[List[str]]:
+        return self._admit(list(submissions))
+
+    def admit_signed(self, tx_datas: List[Dict[str, Any]]) -> Optional[List[str]]:
+        return self._admit(list(tx_datas))
+
+    # --- Consultas ---
+
+    def get_status(self, tracking_id: str) -> Optional[Dict[str, Any]]:
+        tracking = self._tracking.get(tracking_id)
+        if tracking is None or tracking.status == 'aggregating':
+            return self._aggregation_manager.get_receipt(tracking_id)
+        return {'receipt_id': tracking_id, 'status': tracking.status, 'tx_hash': tracking.tx_hash, 'error': tracking.error}
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            'queue_depth': self._queue.qsize() if self._queue is not None else 0,
+            'queue_capacity': self._queue_size,
+            'admitted': self._admitted,
+            'throttled': self._throttled
+        }
+
+    async def stop(self) -> None:
+        if self._queue is not None and self._workers:
+            await self._queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions = True)
+        self._workers = []
+
+    # --- Helpers ---
+
+    def _admit(self, payloads: List[Union[DataSubmission, Dict[str, Any]]]) -> Optional[List[str]]:
+        queue = self._ensure_workers()
+
+        # Todo o nada: un lote no se admite a medias.
+        if self._queue_size - queue.qsize() < len(payloads):
+            self._throttled += len(payloads)
+            return None
+
+        tracking_ids: List[str] = []
+        for payload in payloads:
+            tracking_id = uuid.uuid4().hex
+            self._remember(tracking_id, _Tracking(status = 'queued'))
+            queue.put_nowait(_Admission(tracking_id = tracking_id, payload = payload))
+            tracking_ids.append(tracking_id)
+
+        self._admitted += len(payloads)
+        return tracking_ids
+
+    def _ensure_workers(self) -> 'asyncio.Queue[_Admission]':
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize = self._queue_size)
+        self._workers = [w for w in self._workers if not w.done()]
+        while len(self._workers) < self._worker_count:
+            self._workers.append(asyncio.create_task(self._worker_loop(self._queue)))
+        return self._queue
+
+    async def _worker_loop(self, queue: 'asyncio.Queue[_Admission]') -> None:
+        while True:
+            # 1. Lote: el primero esperando, el resto solo si ya está en cola.
+            batch: List[_Admission] = [await queue.get()]
+            while len(batch) < self._batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            try:
+                await self._process_batch(batch)
+            except Exception as e:
+                logging.error(f'Ingesta: Error procesando lote de {len(batch)}. {e}')
+                for admission in batch:
+                    self._resolve(admission.tracking_id, _Tracking(status = 'rejected', error = str(e)))
+            finally:
+                for _ in batch: queue.task_done()
+
+    async def _process_batch(self, batch: List[_Admission]) -> None:
+        data_items = [a for a in batch if isinstance(a.payload, DataSubmission)]
+        signed_items = [a for a in batch if not isinstance(a.payload, DataSubmission)]
+
+        # 2. Lecturas delegadas -> ventana de agregación (el ID de seguimiento es el recibo).
+        for admission in data_items:
+            try:
+                entry = self._build_delegated_entry(admission.payload) # type: ignore[arg-type]
+                await self._aggregation_manager.submit(entry, receipt_id = admission.tracking_id)
+                self._resolve(admission.tracking_id, _Tracking(status = 'aggregating'))
+            except Exception as e:
+                self._resolve(admission.tracking_id, _Tracking(status = 'rejected', error = str(e)))
+
+        if not signed_items: return
+
+        # 3. Deserializar (re-hashea entries y TX) fuera del event loop.
+        parsed = await asyncio.to_thread(self._parse_all, [a.payload for a in signed_items]) # type: ignore[misc]
+
+        # 4. Validación en lote (pool + commit ordenado a la Mempool).
+        txs = [item for item in parsed if isinstance(item, Transaction)]
+        verdicts = iter(await self._full_node.get_validation_manager().validate_txs_rules_async(txs))
+
+        # 5. Difusión única y estado por ID.
+        accepted: List[Transaction] = []
+        for admission, item in zip(signed_items, parsed):
+            if isinstance(item, Exception):
+                self._resolve(admission.tracking_id, _Tracking(status = 'rejected', error = str(item)))
+            elif next(verdicts):
+                accepted.append(item)
+                self._resolve(admission.tracking_id, _Tracking(status = 'accepted', tx_hash = item.tx_hash))
+            else:
+                self._resolve(admission.tracking_id, _Tracking(status = 'rejected', tx_hash = item.tx_hash, error = 'Validación fallida o TX duplicada.'))
+
+        if accepted:
+            self._full_node.get_p2p_manager().broadcast_new_txs(accepted)
+            logging.info(f'Ingesta: {len(accepted)}/{len(signed_items)} TXs firmadas aceptadas.')
+
+    def _build_delegated_entry(self, submission: DataSubmission) -> DataEntry:
+        value_bytes = base64.b64decode(submission.value)
+        meta = dict(submission.metadata) if submission.metadata else {}
+        meta['original_sensor'] = submission.source_id
+        creation_params = DataEntryCreationParams(source_id=self._signer_address, data_type="IOT_DELEGATED", value=value_bytes, nonce=submission.nonce, metadata=meta)
+        return DataEntryFactory.create(params=creation_params)
+
+    @staticmethod
+    def _parse_all(tx_datas: List[Dict[str, Any]]) -> List[Union[Transaction, Exception]]:
+        parsed: List[Union[Transaction, Exception]] = []
+        for tx_data in tx_datas:
+            try: parsed.append(TransactionDeserializer.from_dict(tx_data))
+            except Exception as e: parsed.append(e)
+        return parsed
+
+    def _resolve(self, tracking_id: str, tracking: _Tracking) -> None:
+        if tracking_id in self._tracking:
+            self._tracking[tracking_id] = tracking
+
+    def _remember(self, tracking_id: str, tracking: _Tracking) -> None:
+        self._tracking[tracking_id] = tracking
+        while len(self._tracking) > Config.INGESTION_TRACKING_CACHE_SIZE:
+            self._tracking.popitem(last = False)
\ No newline at end of file
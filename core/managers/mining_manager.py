@@ -61,7 +61,7 @@ class MiningManager(IMinerRole):
                 new_block = await loop.run_in_executor(self._executor, _run_mining_logic, *block_params)
                 logging.info(f"💎 ¡EUREKA! Bloque {new_block.index} minado. Hash: {new_block.hash[:8]}")
                 validation_manager = self._full_node.get_validation_manager()
-                if validation_manager.validate_block_rules(new_block):
+                if await validation_manager.validate_block_rules_async(new_block):
                     p2p_manager = self._full_node.get_p2p_manager()
                     if asyncio.iscoroutinefunction(p2p_manager.broadcast_new_block): await p2p_manager.broadcast_new_block(new_block)
                     else: p2p_manager.broadcast_new_block(new_block)
@@ -78,7 +78,12 @@ class MiningManager(IMinerRole):
         coinbase_tx = self._create_coinbase_tx()
         mempool = self._full_node.get_mempool()
         mempool_txs = list(mempool.get_transactions_for_block(max_count=50))
-        transactions = [coinbase_tx] + mempool_txs
+        transactions = [coinbase_tx]
+        block_size = TransactionUtils.estimate_size(coinbase_tx.entries)
+        for tx in mempool_txs:
+            block_size += TransactionUtils.estimate_size(tx.entries)
+            if block_size > Config.BLOCK_MAX_SIZE_BYTES: break # Regla de consenso: tamaño máximo de bloque
+            transactions.append(tx)
         blockchain = self._full_node.get_blockchain()
         last_block = blockchain.last_block
         index = (last_block.index + 1) if last_block else 0
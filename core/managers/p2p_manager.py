@@ -8,13 +8,24 @@ class P2PManager(INode):
     2. Enrutar mensajes solo a los handlers activos.
 
     Attributes:
-        _sync_handler (SyncHandler | None): Maneja versión y headers (Si hay blockchain).
+        _sync_handler (SyncHandler | None): Maneja versión y headers (Si hay blockchain). Pide el modo de alto
+            ancho de banda (bloques empujados) solo si hay Validador y Mempool para reconstruirlos.
         _gossip_handler (GossipHandler | None): Maneja inv/tx/block (Si hay validador).
         _data_handler (DataHandler | None): Maneja getdata (Si hay blockchain y mempool).
+        _address_handler (AddressHandler): Maneja getaddr/addr y la dirección de escucha del 'version' (siempre activo).
+            La libreta de direcciones (AddressManager, 'peers.dat') la usa P2PService para mantener las conexiones.
+            Los vetos por mal comportamiento (PeerBanManager, 'banlist.json') los aplica P2PService; los handlers reportan las faltas.
+        _download_scheduler (BlockDownloadScheduler | None): Descarga paralela de bloques (Si hay blockchain y validador).
+
+    Methods:
+        get_peer_stats() -> List[Dict]: Pares conectados con su latencia (RTT EWMA, jitter) e inactividad.
+
+        get_metrics() -> Dict: Métricas del transporte (pares, 'inv' enviados y suprimidos por inventario conocido, faltas y vetos)
+            de la descarga de bloques de la sincronización, de los pedidos 'getdata' y de los bloques compactos.
 '''
 
 import logging
-from typing import List, Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional
 
 # --- Interfaces y Transporte ---
 from core.interfaces.i_node import INode 
@@ -22,6 +33,9 @@ from core.interfaces.i_node_roles import IBlockValidatorRole
 from core.p2p.p2p_service import P2PService 
 from core.p2p.peer import Peer 
 from core.p2p.message import Message
+from core.p2p.block_download_scheduler import BlockDownloadScheduler
+from core.p2p.address_manager import AddressManager
+from core.p2p.peer_ban_manager import PeerBanManager
 
 # --- Modelos ---
 from core.models.blockchain import Blockchain
@@ -33,6 +47,7 @@ from core.mempool.mempool import Mempool
 from core.p2p.handlers.sync_handler import SyncHandler
 from core.p2p.handlers.gossip_handler import GossipHandler
 from core.p2p.handlers.data_handler import DataHandler
+from core.p2p.handlers.address_handler import AddressHandler
 
 # --- DTOs ---
 from core.p2p.payloads.version_payload import VersionPayload
@@ -42,6 +57,15 @@ from core.p2p.payloads.inv_payload import InvPayload
 from core.p2p.payloads.get_data_payload import GetDataPayload
 from core.p2p.payloads.block_payload import BlockPayload
 from core.p2p.payloads.tx_payload import TxPayload
+from core.p2p.payloads.block_chunk_payload import BlockChunkPayload
+from core.p2p.payloads.compact_block_payload import CompactBlockPayload
+from core.p2p.payloads.get_block_txn_payload import GetBlockTxnPayload
+from core.p2p.payloads.block_txn_payload import BlockTxnPayload
+from core.p2p.payloads.get_addr_payload import GetAddrPayload
+from core.p2p.payloads.addr_payload import AddrPayload
+
+# Importacion de la configuracion
+from config import Config
 
 
 class P2PManager(INode):
@@ -56,17 +80,26 @@ class P2PManager(INode):
         
         logging.info("P2P Manager: Configurando handlers dinámicamente...")
         
-        # 1. Inicializar Transporte
-        self._p2p_service = P2PService(self, host, port, seed_peers)
+        # 1. Inicializar Transporte (con la libreta de direcciones y los vetos persistentes)
+        address_manager = AddressManager(Config.NETWORK_PEERS_FILE.format(port = port))
+        ban_manager = PeerBanManager(Config.P2P_BANLIST_FILE.format(port = port))
+        self._p2p_service = P2PService(self, host, port, seed_peers, address_manager, ban_manager)
+        self._address_handler = AddressHandler(self._p2p_service, address_manager)
 
         # 2. Composición Condicional (Aquí está la solución)
+
+        # 0. Planificador de descarga (Necesita Blockchain donde conectar y Validador)
+        self._download_scheduler: Optional[BlockDownloadScheduler] = None
+        if blockchain is not None and validator_role is not None:
+            self._download_scheduler = BlockDownloadScheduler(self._p2p_service, blockchain, validator_role)
         
         # A. SyncHandler (Necesita Blockchain, aunque sea ligera/stub)
         #    Si es SPV, 'blockchain' puede ser None o un objeto HeaderChain. 
         #    Asumiremos que si pasas None, no hay sync de bloques, solo handshake básico.
         self._sync_handler: Optional[SyncHandler] = None
         if blockchain is not None:
-            self._sync_handler = SyncHandler(blockchain, self._p2p_service)
+            block_push_slots = Config.NETWORK_HIGH_BANDWIDTH_PEERS if validator_role is not None and mempool is not None else 0
+            self._sync_handler = SyncHandler(blockchain, self._p2p_service, self._download_scheduler, block_push_slots)
         
         # B. GossipHandler (Necesita Validador)
         self._gossip_handler: Optional[GossipHandler] = None
@@ -76,7 +109,8 @@ class P2PManager(INode):
                 blockchain=blockchain, # Puede ser None dentro del handler si se permite
                 mempool=mempool,
                 p2p_service=self._p2p_service,
-                validator_role=validator_role
+                validator_role=validator_role,
+                download_scheduler=self._download_scheduler
             )
         
         # C. DataHandler (ESTRICTO: Necesita Blockchain Y Mempool)
@@ -107,6 +141,16 @@ class P2PManager(INode):
         if not peer: return
 
         try:
+            # GRUPO 0: Descubrimiento de pares (Siempre activo)
+            if command == 'version' and isinstance(payload, VersionPayload):
+                self._address_handler.handle_version(payload, peer)
+
+            elif command == 'getaddr' and isinstance(payload, GetAddrPayload):
+                self._address_handler.handle_get_addr(peer)
+
+            elif command == 'addr' and isinstance(payload, AddrPayload):
+                self._address_handler.handle_addr(payload, peer)
+
             # GRUPO 1: Sincronización (Solo si el handler existe)
             if self._sync_handler:
                 if command == 'version' and isinstance(payload, VersionPayload):
@@ -122,6 +166,9 @@ class P2PManager(INode):
             if self._data_handler:
                 if command == 'getdata' and isinstance(payload, GetDataPayload):
                     self._data_handler.handle_get_data(payload, peer)
+
+                elif command == 'getblocktxn' and isinstance(payload, GetBlockTxnPayload):
+                    self._data_handler.handle_get_block_txn(payload, peer)
                 
             # GRUPO 3: Chisme (Solo si podemos validar)
             if self._gossip_handler:
@@ -131,6 +178,15 @@ class P2PManager(INode):
                 elif command == 'block' and isinstance(payload, BlockPayload):
                     self._gossip_handler.handle_block(payload, peer_id)
 
+                elif command == 'blockchunk' and isinstance(payload, BlockChunkPayload):
+                    self._gossip_handler.handle_block_chunk(payload, peer_id)
+
+                elif command == 'cmpctblock' and isinstance(payload, CompactBlockPayload):
+                    self._gossip_handler.handle_compact_block(payload, peer)
+
+                elif command == 'blocktxn' and isinstance(payload, BlockTxnPayload):
+                    self._gossip_handler.handle_block_txn(payload, peer_id)
+
                 elif command == 'tx' and isinstance(payload, TxPayload):
                     self._gossip_handler.handle_tx(payload, peer_id)
                 
@@ -143,10 +199,35 @@ class P2PManager(INode):
         if self._sync_handler:
             self._sync_handler.initiate_handshake(peer)
 
+    def handle_peer_disconnected(self, peer_id: str) -> None:
+        if self._gossip_handler:
+            self._gossip_handler.handle_peer_disconnected(peer_id)
+
+    def run_maintenance(self) -> None:
+        if self._gossip_handler:
+            self._gossip_handler.prune_expired()
+
     def broadcast_new_block(self, block: Block) -> None:
         if self._gossip_handler:
             self._gossip_handler.broadcast_new_block(block)
 
     def broadcast_new_tx(self, tx: Transaction) -> None:
         if self._gossip_handler:
-            self._gossip_handler.broadcast_new_tx(tx)
\ No newline at end of file
+            self._gossip_handler.broadcast_new_tx(tx)
+
+    def broadcast_new_txs(self, txs: List[Transaction]) -> None:
+        if self._gossip_handler:
+            self._gossip_handler.broadcast_new_txs(txs)
+
+    # --- Métricas ---
+
+    def get_peer_stats(self) -> List[Dict[str, Any]]:
+        return self._p2p_service.get_peer_stats()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        metrics = self._p2p_service.get_metrics()
+        if self._download_scheduler:
+            metrics['block_download'] = self._download_scheduler.get_metrics()
+        if self._gossip_handler:
+            metrics.update(self._gossip_handler.get_metrics())
+        return metrics
\ No newline at end of file
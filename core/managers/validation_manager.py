@@ -4,27 +4,72 @@ class ValidationManager(IBlockValidatorRole):
     Implementa el "Rol" de validación de Consenso. 
     Es un "Gestor" (Capa 2) que se encarga *solo* de aplicar las reglas de negocio (Consenso).
 
+    Separa la validación en dos fases:
+        - Sin estado (PoW, hashes, Merkle, firmas): costosa en CPU, se ejecuta en un pool de hilos.
+        - Con estado (ConsensusManager / Mempool): se aplica en un único 'committer', en orden de llegada.
+
     Attributes:
         _consensus_manager  (ConsensusManager):     Gestor que aplica las reglas de la cadena (PoW, dificultad).
         _mempool            (Mempool):              Gestor que almacena las transacciones pendientes.
         _public_key_map     (Dict[str, EccKey]):    Mapa de claves públicas para la verificación de firmas.
+        _executor           (ThreadPoolExecutor):   Pool de validación sin estado (Config.VALIDATION_WORKERS).
+        _verified_tx_cache  (VerifiedTxCache):      TXs ya verificadas (evita re-verificarlas al llegar dentro de un bloque).
+        _recent_confirmed   (RollingTxFilter):      TXs recién confirmadas en un bloque (no se vuelven a pedir ni a admitir en la Mempool).
+        _recent_rejected    (RollingTxFilter):      TXs recién rechazadas por reglas sin estado, por 'tx_hash:firma'
+                                                    (se olvida al aceptar un bloque nuevo).
+        _recent_invalid     (RollingTxFilter):      Bloques y TXs inválidos por su contenido (no se olvida con los bloques nuevos):
+                                                    por hash solo los bloques con PoW inválido; el resto por hash y firmas.
+        _commit_queue       (asyncio.Queue):        Cola FIFO de resultados pendientes de aplicar.
+        _committer_task     (asyncio.Task):         Tarea única que aplica los cambios de estado en orden.
 
     Methods:
-        validate_block_rules(block: Block) -> bool:
-            1. Delega la validación completa del bloque al ConsensusManager.
-            2. Si el bloque es válido y nuevo (is_new_block):
-            3. Limpia el Mempool de las transacciones ya minadas.
+        validate_block_rules(block: Block) -> bool: (Síncrono)
+            1. Validación sin estado (StatelessValidator). Si falla, se registra como inválido
+               (salvo un timestamp 'futuro', que puede serlo solo para nuestro reloj).
+            2. Delega la validación de contexto al ConsensusManager.
+            3. Si el bloque es válido y nuevo: limpia el Mempool de las transacciones ya minadas
+               y las registra como recién confirmadas.
             4. Retorna True (el bloque fue aceptado).
 
-        validate_tx_rules(tx: Transaction) -> bool:
-            1. Validar integridad del hash (Delega a TransactionValidator).
-            2. Validar la firma (Delega a TransactionVerifier).
-            3. Si es válida, añadirla al Mempool.
-            4. Retorna True (la TX fue aceptada en la Mempool).
+        validate_tx_rules(tx: Transaction) -> bool: (Síncrono)
+            1. Validación sin estado (integridad del hash y firma). Si falla, se registra como recién rechazada
+               (y como inválida, salvo que el firmante aún no tenga clave registrada).
+            2. Si es válida (y no fue confirmada recientemente), añadirla al Mempool.
+            3. Retorna True (la TX fue aceptada en la Mempool).
+
+        validate_block_rules_async(block) / validate_tx_rules_async(tx) -> bool: (Asíncrono, sin bloquear el event loop)
+            1. Enviar la validación sin estado al pool de hilos.
+            2. Encolar el resultado pendiente (el orden de la cola es el orden de llegada).
+            3. El committer espera cada resultado EN ORDEN y aplica el cambio de estado.
+            4. Retorna lo que devolvería la versión síncrona.
+
+        validate_txs_rules(txs) / validate_txs_rules_async(txs) -> List[bool]: Lote de TXs independientes (ej. gateways).
+            1. Validación sin estado de TODO el lote en una sola tarea (StatelessValidator.verify_txs: un lote de firmas).
+            2. Un único commit ordenado añade a la Mempool las TXs válidas, en el orden del lote.
+            3. Retorna el resultado por TX.
+
+        stop(): Detiene el committer y el pool de validación.
+
+        has_recent_tx(tx_hash) -> bool: True si la TX se confirmó recientemente (el gossip no la vuelve a pedir).
+
+        has_recent_rejection(tx) -> bool: True si esta misma TX (hash y firma) se rechazó recientemente (no se re-valida).
+
+        is_known_invalid_block(block) / is_known_invalid_tx(tx) -> bool: True si esta copia es inválida por su contenido
+            (el gossip no la re-valida y penaliza a quien la envía).
+
+        run_in_validation_pool(func, *args) -> T: Ejecuta trabajo de CPU sin estado en el pool de validación
+            (el gossip deserializa y re-hashea ahí los bloques y TXs recibidos: el event loop solo despacha el objeto).
+
+        get_metrics() -> Dict[str, Any]: Métricas de validación (acierto de la caché de TXs verificadas, motor de firmas).
 '''
 
+import time
+import asyncio
+import hashlib
 import logging
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, TypeVar
 from Crypto.PublicKey.ECC import EccKey
 
 # Importaciones de Interfaces (Contratos) 
@@ -33,15 +78,29 @@ from core.interfaces.i_node_roles import IBlockValidatorRole
 # Importaciones de Gestores (Estado) 
 from core.consensus.consensus_manager import ConsensusManager
 from core.mempool.mempool import Mempool
+from core.mempool.rolling_tx_filter import RollingTxFilter
 
 # Importaciones de Modelos (Datos) 
 from core.models.block import Block
 from core.models.transaction import Transaction
 
 # Importaciones del Núcleo Estático (Herramientas) 
-from core.validators.transaction_validator import TransactionValidator
+from core.validators.stateless_validator import StatelessValidator
+from core.validators.verified_tx_cache import VerifiedTxCache
 from core.validators.transaction_verifier import TransactionVerifier
 
+# Importacion de la configuracion
+from config import Config
+
+T = TypeVar('T')
+
+@dataclass(slots = True)
+class _PendingCommit:
+    precheck: 'asyncio.Future[Any]'
+    commit: Callable[[Any], Any]        # Recibe el resultado de 'precheck' y retorna el resultado final
+    result: 'asyncio.Future[Any]'
+    error_result: Any                   # Resultado si la validación lanza una excepción
+
 class ValidationManager(IBlockValidatorRole):
     def __init__(self, 
         consensus_manager: ConsensusManager, 
@@ -51,41 +110,171 @@ class ValidationManager(IBlockValidatorRole):
         self._consensus_manager = consensus_manager
         self._mempool = mempool
         self._public_key_map = public_key_map
-        logging.info('Validation Manager (Gestor de Consenso) inicializado.')
+        self._verified_tx_cache = VerifiedTxCache()
+        self._recent_confirmed = RollingTxFilter(Config.RECENT_CONFIRMED_TX_FILTER_SIZE)
+        self._recent_rejected = RollingTxFilter(Config.RECENT_REJECTED_TX_FILTER_SIZE)
+        self._recent_invalid = RollingTxFilter(Config.RECENT_INVALID_FILTER_SIZE)
+
+        self._executor = ThreadPoolExecutor(max_workers = Config.VALIDATION_WORKERS, thread_name_prefix = 'validation')
+        self._commit_queue: Optional[asyncio.Queue[_PendingCommit]] = None
+        self._committer_task: Optional[asyncio.Task[None]] = None
+        logging.info(f'Validation Manager (Gestor de Consenso) inicializado. Pool de validación: {Config.VALIDATION_WORKERS} hilos.')
+
+    # --- API Síncrona ---
 
     def validate_block_rules(self, block: Block) -> bool:
+        is_valid = StatelessValidator.verify_block(block, self._public_key_map, self._verified_tx_cache)
+        return self._commit_block(block) if is_valid else self._reject_block(block)
+
+    def validate_tx_rules(self, tx: Transaction) -> bool:
+        is_valid = StatelessValidator.verify_tx(tx, self._public_key_map, self._verified_tx_cache)
+        return self._commit_tx(tx) if is_valid else self._reject_tx(tx)
+
+    def validate_txs_rules(self, txs: List[Transaction]) -> List[bool]:
+        return self._commit_txs(txs, StatelessValidator.verify_txs(txs, self._public_key_map, self._verified_tx_cache))
+
+    # --- API Asíncrona (Pool + Commit Ordenado) ---
+
+    async def validate_block_rules_async(self, block: Block) -> bool:
+        return await self._submit(
+            lambda: StatelessValidator.verify_block(block, self._public_key_map, self._verified_tx_cache),
+            lambda is_valid: self._commit_block(block) if is_valid else self._reject_block(block)
+        )
+
+    async def validate_tx_rules_async(self, tx: Transaction) -> bool:
+        return await self._submit(
+            lambda: StatelessValidator.verify_tx(tx, self._public_key_map, self._verified_tx_cache),
+            lambda is_valid: self._commit_tx(tx) if is_valid else self._reject_tx(tx)
+        )
+
+    async def validate_txs_rules_async(self, txs: List[Transaction]) -> List[bool]:
+        if not txs: return []
+        return await self._submit(
+            lambda: StatelessValidator.verify_txs(txs, self._public_key_map, self._verified_tx_cache),
+            lambda results: self._commit_txs(txs, results),
+            error_result = [False] * len(txs)
+        )
+
+    async def stop(self) -> None:
+        if self._committer_task:
+            self._committer_task.cancel()
+            try:
+                await self._committer_task
+            except asyncio.CancelledError: pass
+            self._committer_task = None
+
+        # Liberar a quienes aún esperaban un resultado encolado.
+        while self._commit_queue is not None and not self._commit_queue.empty():
+            self._commit_queue.get_nowait().result.cancel()
+        self._executor.shutdown(wait = False, cancel_futures = True)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            'verified_tx_cache': self._verified_tx_cache.get_stats(),
+            'signature_backend': TransactionVerifier.get_backend_report(),
+            'recent_tx_filters': {'confirmed': len(self._recent_confirmed), 'rejected': len(self._recent_rejected), 'invalid': len(self._recent_invalid)}
+        }
+
+    def has_recent_tx(self, tx_hash: str) -> bool:
+        return self._recent_confirmed.contains(tx_hash)
 
-        is_new_block = self._consensus_manager.add_block(block, self._public_key_map)
+    def has_recent_rejection(self, tx: Transaction) -> bool:
+        return self._recent_rejected.contains(self._tx_key(tx))
+
+    def is_known_invalid_block(self, block: Block) -> bool:
+        return self._recent_invalid.contains(block.hash) or self._recent_invalid.contains(self._block_key(block))
+
+    def is_known_invalid_tx(self, tx: Transaction) -> bool:
+        return self._recent_invalid.contains(self._tx_key(tx))
+
+    async def run_in_validation_pool(self, func: Callable[..., T], *args: Any) -> T:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def get_public_key_map(self):
+        """Devuelve el mapa de claves públicas de forma segura."""
+        return self._public_key_map
+
+    # --- Helpers ---
+
+    async def _submit(self, precheck: Callable[[], Any], commit: Callable[[Any], Any], error_result: Any = False) -> Any:
+        loop = asyncio.get_running_loop()
+
+        if self._commit_queue is None or self._committer_task is None or self._committer_task.done():
+            self._commit_queue = asyncio.Queue()
+            self._committer_task = asyncio.create_task(self._committer_loop(self._commit_queue))
+
+        pending = _PendingCommit(
+            precheck = asyncio.wrap_future(self._executor.submit(precheck)),
+            commit = commit,
+            result = loop.create_future(),
+            error_result = error_result
+        )
+        self._commit_queue.put_nowait(pending)
+        return await asyncio.shield(pending.result)
+
+    async def _committer_loop(self, queue: 'asyncio.Queue[_PendingCommit]') -> None:
+        while True:
+            pending = await queue.get()
+            try:
+                outcome = pending.commit(await pending.precheck)
+                if not pending.result.done(): pending.result.set_result(outcome)
+            except asyncio.CancelledError:
+                if not pending.result.done(): pending.result.cancel()
+                raise
+            except Exception as e:
+                logging.error(f'Consenso: Error aplicando validación. {e}')
+                if not pending.result.done(): pending.result.set_result(pending.error_result)
+
+    def _commit_block(self, block: Block) -> bool:
+
+        is_new_block = self._consensus_manager.add_block(block, self._public_key_map, prevalidated = True)
 
         if is_new_block:
             logging.info(f'Consenso: Bloque {block.index} (hash: {block.hash[:6]}) aceptado.')
             self._mempool.remove_mined_transactions(block.data)
+            self._recent_confirmed.add_many(tx.tx_hash for tx in block.data)
+            # Nueva punta: un rechazo previo (ej. clave aún no registrada) puede dejar de aplicar.
+            self._recent_rejected.clear()
         return is_new_block
 
-    def validate_tx_rules(self, tx: Transaction) -> bool:
+    def _commit_tx(self, tx: Transaction) -> bool:
 
-        if not TransactionValidator.verify(tx):
-            logging.warning(f'Consenso: TX {tx.tx_hash} rechazada (Integridad fallida).')
+        # Ya minada: un 'inv' tardío no debe devolverla a la Mempool.
+        if self._recent_confirmed.contains(tx.tx_hash):
             return False
-        
-        if tx.signature is not None:
-            if not tx.entries: 
-                logging.warning(f'Consenso: TX {tx.tx_hash} rechazada (firmada pero sin entries).')
-                return False
-            
-            owner_id = tx.entries[0].source_id
-            public_key = self._public_key_map.get(owner_id)
-
-            if not public_key or not TransactionVerifier.verify(public_key, tx.tx_hash, tx.signature):
-                logging.warning(f'Consenso: TX {tx.tx_hash} rechazada (Firma inválida).')
-                return False
-            
+
         is_new_tx = self._mempool.add_transaction(tx)
 
         if is_new_tx:
             logging.info(f'Consenso: TX {tx.tx_hash[:6]} aceptada en Mempool.')
 
         return is_new_tx
-    def get_public_key_map(self):
-        """Devuelve el mapa de claves públicas de forma segura."""
-        return self._public_key_map
\ No newline at end of file
+
+    def _commit_txs(self, txs: List[Transaction], prechecks: List[bool]) -> List[bool]:
+        return [self._commit_tx(tx) if is_valid else self._reject_tx(tx) for tx, is_valid in zip(txs, prechecks)]
+
+    @staticmethod
+    def _tx_key(tx: Transaction) -> str:
+        # El 'tx_hash' no cubre la firma: un rechazo por firma no debe alcanzar a otra copia con la firma correcta.
+        return f'{tx.tx_hash}:{tx.signature}'
+
+    @staticmethod
+    def _block_key(block: Block) -> str:
+        # El hash del bloque compromete los 'tx_hash' (Merkle) pero no las firmas.
+        signatures = hashlib.sha256('|'.join(tx.signature or '' for tx in block.data).encode()).hexdigest()
+        return f'{block.hash}:{signatures}'
+
+    def _reject_block(self, block: Block) -> bool:
+        # Sin integridad verificada (bloque local) o 'futuro' para nuestro reloj: el fallo puede no ser del contenido.
+        if not block.integrity_verified or block.timestamp > time.time() + Config.BLOCK_MAX_FUTURE_TIME_SEC:
+            return False
+        # Solo un PoW inválido alcanza a toda copia con ese hash; lo demás (firmas) se registra por copia.
+        self._recent_invalid.add(block.hash if StatelessValidator.fails_proof_of_work(block) else self._block_key(block))
+        return False
+
+    def _reject_tx(self, tx: Transaction) -> bool:
+        self._recent_rejected.add(self._tx_key(tx))
+        # Sin clave del firmante el rechazo puede ser honesto (se reintenta tras el próximo bloque).
+        if not StatelessValidator.has_unknown_signer(tx, self._public_key_map):
+            self._recent_invalid.add(self._tx_key(tx))
+        return False
\ No newline at end of file
@@ -114,6 +114,10 @@ class Mempool:
         with self._lock:
             return self._pending_transactions.get(tx_hash)
 
+    def get_all_transactions(self) -> List[Transaction]:
+        with self._lock:
+            return list(self._pending_transactions.values())
+
     def get_transaction_count(self) -> int:
         with self._lock:
             return len(self._pending_transactions)
\ No newline at end of file
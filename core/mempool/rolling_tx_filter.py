@@ -0,0 +1,61 @@
+# network_of_interactive_nodes/core/mempool/rolling_tx_filter.py
+'''
+class RollingTxFilter:
+    Filtro "rodante" y acotado de hashes de transacciones vistas recientemente
+    (ej. recién confirmadas en un bloque o recién rechazadas).
+
+    Usa dos generaciones de conjuntos: cuando la generación actual se llena, la anterior se descarta
+    y la actual pasa a ser la anterior. Así la memoria queda acotada (~capacidad) sin falsos positivos
+    y cada operación es O(1); un hash se recuerda al menos capacidad/2 inserciones.
+
+    Attributes:
+        _generation_size    (int):              Hashes por generación (capacidad / 2).
+        _current            (Set[str]):         Generación en la que se insertan los hashes.
+        _previous           (Set[str]):         Generación anterior (aún consultable).
+        _lock               (threading.Lock):   Candado (se consulta desde el event loop y el pool de validación).
+
+    Methods:
+        add(tx_hash): Registra un hash (rota las generaciones si la actual está llena).
+        add_many(tx_hashes): Registra varios hashes.
+        contains(tx_hash) -> bool: True si el hash se vio recientemente.
+        clear(): Olvida todos los hashes.
+'''
+
+import threading
+from typing import Iterable, Set
+
+class RollingTxFilter:
+
+    def __init__(self, capacity: int):
+        self._generation_size = max(1, capacity // 2)
+        self._current: Set[str] = set()
+        self._previous: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def add(self, tx_hash: str) -> None:
+        with self._lock:
+            self._add_locked(tx_hash)
+
+    def add_many(self, tx_hashes: Iterable[str]) -> None:
+        with self._lock:
+            for tx_hash in tx_hashes:
+                self._add_locked(tx_hash)
+
+    def contains(self, tx_hash: str) -> bool:
+        with self._lock:
+            return tx_hash in self._current or tx_hash in self._previous
+
+    def clear(self) -> None:
+        with self._lock:
+            self._current, self._previous = set(), set()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._current | self._previous)
+
+    # --- Helpers ---
+
+    def _add_locked(self, tx_hash: str) -> None:
+        if len(self._current) >= self._generation_size:
+            self._previous, self._current = self._current, set()
+        self._current.add(tx_hash)
\ No newline at end of file
@@ -13,6 +13,9 @@ class Block:
         nonce           (int):                    Nonce (prueba de trabajo).
         hash            (str):                    Hash (Doble SHA-256) de la cabecera.
         mining_time     (Optional[float]):        Tiempo que tomó minar (opcional).
+        integrity_verified (bool):                Marca del pipeline de validación: True si el Merkle Root y el hash
+                                                  ya se verificaron al construir el objeto (BlockDeserializer) y todas
+                                                  sus TXs están marcadas. No es parte del constructor ('replace()' la quita).
 '''
 
 from dataclasses import dataclass, field
@@ -31,4 +34,5 @@ class Block:
     data: List[Transaction]
     nonce: int
     hash: str
-    mining_time: Optional[float] = field(default = None, compare = False)
\ No newline at end of file
+    mining_time: Optional[float] = field(default = None, compare = False)
+    integrity_verified: bool = field(default = False, init = False, compare = False, repr = False)
\ No newline at end of file
@@ -5,23 +5,37 @@ class Blockchain:
 
     Attributes:
         _chain      (List[Block]):  Lista interna que almacena los objetos Block.
+        _tx_index   (TxIndex):      Índice tx_hash -> (altura, posición) de la cadena principal (incremental).
+        _heights    (Dict[str, int]): Índice block_hash -> altura de la cadena principal (incremental).
 
     Methods:
         last_block(property) ->    Optional[Block]:   Retorna el último bloque.
         chain (Property) ->        List[Block]:       Retorna una copia de la cadena.
-        add_block_forced(block) -> None:              Añade un bloque (sin validación).
+        tx_index (Property) ->     TxIndex:           Retorna el índice de transacciones confirmadas.
+        get_block_at(height) ->    Optional[Block]:   Retorna el bloque a esa altura (sin copiar la cadena).
+        get_height_of(hash) ->     Optional[int]:     Altura de un bloque de la cadena principal (O(1), índice por hash).
+        get_block_by_hash(hash) -> Optional[Block]:   Bloque de la cadena principal por su hash (O(1)).
+        height (Property) ->       int:               Altura de la punta (-1 si la cadena está vacía).
+        add_block_forced(block) -> None:              Añade un bloque (sin validación) e indexa sus TXs.
         replace_chain(new_chain) -> None:             Reemplaza toda la cadena.
+            1. Buscar el prefijo común con la cadena actual.
+            2. Desconectar de los índices los bloques que salen (desde la punta hacia atrás).
+            3. Conectar a los índices los bloques que entran.
+        restore(chain, tx_index) -> None:             Carga una cadena y su índice guardado (None = reconstruir).
 '''
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 # Importaciones de la arquitectura
 from core.models.block import Block
+from core.models.tx_index import TxIndex
 
 class Blockchain:
 
     def __init__(self):
         self._chain: List[Block] = list()
+        self._tx_index: TxIndex = TxIndex()
+        self._heights: Dict[str, int] = {}
 
     @property
     def last_block(self) -> Optional[Block]:
@@ -31,9 +45,29 @@ class Blockchain:
     def chain(self) -> List[Block]:
         # Retornamos una copia para proteger la lista interna
         return list(self._chain) 
+
+    @property
+    def tx_index(self) -> TxIndex:
+        return self._tx_index
+
+    @property
+    def height(self) -> int:
+        return len(self._chain) - 1
+
+    def get_block_at(self, height: int) -> Optional[Block]:
+        return self._chain[height] if 0 <= height < len(self._chain) else None
+
+    def get_height_of(self, block_hash: str) -> Optional[int]:
+        return self._heights.get(block_hash)
+
+    def get_block_by_hash(self, block_hash: str) -> Optional[Block]:
+        height = self._heights.get(block_hash)
+        return self._chain[height] if height is not None else None
     
     def add_block_forced(self, block: Block) -> None:
         self._chain.append(block)
+        self._heights[block.hash] = len(self._chain) - 1
+        self._tx_index.connect_block(block)
 
     def replace_chain(self, new_chain: List[Block]) -> None:
         '''
@@ -41,4 +75,25 @@ class Blockchain:
         Usado por el sistema de persistencia al cargar desde disco.
         '''
         # Aquí es donde ocurre la "magia" de la persistencia
-        self._chain = list(new_chain)
\ No newline at end of file
+        new_chain = list(new_chain)
+
+        # Solo se re-indexa lo que cambia (en una reorganización, la rama desde el ancestro común).
+        fork_height = 0
+        while (fork_height < len(self._chain) and fork_height < len(new_chain)
+               and self._chain[fork_height].hash == new_chain[fork_height].hash):
+            fork_height += 1
+
+        for block in reversed(self._chain[fork_height:]):
+            self._tx_index.disconnect_block(block)
+            self._heights.pop(block.hash, None)
+        for height, block in enumerate(new_chain[fork_height:], start = fork_height):
+            self._tx_index.connect_block(block)
+            self._heights[block.hash] = height
+
+        self._chain = new_chain
+
+    def restore(self, chain: List[Block], tx_index: Optional[TxIndex] = None) -> None:
+        '''Carga desde disco: adopta el índice guardado con la cadena o lo reconstruye si no corresponde.'''
+        self._chain = list(chain)
+        self._heights = {block.hash: height for height, block in enumerate(self._chain)}
+        self._tx_index = tx_index if tx_index is not None else TxIndex.build(self._chain)
\ No newline at end of file
@@ -11,6 +11,9 @@ class Transaction:
         fee         (int):              Comisión total de la transacción.
         size_bytes  (int):              Tamaño total de la transacción.
         fee_rate    (float):            Comisión por byte.
+        integrity_verified (bool):      Marca del pipeline de validación: True si el hash ya se verificó
+                                        contra el contenido al construir el objeto (TransactionDeserializer).
+                                        No es parte del constructor: 'replace()' siempre produce una copia sin marcar.
 '''
 
 from dataclasses import dataclass, field
@@ -27,4 +30,5 @@ class Transaction:
     signature: Optional[str] = field(default = None, compare = False)
     fee: int = field(default = 0, compare=False)
     size_bytes: int = field(default = 0, compare = False)
-    fee_rate: float = field(default = 0.0, compare = False)
\ No newline at end of file
+    fee_rate: float = field(default = 0.0, compare = False)
+    integrity_verified: bool = field(default = False, init = False, compare = False, repr = False)
\ No newline at end of file
@@ -0,0 +1,80 @@
+# network_of_interactive_nodes/core/models/tx_index.py
+'''
+class TxIndex:
+    Índice de transacciones confirmadas: tx_hash -> TxLocation (altura del bloque, posición).
+    Evita recorrer 'block.data' de toda la cadena para responder "¿mi lectura está confirmada y en qué bloque?".
+
+    Se mantiene de forma incremental (Blockchain): al conectar un bloque se indexan sus TXs y al
+    desconectarlo (reorganización) se eliminan solo las entradas que apuntan a ese bloque.
+
+    Una TX puede aparecer en más de un bloque: la ubicación vigente es la del último bloque conectado,
+    y las anteriores se apilan en '_shadowed' (caso raro: no cuesta memoria en el caso común).
+    Al desconectar el último, vuelve a quedar vigente la ubicación anterior.
+
+    Attributes:
+        _entries    (Dict[str, TxLocation]):        Mapa tx_hash -> ubicación vigente en la cadena principal.
+        _shadowed   (Dict[str, List[TxLocation]]):  Ubicaciones anteriores de las TXs repetidas (pila, la más reciente al final).
+
+    Methods:
+        connect_block(block): Indexa las TXs de un bloque recién conectado (su altura es 'block.index').
+        disconnect_block(block): Quita del índice las TXs de un bloque desconectado (restaurando la ubicación anterior, si la hay).
+        get(tx_hash) -> Optional[TxLocation]: Ubicación de una TX confirmada (None si no lo está).
+        items() / shadowed_items(): Ubicaciones vigentes y apiladas (para la persistencia).
+        build(blocks) -> TxIndex: (Estático) Construye el índice completo de una cadena.
+'''
+
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Importaciones de la arquitectura
+from core.models.block import Block
+from core.dto.tx_location import TxLocation
+
+class TxIndex:
+
+    def __init__(self, entries: Optional[Dict[str, TxLocation]] = None, shadowed: Optional[Dict[str, List[TxLocation]]] = None):
+        self._entries: Dict[str, TxLocation] = entries if entries is not None else {}
+        self._shadowed: Dict[str, List[TxLocation]] = shadowed if shadowed is not None else {}
+
+    @staticmethod
+    def build(blocks: Iterable[Block]) -> 'TxIndex':
+        index = TxIndex()
+        for block in blocks:
+            index.connect_block(block)
+        return index
+
+    def connect_block(self, block: Block) -> None:
+        for position, tx in enumerate(block.data):
+            previous = self._entries.get(tx.tx_hash)
+            if previous is not None:
+                self._shadowed.setdefault(tx.tx_hash, []).append(previous)
+            self._entries[tx.tx_hash] = TxLocation(height = block.index, position = position)
+
+    def disconnect_block(self, block: Block) -> None:
+        # En orden inverso: una TX repetida dentro del mismo bloque se desapila en el orden contrario al que se apiló.
+        for position in range(len(block.data) - 1, -1, -1):
+            tx_hash = block.data[position].tx_hash
+            location = TxLocation(height = block.index, position = position)
+            stack = self._shadowed.get(tx_hash)
+
+            if self._entries.get(tx_hash) == location:
+                if stack:
+                    self._entries[tx_hash] = stack.pop()
+                else:
+                    del self._entries[tx_hash]
+            elif stack and location in stack:
+                stack.remove(location)
+
+            if stack is not None and not stack:
+                del self._shadowed[tx_hash]
+
+    def get(self, tx_hash: str) -> Optional[TxLocation]:
+        return self._entries.get(tx_hash)
+
+    def items(self) -> Iterator[Tuple[str, TxLocation]]:
+        return iter(self._entries.items())
+
+    def shadowed_items(self) -> Iterator[Tuple[str, List[TxLocation]]]:
+        return iter(self._shadowed.items())
+
+    def __len__(self) -> int:
+        return len(self._entries)
\ No newline at end of file
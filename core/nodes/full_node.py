@@ -66,7 +66,7 @@ class FullNode:
                 # [FIX] Usamos el método setter explícito, no la propiedad.
                 # Esto soluciona el error "Attribute is read-only".
                 # -------------------------------------------------------------
-                self._blockchain.replace_chain(loaded_chain.chain)
+                self._blockchain.restore(loaded_chain.chain, loaded_chain.tx_index)
                 
                 logging.info(f"Persistencia: Estado restaurado ({len(self._blockchain.chain)} bloques).")
             else:
@@ -81,6 +81,7 @@ class FullNode:
     async def stop(self) -> None:
         logging.info('Full Node deteniendo servicios de red...')
         await self._p2p_manager.stop()
+        await self._validation_manager.stop()
 
         if self._persistence_manager:
             logging.info('Persistencia: Guardando estado en disco...')
@@ -5,6 +5,8 @@ from core.nodes.full_node import FullNode
 from core.managers.wallet_manager import WalletManager
 from core.managers.api_manager import APIManager
 from core.managers.mining_manager import MiningManager
+from core.managers.aggregation_manager import AggregationManager
+from core.managers.ingestion_manager import IngestionManager
 from core.client_services.software_signer import SoftwareSigner 
 from core.models.blockchain import Blockchain
 from core.mempool.mempool import Mempool
@@ -18,7 +20,9 @@ class GatewayNode:
         self._signer = SoftwareSigner(private_key)
         self._wallet_manager = WalletManager(public_key=private_key.public_key(), signer=self._signer)
         self._mining_manager = MiningManager(miner_address=self._wallet_manager.get_address(), full_node=self._full_node)
-        self._api_manager = APIManager(wallet_manager=self._wallet_manager, full_node=self._full_node, api_host=api_host, api_port=api_port, mining_manager=self._mining_manager)
+        self._aggregation_manager = AggregationManager(wallet_manager=self._wallet_manager, full_node=self._full_node)
+        self._ingestion_manager = IngestionManager(full_node=self._full_node, aggregation_manager=self._aggregation_manager, signer_address=self._wallet_manager.get_address())
+        self._api_manager = APIManager(wallet_manager=self._wallet_manager, full_node=self._full_node, api_host=api_host, api_port=api_port, mining_manager=self._mining_manager, aggregation_manager=self._aggregation_manager, ingestion_manager=self._ingestion_manager)
         logging.info(f"Gateway Node ensamblado. API escuchando en {api_host}:{api_port}")
 
     async def start(self) -> None:
@@ -31,6 +35,8 @@ class GatewayNode:
         logging.info(">>> DETENIENDO GATEWAY NODE <<<")
         await self._mining_manager.stop_mining()
         self._api_manager.stop_api_server()
+        await self._ingestion_manager.stop()
+        await self._aggregation_manager.stop()
         await self._full_node.stop()
         logging.info(">>> GATEWAY NODE APAGADO <<<")
     
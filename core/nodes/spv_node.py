@@ -117,6 +117,12 @@ class SPVNode(INode):
     def initiate_handshake(self, peer: Peer) -> None:
         self._p2p_manager.initiate_handshake(peer)
 
+    def handle_peer_disconnected(self, peer_id: str) -> None:
+        self._p2p_manager.handle_peer_disconnected(peer_id)
+
+    def run_maintenance(self) -> None:
+        self._p2p_manager.run_maintenance()
+
     # --- Funcionalidad Específica SPV ---
 
     def verify_transaction(self, tx_hash: str, merkle_root: str, proof_path: List[str]) -> bool:
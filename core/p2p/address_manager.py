@@ -0,0 +1,208 @@
+# network_of_interactive_nodes/core/p2p/address_manager.py
+'''
+class AddressManager:
+    Libreta de direcciones de pares conocidos ('host:port' donde escuchan), persistida en 'peers.dat' (JSON).
+
+    Las direcciones llegan por los seeds, por el 'version' de los pares entrantes (su puerto de escucha)
+    y por los mensajes 'addr'. P2PService elige de aquí a quién conectarse para mantener sus conexiones
+    salientes: primero las que funcionaron hace poco y con menor latencia. Una dirección que falla se
+    reintenta con espera exponencial (base * 2^fallos, con tope); las que nunca funcionaron se olvidan
+    tras Config.NETWORK_ADDR_MAX_FAILURES fallos seguidos.
+
+    Solo se usa desde el event loop (no necesita candado).
+
+    Attributes:
+        _path           (str):                          Ruta del archivo 'peers.dat'.
+        _max_addresses  (int):                          Direcciones máximas recordadas (Config.NETWORK_MAX_KNOWN_ADDRESSES).
+        _addresses      (Dict[str, _KnownAddress]):     'host:port' -> historial de la dirección.
+        _dirty          (bool):                         Hay cambios sin guardar.
+
+    Methods:
+        add(host, port, last_seen) -> bool: Registra una dirección (o refresca su 'last_seen'). True si es nueva.
+            (Si se supera el máximo, se olvida la peor: la que más falló y menos recientemente se vio.)
+
+        mark_attempt(host, port): Registra un intento de conexión (inicia la espera hasta el próximo).
+        mark_success(host, port, latency_sec): Conexión lograda: reinicia los fallos y actualiza la latencia.
+        record_latency(host, port, latency_sec): Nueva medida de latencia ('pong'; media móvil exponencial).
+        mark_failure(host, port): Conexión fallida: un fallo más (la próxima espera se duplica).
+
+        select_candidates(exclude, count, skip) -> List[Tuple[str, int]]: Direcciones a las que conectarse ahora.
+            1. Descartar las excluidas (conectadas o en curso; 'skip(host, port)', ej. vetadas) y las que aún están en espera.
+            2. Ordenar: con conexión exitosa antes que sin ella, menos fallos, menor latencia, éxito más reciente.
+
+        get_addresses(count) -> List[Dict]: Muestra aleatoria de direcciones para responder a 'getaddr'
+            (solo las que funcionaron o se vieron dentro de Config.NETWORK_ADDR_HORIZON_SEC).
+
+        load(): Carga 'peers.dat' (si no existe o está corrupto, empieza vacío).
+        save() -> bool: Guarda 'peers.dat' de forma atómica (archivo temporal + os.replace) si hay cambios.
+'''
+
+import os
+import json
+import time
+import random
+import logging
+import tempfile
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Importacion de la configuracion
+from config import Config
+
+@dataclass(slots = True)
+class _KnownAddress:
+    host: str
+    port: int
+    last_seen: float = 0.0              # Última vez que nos la anunciaron (o la vimos conectada)
+    last_success: float = 0.0           # Última conexión lograda (0 = nunca)
+    last_attempt: float = 0.0           # Último intento de conexión
+    failures: int = 0                   # Fallos seguidos desde el último éxito
+    latency_ms: Optional[float] = None  # Latencia medida (establecer la conexión y 'ping'/'pong')
+
+class AddressManager:
+
+    def __init__(self, path: str, max_addresses: int = Config.NETWORK_MAX_KNOWN_ADDRESSES):
+        self._path = path
+        self._max_addresses = max_addresses
+        self._addresses: Dict[str, _KnownAddress] = {}
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._addresses)
+
+    # --- Registro ---
+
+    def add(self, host: str, port: int, last_seen: Optional[float] = None) -> bool:
+        key = f'{host}:{port}'
+        seen = min(last_seen if last_seen is not None else time.time(), time.time())
+        known = self._addresses.get(key)
+
+        if known is not None:
+            if seen > known.last_seen:
+                known.last_seen = seen
+                self._dirty = True
+            return False
+
+        self._addresses[key] = _KnownAddress(host = host, port = port, last_seen = seen)
+        self._dirty = True
+        if len(self._addresses) > self._max_addresses:
+            worst = min(self._addresses, key = lambda k: (-self._addresses[k].failures, self._addresses[k].last_success, self._addresses[k].last_seen))
+            del self._addresses[worst]
+        return True
+
+    def add_many(self, addresses: Iterable[Tuple[str, int, Optional[float]]]) -> int:
+        return sum(1 for host, port, last_seen in addresses if self.add(host, port, last_seen))
+
+    def mark_attempt(self, host: str, port: int) -> None:
+        known = self._get_or_add(host, port)
+        known.last_attempt = time.time()
+        self._dirty = True
+
+    def mark_success(self, host: str, port: int, latency_sec: Optional[float] = None) -> None:
+        known = self._get_or_add(host, port)
+        known.last_success = known.last_seen = time.time()
+        known.failures = 0
+        self._dirty = True
+        if latency_sec is not None:
+            self.record_latency(host, port, latency_sec)
+
+    def record_latency(self, host: str, port: int, latency_sec: float) -> None:
+        known = self._addresses.get(f'{host}:{port}')
+        if known is None: return
+        latency_ms = latency_sec * 1000
+        known.latency_ms = latency_ms if known.latency_ms is None else 0.7 * known.latency_ms + 0.3 * latency_ms
+        self._dirty = True
+
+    def mark_failure(self, host: str, port: int) -> None:
+        key = f'{host}:{port}'
+        known = self._addresses.get(key)
+        if known is None: return
+
+        known.failures += 1
+        self._dirty = True
+        # Nunca funcionó y sigue fallando: se olvida (un nuevo 'addr' la puede volver a traer).
+        if known.last_success == 0 and known.failures >= Config.NETWORK_ADDR_MAX_FAILURES:
+            del self._addresses[key]
+
+    # --- Selección ---
+
+    def select_candidates(self, exclude: Iterable[str], count: int,
+                          skip: Optional[Callable[[str, int], bool]] = None) -> List[Tuple[str, int]]:
+        if count <= 0: return []
+        now = time.time()
+        excluded = set(exclude)
+
+        # 1. Disponibles: ni excluidas ni en espera.
+        available = [
+            known for key, known in self._addresses.items()
+            if key not in excluded and now >= known.last_attempt + self._backoff(known)
+            and not (skip is not None and skip(known.host, known.port))
+        ]
+
+        # 2. Ranking por éxito y latencia.
+        available.sort(key = lambda k: (
+            k.last_success == 0, k.failures,
+            k.latency_ms if k.latency_ms is not None else float('inf'),
+            -k.last_success
+        ))
+        return [(known.host, known.port) for known in available[:count]]
+
+    def get_addresses(self, count: int) -> List[Dict[str, Any]]:
+        horizon = time.time() - Config.NETWORK_ADDR_HORIZON_SEC
+        fresh = [known for known in self._addresses.values() if known.last_success > 0 or known.last_seen >= horizon]
+        sample = random.sample(fresh, min(count, len(fresh)))
+        return [{'host': known.host, 'port': known.port, 'timestamp': int(max(known.last_seen, known.last_success))} for known in sample]
+
+    # --- Persistencia ---
+
+    def load(self) -> None:
+        if not os.path.exists(self._path): return
+
+        try:
+            with open(self._path, 'r') as f:
+                rows = json.load(f)
+            for row in rows:
+                known = _KnownAddress(**row)
+                self._addresses[f'{known.host}:{known.port}'] = known
+            logging.info(f'AddressManager: {len(self._addresses)} direcciones cargadas de {self._path}.')
+        except (OSError, ValueError, TypeError) as e:
+            logging.warning(f'AddressManager: {self._path} ilegible ({e}). Se empieza sin direcciones.')
+            self._addresses.clear()
+
+    def save(self) -> bool:
+        if not self._dirty: return True
+        temp_path = None
+
+        try:
+            directory = os.path.dirname(self._path)
+            if directory: os.makedirs(directory, exist_ok = True)
+            temp_fd, temp_path = tempfile.mkstemp(dir = directory or None, text = True)
+
+            with os.fdopen(temp_fd, 'w') as tmp_file:
+                json.dump([asdict(known) for known in self._addresses.values()], tmp_file)
+                tmp_file.flush()
+                os.fsync(tmp_file.fileno())
+
+            os.replace(temp_path, self._path)
+            self._dirty = False
+            return True
+
+        except OSError as e:
+            logging.error(f'AddressManager: No se pudo guardar {self._path}. {e}')
+            if temp_path and os.path.exists(temp_path):
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+            return False
+
+    # --- Helpers ---
+
+    def _get_or_add(self, host: str, port: int) -> _KnownAddress:
+        self.add(host, port)
+        return self._addresses[f'{host}:{port}']
+
+    @staticmethod
+    def _backoff(known: _KnownAddress) -> float:
+        if known.failures == 0: return 0.0
+        return min(Config.NETWORK_RECONNECT_BASE_SEC * 2 ** (known.failures - 1), Config.NETWORK_RECONNECT_MAX_SEC)
\ No newline at end of file
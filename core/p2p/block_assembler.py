@@ -0,0 +1,150 @@
+# network_of_interactive_nodes/core/p2p/block_assembler.py
+'''
+class BlockAssembler:
+    Reensambla de forma incremental los bloques recibidos en fragmentos ('blockchunk').
+
+    Cada fragmento se verifica (checksum) y sus transacciones se deserializan al llegar,
+    por lo que nunca se mantiene en memoria el JSON completo del bloque.
+    Cada conexión (peer_id) tiene un presupuesto de memoria: si lo excede, sus ensamblajes se descartan.
+    También se acota cuántos ensamblajes tiene en curso (un fragmento 0 pequeño casi no gasta presupuesto)
+    y el tamaño de cada bloque: uno mayor que Config.BLOCK_MAX_SIZE_BYTES es inválido por consenso
+    (ese máximo cabe en el presupuesto, así que todo bloque válido puede recibirse).
+
+    Attributes:
+        _memory_budget  (int):                              Bytes máximos en ensamblaje por conexión.
+        _max_per_peer   (int):                              Ensamblajes en curso máximos por conexión.
+        _timeout_sec    (int):                              Tiempo máximo para completar un bloque.
+        _assemblies     (Dict[Tuple[str, str], _PartialBlock]): Ensamblajes en curso por (peer_id, block_hash).
+
+    Methods:
+        decode_chunk(payload) -> List[Transaction]: (Estático, CPU: se ejecuta fuera del event loop)
+            Deserializa las transacciones del fragmento (re-hashea cada TX) y verifica su checksum.
+            ValueError si el fragmento viene vacío o no coincide.
+
+        add_chunk(payload, peer_id, chunk_txs) -> Optional[Tuple[Dict, List[Transaction]]]: Aplica un fragmento
+            ya decodificado (solo contabilidad, en el event loop, en el orden de llegada del par).
+            1. Purgar ensamblajes expirados.
+            2. Obtener (o iniciar, si es el fragmento 0 y la conexión no llegó a su máximo de ensamblajes) el ensamblaje del bloque.
+            3. Validar el orden del fragmento.
+            4. Aplicar el tamaño máximo de bloque y el presupuesto de memoria de la conexión.
+            5. Si es el último fragmento: retornar la cabecera y las transacciones del bloque
+               (BlockDeserializer.from_header_and_transactions verifica Merkle Root y hash, fuera del event loop).
+            (Ante cualquier error, descarta el ensamblaje y lanza ValueError.)
+
+        prune_expired(): Descarta los ensamblajes que superaron el tiempo máximo (también desde el mantenimiento
+            periódico: un par que dejó de enviar no retiene su presupuesto hasta que llegue otro fragmento).
+
+        discard(peer_id, block_hash): Descarta un ensamblaje (ej. un fragmento que no pasó 'decode_chunk').
+
+        discard_peer(peer_id): Descarta todos los ensamblajes de una conexión (al desconectarse).
+'''
+
+import time
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+# Importaciones de la arquitectura
+from core.models.transaction import Transaction
+from core.p2p.block_chunker import BlockChunker
+from core.p2p.payloads.block_chunk_payload import BlockChunkPayload
+from core.deserializers.transaction_deserializer import TransactionDeserializer
+from core.utils.transaction_utils import TransactionUtils
+
+# Importacion de la configuracion
+from config import Config
+
+@dataclass(slots = True)
+class _PartialBlock:
+    header: Dict[str, Any]
+    started_at: float
+    next_index: int = 0
+    size_bytes: int = 0
+    transactions: List[Transaction] = field(default_factory = list)
+
+class BlockAssembler:
+
+    def __init__(self,
+                 memory_budget: int = Config.NETWORK_BLOCK_ASSEMBLY_BUDGET,
+                 timeout_sec: int = Config.NETWORK_BLOCK_ASSEMBLY_TIMEOUT_SEC,
+                 max_per_peer: int = Config.NETWORK_MAX_ASSEMBLIES_PER_PEER):
+        self._memory_budget = memory_budget
+        self._timeout_sec = timeout_sec
+        self._max_per_peer = max_per_peer
+        self._assemblies: Dict[Tuple[str, str], _PartialBlock] = {}
+
+    @staticmethod
+    def decode_chunk(payload: BlockChunkPayload) -> List[Transaction]:
+        try:
+            if not payload.transactions:
+                raise ValueError('Fragmento vacío.')
+
+            # Se verifican los hashes de cada TX al deserializar.
+            chunk_txs: List[Transaction] = [TransactionDeserializer.from_dict(tx_data) for tx_data in payload.transactions]
+
+            if BlockChunker.calculate_checksum([tx.tx_hash for tx in chunk_txs]) != payload.checksum:
+                raise ValueError('Checksum del fragmento no coincide.')
+            return chunk_txs
+
+        except (ValueError, TypeError, KeyError) as e:
+            raise ValueError(f'Fragmento {payload.chunk_index} de {payload.block_hash[:6]} inválido. {e}')
+
+    def add_chunk(self, payload: BlockChunkPayload, peer_id: str,
+                  chunk_txs: List[Transaction]) -> Optional[Tuple[Dict[str, Any], List[Transaction]]]:
+        self.prune_expired()
+        key = (peer_id, payload.block_hash)
+
+        # 1. Obtener o iniciar el ensamblaje.
+        partial = self._assemblies.get(key)
+        if partial is None:
+            if payload.chunk_index != 0 or payload.header is None:
+                raise ValueError(f'Fragmento {payload.chunk_index} sin ensamblaje iniciado.')
+            if sum(1 for owner, _h in self._assemblies if owner == peer_id) >= self._max_per_peer:
+                raise ValueError(f'Demasiados bloques fragmentados en curso ({self._max_per_peer}).')
+            partial = _PartialBlock(header = payload.header, started_at = time.time())
+            self._assemblies[key] = partial
+
+        try:
+            # 2. Orden estricto (TCP garantiza el orden del emisor).
+            if payload.chunk_index != partial.next_index:
+                raise ValueError(f'Fragmento fuera de orden (esperado {partial.next_index}, recibido {payload.chunk_index}).')
+
+            # 3. Tamaño máximo de bloque y presupuesto de memoria por conexión.
+            partial.size_bytes += sum(TransactionUtils.estimate_size(tx.entries) for tx in chunk_txs)
+            if partial.size_bytes > Config.BLOCK_MAX_SIZE_BYTES:
+                raise ValueError(f'El bloque supera el tamaño máximo ({Config.BLOCK_MAX_SIZE_BYTES} bytes).')
+            if self._peer_usage(peer_id) > self._memory_budget:
+                raise ValueError(f'Presupuesto de memoria de ensamblaje excedido ({self._memory_budget} bytes).')
+
+            partial.transactions.extend(chunk_txs)
+            partial.next_index += 1
+
+        except ValueError as e:
+            self._assemblies.pop(key, None)
+            raise ValueError(f'Bloque fragmentado {payload.block_hash[:6]} descartado. {e}')
+
+        if not payload.is_last:
+            return None
+
+        # 4. Bloque completo: la reconstrucción (Merkle Root y hash) la hace quien llama, fuera del event loop.
+        del self._assemblies[key]
+        return partial.header, partial.transactions
+
+    def prune_expired(self) -> None:
+        now = time.time()
+        expired = [k for k, p in self._assemblies.items() if now - p.started_at > self._timeout_sec]
+        for key in expired:
+            logging.warning(f'BlockAssembler: Ensamblaje de {key[1][:6]} (par {key[0]}) expirado. Descartado.')
+            del self._assemblies[key]
+
+    def discard(self, peer_id: str, block_hash: str) -> None:
+        self._assemblies.pop((peer_id, block_hash), None)
+
+    def discard_peer(self, peer_id: str) -> None:
+        for key in [k for k in self._assemblies if k[0] == peer_id]:
+            del self._assemblies[key]
+
+    # --- Helpers ---
+
+    def _peer_usage(self, peer_id: str) -> int:
+        return sum(p.size_bytes for (owner, _h), p in self._assemblies.items() if owner == peer_id)
\ No newline at end of file
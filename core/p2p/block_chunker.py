@@ -0,0 +1,77 @@
+# network_of_interactive_nodes/core/p2p/block_chunker.py
+'''
+class BlockChunker:
+    Herramienta estática que divide un Block en fragmentos acotados ('blockchunk') para transferirlo por streaming.
+    Evita que un bloque grande viaje en un único mensaje de hasta NETWORK_MAX_PAYLOAD_SIZE.
+
+    Methods:
+        iter_chunks(block, max_chunk_bytes) -> Iterator[BlockChunkPayload]: Genera los fragmentos de forma perezosa.
+            1. Serializar las transacciones una a una (sin materializar todo el bloque).
+            2. Acumular transacciones hasta alcanzar 'max_chunk_bytes' (mínimo una por fragmento).
+            3. Calcular el checksum del fragmento (calculate_checksum).
+            4. Emitir el fragmento (la cabecera viaja solo en el fragmento 0).
+            5. Marcar el último fragmento con 'is_last'.
+
+        calculate_checksum(tx_hashes) -> str: SHA-256 (hex) sobre los tx_hash concatenados del fragmento.
+'''
+
+import json
+import hashlib
+from typing import Any, Dict, Iterator, List
+
+# Importaciones de la arquitectura
+from core.models.block import Block
+from core.p2p.payloads.block_chunk_payload import BlockChunkPayload
+from core.serializers.block_header_serializer import BlockHeaderSerializer
+from core.serializers.transaction_serializer import TransactionSerializer
+
+# Importacion de la configuracion
+from config import Config
+
+class BlockChunker:
+
+    @staticmethod
+    def calculate_checksum(tx_hashes: List[str]) -> str:
+        return hashlib.sha256(''.join(tx_hashes).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def iter_chunks(block: Block, max_chunk_bytes: int = Config.NETWORK_BLOCK_CHUNK_SIZE) -> Iterator[BlockChunkPayload]:
+
+        header: Dict[str, Any] = BlockHeaderSerializer.to_dict(block)
+        header['mining_time'] = block.mining_time
+
+        chunk_index: int = 0
+        chunk_txs: List[Dict[str, Any]] = []
+        chunk_hashes: List[str] = []
+        chunk_bytes: int = 0
+
+        for position, tx in enumerate(block.data):
+            tx_dict = TransactionSerializer.to_dict(tx)
+            tx_bytes = len(json.dumps(tx_dict, sort_keys = True))
+
+            # Cerrar el fragmento actual si la siguiente TX lo haría exceder el límite.
+            if chunk_txs and chunk_bytes + tx_bytes > max_chunk_bytes:
+                yield BlockChunkPayload(
+                    block_hash = block.hash,
+                    chunk_index = chunk_index,
+                    is_last = False,
+                    checksum = BlockChunker.calculate_checksum(chunk_hashes),
+                    transactions = chunk_txs,
+                    header = header if chunk_index == 0 else None
+                )
+                chunk_index += 1
+                chunk_txs, chunk_hashes, chunk_bytes = [], [], 0
+
+            chunk_txs.append(tx_dict)
+            chunk_hashes.append(tx.tx_hash)
+            chunk_bytes += tx_bytes
+
+            if position == len(block.data) - 1:
+                yield BlockChunkPayload(
+                    block_hash = block.hash,
+                    chunk_index = chunk_index,
+                    is_last = True,
+                    checksum = BlockChunker.calculate_checksum(chunk_hashes),
+                    transactions = chunk_txs,
+                    header = header if chunk_index == 0 else None
+                )
@@ -0,0 +1,229 @@
+# network_of_interactive_nodes/core/p2p/block_download_scheduler.py
+'''
+class BlockDownloadScheduler:
+    Planificador de descarga de bloques durante la sincronización (Headers First).
+
+    Antes: todos los bloques faltantes se pedían en un único 'getdata' al par que envió los headers;
+    la descarga quedaba limitada a su ancho de banda y, si se detenía, se detenía toda la sincronización.
+    Ahora: una ventana deslizante de bloques en vuelo repartida entre todos los pares que nos enviaron
+    esos headers, con límite por par, reasignación por tiempo de espera y conexión en orden.
+
+    Attributes:
+        _p2p_service    (P2PService):               Transporte ('getdata' y pares conectados).
+        _blockchain     (Blockchain):               Para saltar bloques que ya llegaron por otra vía (gossip).
+        _validator_role (IBlockValidatorRole):      Conecta los bloques (pool de validación + commit ordenado).
+        _window         (int):                      Bloques (desde el siguiente a conectar) que pueden estar pedidos a la vez.
+        _per_peer_limit (int):                      Bloques en vuelo máximos por par.
+        _timeout_sec    (float):                    Espera máxima por un bloque antes de pedirlo a otro par.
+        _order          (Deque[str]):               Hashes pendientes de conectar, en orden de la cadena.
+        _candidates     (Dict[str, Set[str]]):      hash -> pares que anunciaron su header (pueden servirlo).
+        _sources        (Set[str]):                 Pares que enviaron headers para la descarga en curso.
+        _stalls         (Dict[str, int]):           Pedidos expirados por par (los pares lentos se eligen al final).
+        _in_flight      (Dict[str, _InFlight]):     hash -> par al que se pidió y cuándo.
+        _buffered       (Dict[str, Tuple[Block, str]]): Bloques recibidos fuera de orden (esperan a su antecesor), con quién los envió.
+        _stats          (Dict[str, int]):           Contadores para métricas.
+
+    Methods:
+        enqueue(block_hashes, peer_id): Añade bloques a descargar (en orden) y registra al par como fuente.
+            1. Registrar los hashes nuevos al final del orden y al par como candidato de todos ellos.
+            2. Planificar pedidos y arrancar la revisión de tiempos de espera.
+
+        on_block_received(block, peer_id) -> bool: Entrega un bloque recibido. False si no es de la sincronización
+            (el gossip lo procesa como siempre).
+            1. Sacarlo de 'en vuelo' y guardarlo en el búfer.
+            2. Conectar en orden los bloques consecutivos disponibles desde el inicio de la ventana
+               (un bloque inválido por su contenido penaliza a quien lo envió: 'invalid_block').
+            3. Planificar nuevos pedidos (la ventana avanzó).
+
+        get_metrics() -> Dict: Pendientes, en vuelo, en búfer y contadores (pedidos, recibidos, conectados, expirados).
+
+        _schedule(avoid): (Privado) Pide los bloques de la ventana que no están en vuelo.
+            1. Por cada hash de la ventana sin pedir: elegir el candidato conectado con menos pedidos expirados
+               y que antes lo entregaría ((en vuelo + 1) x RTT del par, medido con 'ping'), bajo el límite por par
+               y evitando al par que lo dejó expirar si hay otro.
+            2. Agrupar por par y enviar un 'getdata' a cada uno.
+
+        _timeout_loop(): (Privado) Mientras haya trabajo, libera los pedidos expirados (o de pares desconectados)
+            y los reasigna a otro par. Si ningún par conectado puede servir el siguiente bloque, abandona
+            la descarga (los próximos headers la reanudan).
+'''
+
+import time
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+# Importaciones de la arquitectura
+from core.interfaces.i_node_roles import IBlockValidatorRole
+from core.models.blockchain import Blockchain
+from core.models.block import Block
+from core.p2p.p2p_service import P2PService
+from core.p2p.payloads.get_data_payload import GetDataPayload
+from core.p2p.payloads.inv_vector import InvVector
+
+# Importacion de la configuracion
+from config import Config
+
+@dataclass(slots = True)
+class _InFlight:
+    peer_id: str
+    requested_at: float
+
+class BlockDownloadScheduler:
+
+    def __init__(self,
+                 p2p_service: P2PService,
+                 blockchain: Blockchain,
+                 validator_role: IBlockValidatorRole,
+                 window: int = Config.SYNC_BLOCK_DOWNLOAD_WINDOW,
+                 per_peer_limit: int = Config.SYNC_MAX_BLOCKS_IN_FLIGHT_PER_PEER,
+                 timeout_sec: float = Config.SYNC_BLOCK_TIMEOUT_SEC):
+        self._p2p_service = p2p_service
+        self._blockchain = blockchain
+        self._validator_role = validator_role
+        self._window = window
+        self._per_peer_limit = per_peer_limit
+        self._timeout_sec = timeout_sec
+
+        self._order: Deque[str] = deque()
+        self._candidates: Dict[str, Set[str]] = {}
+        self._sources: Set[str] = set()
+        self._stalls: Dict[str, int] = {}
+        self._in_flight: Dict[str, _InFlight] = {}
+        self._buffered: Dict[str, Tuple[Block, str]] = {}
+        self._timeout_task: Optional[asyncio.Task[None]] = None
+        self._stats: Dict[str, int] = {'requested': 0, 'received': 0, 'connected': 0, 'rejected': 0, 'timeouts': 0}
+
+    # --- API Pública ---
+
+    def enqueue(self, block_hashes: List[str], peer_id: str) -> None:
+        # 1. Orden de la cadena y fuentes posibles.
+        for block_hash in block_hashes:
+            if block_hash not in self._candidates:
+                self._candidates[block_hash] = set()
+                self._order.append(block_hash)
+            self._candidates[block_hash].add(peer_id)
+        self._sources.add(peer_id)
+
+        # 2. Pedidos y vigilancia de tiempos.
+        self._schedule()
+        if self._timeout_task is None or self._timeout_task.done():
+            self._timeout_task = asyncio.create_task(self._timeout_loop())
+
+    def on_block_received(self, block: Block, peer_id: str) -> bool:
+        if block.hash not in self._candidates: return False
+
+        # 1. Al búfer (un duplicado tardío de un pedido reasignado se ignora).
+        self._in_flight.pop(block.hash, None)
+        if block.hash not in self._buffered:
+            self._buffered[block.hash] = (block, peer_id)
+            self._stats['received'] += 1
+
+        # 2. y 3. Conectar en orden y avanzar la ventana.
+        self._connect_ready()
+        self._schedule()
+        return True
+
+    def get_metrics(self) -> Dict[str, Any]:
+        metrics: Dict[str, Any] = dict(self._stats)
+        metrics.update({'pending': len(self._order), 'in_flight': len(self._in_flight), 'buffered': len(self._buffered)})
+        return metrics
+
+    # --- Helpers ---
+
+    def _connect_ready(self) -> None:
+        while self._order:
+            head = self._order[0]
+            received = self._buffered.pop(head, None)
+
+            if received is None and self._blockchain.get_height_of(head) is None:
+                return
+
+            # Listo (o ya conectado por otra vía): sale de la ventana.
+            self._order.popleft()
+            self._candidates.pop(head, None)
+            self._in_flight.pop(head, None)
+            if received is not None:
+                # Las tareas se crean en orden: el commit ordenado del validador conecta en ese orden.
+                asyncio.create_task(self._connect(*received))
+
+    async def _connect(self, block: Block, peer_id: str) -> None:
+        if await self._validator_role.validate_block_rules_async(block):
+            self._stats['connected'] += 1
+        else:
+            self._stats['rejected'] += 1
+            logging.warning(f'Sync: Bloque {block.index} ({block.hash[:6]}) descargado pero no conectado.')
+            if self._validator_role.is_known_invalid_block(block):
+                self._p2p_service.report_misbehavior(peer_id, 'invalid_block')
+
+    def _schedule(self, avoid: Optional[Dict[str, str]] = None) -> None:
+        now = time.monotonic()
+        load: Dict[str, int] = {}
+        for in_flight in self._in_flight.values():
+            load[in_flight.peer_id] = load.get(in_flight.peer_id, 0) + 1
+
+        # Cupo libre de los pares fuente conectados: sin cupo no hace falta recorrer la ventana.
+        sources = {peer_id for peer_id in self._sources if self._p2p_service.get_peer(peer_id) is not None}
+        free_slots = sum(max(0, self._per_peer_limit - load.get(peer_id, 0)) for peer_id in sources)
+
+        # 1. Asignar los huecos de la ventana.
+        requests: Dict[str, List[InvVector]] = {}
+        for block_hash in islice(self._order, self._window):
+            if free_slots <= 0: break
+            if block_hash in self._in_flight or block_hash in self._buffered: continue
+
+            peer_id = self._pick_peer(block_hash, load, (avoid or {}).get(block_hash))
+            if peer_id is None: continue
+
+            self._in_flight[block_hash] = _InFlight(peer_id = peer_id, requested_at = now)
+            load[peer_id] = load.get(peer_id, 0) + 1
+            free_slots -= 1
+            requests.setdefault(peer_id, []).append(InvVector(type = 2, hash = block_hash))
+
+        # 2. Un 'getdata' por par.
+        for peer_id, inventory in requests.items():
+            peer = self._p2p_service.get_peer(peer_id)
+            if peer is None: continue
+            self._stats['requested'] += len(inventory)
+            asyncio.create_task(self._p2p_service.send_message(peer, 'getdata', GetDataPayload(inventory = inventory)))
+
+    def _pick_peer(self, block_hash: str, load: Dict[str, int], avoid: Optional[str]) -> Optional[str]:
+        rtt_ms: Dict[str, float] = {}
+        for peer_id in self._candidates.get(block_hash, ()):
+            peer = self._p2p_service.get_peer(peer_id)
+            if peer is not None and load.get(peer_id, 0) < self._per_peer_limit:
+                rtt_ms[peer_id] = peer.latency.rtt_ms if peer.latency.rtt_ms is not None else Config.NETWORK_DEFAULT_RTT_MS
+
+        preferred = [peer_id for peer_id in rtt_ms if peer_id != avoid] or list(rtt_ms)
+        # Primero los pares que menos pedidos dejaron expirar; luego el que antes lo entregaría (cola x latencia).
+        return min(preferred, key = lambda peer_id: (self._stalls.get(peer_id, 0), (load.get(peer_id, 0) + 1) * rtt_ms[peer_id]), default = None)
+
+    async def _timeout_loop(self) -> None:
+        while self._order:
+            await asyncio.sleep(self._timeout_sec / 2)
+            now = time.monotonic()
+
+            if self._order and not self._in_flight and not self._has_reachable_head():
+                logging.warning(f'Sync: Ningún par conectado puede servir los {len(self._order)} bloques pendientes. Descarga abandonada.')
+                self._order.clear(); self._candidates.clear(); self._buffered.clear(); self._sources.clear(); self._stalls.clear()
+                return
+
+            expired: Dict[str, str] = {
+                block_hash: in_flight.peer_id for block_hash, in_flight in self._in_flight.items()
+                if now - in_flight.requested_at > self._timeout_sec or self._p2p_service.get_peer(in_flight.peer_id) is None
+            }
+            if not expired: continue
+
+            for block_hash, peer_id in expired.items():
+                del self._in_flight[block_hash]
+                self._stalls[peer_id] = self._stalls.get(peer_id, 0) + 1
+            self._stats['timeouts'] += len(expired)
+            logging.warning(f'Sync: {len(expired)} bloques sin respuesta a tiempo. Reasignando a otros pares...')
+            self._schedule(avoid = expired)
+
+    def _has_reachable_head(self) -> bool:
+        candidates = self._candidates.get(self._order[0], set())
+        return any(self._p2p_service.get_peer(peer_id) is not None for peer_id in candidates)
\ No newline at end of file
@@ -0,0 +1,176 @@
+# network_of_interactive_nodes/core/p2p/compact_block_assembler.py
+'''
+class CompactBlockAssembler:
+    Reconstruye los bloques compactos ('cmpctblock') con las transacciones de la Mempool local.
+    Si faltan TXs, guarda el bloque parcial hasta que llega la respuesta 'blocktxn' del emisor.
+
+    Attributes:
+        _timeout_sec    (int):                                          Tiempo máximo de espera de las TXs faltantes.
+        _max_per_peer   (int):                                          Reconstrucciones en curso máximas por conexión.
+        _pending        (Dict[Tuple[str, str], _PendingCompactBlock]):  Reconstrucciones en curso por (peer_id, block_hash).
+
+    Methods:
+        verify_header(header) -> bool: (Estático) Recalcula el hash de la cabecera y comprueba su PoW
+            ANTES de indexar la Mempool. ValueError si la cabecera está malformada o su hash no coincide.
+
+        reconstruct(payload, mempool_index) -> Tuple[Optional[Block], List[Optional[Transaction]]]:
+            (Estático, CPU: se ejecuta fuera del event loop) Reconstruye un bloque compacto.
+            1. Ubicar las TXs completas (prefilled, se deserializan) y resolver los IDs cortos contra el índice de la Mempool.
+            2. Si no falta ninguna: reconstruir y retornar el Block (verifica Merkle Root y hash).
+               Si el Merkle Root no coincide (colisión de IDs cortos), retorna (None, posiciones sin huecos): pedir el bloque completo.
+            3. Si faltan: retorna (None, posiciones) con las faltantes en None.
+            (Ante un payload malformado lanza ValueError: el emisor se porta mal.)
+
+        start(payload, peer_id, slots) -> List[int]: Guarda el parcial de 'reconstruct' a la espera de 'blocktxn'.
+            1. Purgar reconstrucciones expiradas.
+            2. Guardar el parcial (descartando el más viejo del par si supera Config.NETWORK_MAX_PENDING_COMPACT_PER_PEER).
+            3. Retornar las posiciones faltantes (para 'getblocktxn').
+
+        take_pending(peer_id, block_hash) -> Optional[Tuple[Dict, List[Optional[Transaction]]]]: Retira un parcial
+            (cabecera y posiciones) para completarlo con la respuesta 'blocktxn'. None si no hay ninguno en curso.
+
+        complete(header, slots, payload) -> Block: (Estático, CPU: se ejecuta fuera del event loop)
+            Completa un parcial con la respuesta 'blocktxn' (deserializa sus TXs; ValueError si no encaja).
+
+        prune_expired(): Descarta las reconstrucciones que superaron el tiempo máximo (también desde el mantenimiento periódico).
+
+        discard_peer(peer_id): Descarta las reconstrucciones de una conexión (al desconectarse).
+'''
+
+import time
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+# Importaciones de la arquitectura
+from core.models.block import Block
+from core.models.transaction import Transaction
+from core.p2p.payloads.compact_block_payload import CompactBlockPayload
+from core.p2p.payloads.block_txn_payload import BlockTxnPayload
+from core.deserializers.block_deserializer import BlockDeserializer
+from core.deserializers.transaction_deserializer import TransactionDeserializer
+from core.hashing.block_hasher import BlockHasher
+from core.dto.block_hashing_data import BlockHashingData
+from core.utils.difficulty_utils import DifficultyUtils
+
+# Importacion de la configuracion
+from config import Config
+
+@dataclass(slots = True)
+class _PendingCompactBlock:
+    header: Dict
+    slots: List[Optional[Transaction]]
+    started_at: float
+
+class CompactBlockAssembler:
+
+    def __init__(self,
+                 timeout_sec: int = Config.NETWORK_BLOCK_ASSEMBLY_TIMEOUT_SEC,
+                 max_per_peer: int = Config.NETWORK_MAX_PENDING_COMPACT_PER_PEER):
+        self._timeout_sec = timeout_sec
+        self._max_per_peer = max_per_peer
+        self._pending: Dict[Tuple[str, str], _PendingCompactBlock] = {}
+
+    @staticmethod
+    def verify_header(header: Dict) -> bool:
+        try:
+            hashing_dto = BlockHashingData(
+                index = int(header['index']),
+                timestamp = int(header['timestamp']),
+                previous_hash = header.get('previous_hash'),
+                bits = header['bits'],
+                merkle_root = header['merkle_root'],
+                nonce = int(header['nonce'])
+            )
+            calculated_hash = BlockHasher.calculate(hashing_dto)
+            target = DifficultyUtils.bits_to_target(header['bits'])
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f'Cabecera de bloque compacto malformada. {e}')
+
+        if calculated_hash != header['hash']:
+            raise ValueError('Cabecera de bloque compacto: el hash no coincide.')
+        return int(calculated_hash, 16) <= target
+
+    @staticmethod
+    def reconstruct(payload: CompactBlockPayload,
+                    mempool_index: Dict[str, Optional[Transaction]]) -> Tuple[Optional[Block], List[Optional[Transaction]]]:
+        try:
+            block_hash: str = payload.header['hash']
+
+            # 1. Posiciones: primero las TXs completas, luego los IDs cortos en los huecos, en orden.
+            slots: List[Optional[Transaction]] = [None] * (len(payload.short_ids) + len(payload.prefilled))
+            prefilled_positions = set()
+            for item in payload.prefilled:
+                position = int(item['index'])
+                slots[position] = TransactionDeserializer.from_dict(item['tx'])
+                prefilled_positions.add(position)
+
+            short_ids = iter(payload.short_ids)
+            for position in range(len(slots)):
+                if position in prefilled_positions: continue
+                slots[position] = mempool_index.get(next(short_ids))
+
+        except (KeyError, IndexError, TypeError, ValueError, StopIteration) as e:
+            raise ValueError(f'Bloque compacto malformado. {e}')
+
+        if any(tx is None for tx in slots):
+            return None, slots
+
+        # 2. Completo con la Mempool: sin ida y vuelta adicional.
+        try:
+            return CompactBlockAssembler._build(payload.header, slots), slots
+        except ValueError as e:
+            logging.info(f'CompactBlockAssembler: Bloque compacto {block_hash[:6]} no reconstruible con la Mempool. {e}')
+            return None, slots
+
+    def start(self, payload: CompactBlockPayload, peer_id: str, slots: List[Optional[Transaction]]) -> List[int]:
+        self.prune_expired()
+        block_hash: str = payload.header['hash']
+
+        # 2. Esperar las TXs faltantes (acotado por par: el más viejo cede su lugar).
+        peer_keys = [k for k in self._pending if k[0] == peer_id and k[1] != block_hash]
+        for key in peer_keys[:max(0, len(peer_keys) - self._max_per_peer + 1)]:
+            logging.warning(f'CompactBlockAssembler: Demasiados bloques compactos pendientes de {peer_id}. Se descarta {key[1][:6]}.')
+            del self._pending[key]
+
+        self._pending[(peer_id, block_hash)] = _PendingCompactBlock(
+            header = payload.header, slots = slots, started_at = time.time()
+        )
+        return [position for position, tx in enumerate(slots) if tx is None]
+
+    def take_pending(self, peer_id: str, block_hash: str) -> Optional[Tuple[Dict, List[Optional[Transaction]]]]:
+        partial = self._pending.pop((peer_id, block_hash), None)
+        return (partial.header, partial.slots) if partial is not None else None
+
+    @staticmethod
+    def complete(header: Dict, slots: List[Optional[Transaction]], payload: BlockTxnPayload) -> Block:
+        try:
+            if len(payload.indexes) != len(payload.transactions):
+                raise ValueError('Índices y transacciones no coinciden.')
+            for position, tx_data in zip(payload.indexes, payload.transactions):
+                slots[position] = TransactionDeserializer.from_dict(tx_data)
+
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            raise ValueError(f'Respuesta blocktxn malformada. {e}')
+
+        if any(tx is None for tx in slots):
+            raise ValueError('Respuesta blocktxn incompleta.')
+        return CompactBlockAssembler._build(header, slots)
+
+    def prune_expired(self) -> None:
+        now = time.time()
+        expired = [k for k, p in self._pending.items() if now - p.started_at > self._timeout_sec]
+        for key in expired:
+            logging.warning(f'CompactBlockAssembler: Bloque compacto {key[1][:6]} (par {key[0]}) expirado. Descartado.')
+            del self._pending[key]
+
+    def discard_peer(self, peer_id: str) -> None:
+        for key in [k for k in self._pending if k[0] == peer_id]:
+            del self._pending[key]
+
+    # --- Helpers ---
+
+    @staticmethod
+    def _build(header: Dict, slots: List[Optional[Transaction]]) -> Block:
+        # Verifica Merkle Root y hash: un ID corto resuelto a la TX equivocada no pasa.
+        return BlockDeserializer.from_header_and_transactions(header, [tx for tx in slots if tx is not None])
\ No newline at end of file
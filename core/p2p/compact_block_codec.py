@@ -0,0 +1,67 @@
+# network_of_interactive_nodes/core/p2p/compact_block_codec.py
+'''
+class CompactBlockCodec:
+    Lógica pura de los bloques compactos ('cmpctblock'): IDs cortos con sal para las transacciones.
+
+    El ID corto de una TX es un BLAKE2b de 6 bytes de su tx_hash, con clave SHA-256(block_hash : sal).
+    La clave cambia en cada bloque y cada envío, por lo que nadie puede preparar TXs que colisionen.
+    Una colisión accidental (o con la Mempool del receptor) se detecta al verificar el Merkle Root.
+
+    Constants:
+        SHORT_ID_BYTES  (int):  Tamaño del ID corto (6 bytes = 12 caracteres hex).
+
+    Methods:
+        encode(block, salt) -> CompactBlockPayload: Construye el bloque compacto.
+            1. Cabecera del bloque (con 'mining_time', como en los 'blockchunk').
+            2. La coinbase (posición 0) viaja completa; el resto como IDs cortos en el orden del bloque.
+
+        derive_key(block_hash, salt) -> bytes: Clave de los IDs cortos de un bloque.
+
+        short_id(key, tx_hash) -> str: ID corto (hex) de una TX.
+
+        index_transactions(transactions, key) -> Dict[str, Optional[Transaction]]: ID corto -> TX
+            (None si dos TXs de la Mempool comparten ID: esa posición se pide al emisor).
+'''
+
+import random
+import hashlib
+from typing import Any, Dict, Iterable, Optional
+
+# Importaciones de la arquitectura
+from core.models.block import Block
+from core.models.transaction import Transaction
+from core.p2p.payloads.compact_block_payload import CompactBlockPayload
+from core.serializers.block_header_serializer import BlockHeaderSerializer
+from core.serializers.transaction_serializer import TransactionSerializer
+
+class CompactBlockCodec:
+
+    SHORT_ID_BYTES: int = 6
+
+    @staticmethod
+    def encode(block: Block, salt: Optional[int] = None) -> CompactBlockPayload:
+        salt = salt if salt is not None else random.getrandbits(64)
+        key = CompactBlockCodec.derive_key(block.hash, salt)
+
+        header: Dict[str, Any] = BlockHeaderSerializer.to_dict(block)
+        header['mining_time'] = block.mining_time
+
+        prefilled = [{'index': 0, 'tx': TransactionSerializer.to_dict(block.data[0])}] if block.data else []
+        short_ids = [CompactBlockCodec.short_id(key, tx.tx_hash) for tx in block.data[1:]]
+        return CompactBlockPayload(header = header, salt = salt, short_ids = short_ids, prefilled = prefilled)
+
+    @staticmethod
+    def derive_key(block_hash: str, salt: int) -> bytes:
+        return hashlib.sha256(f'{block_hash}:{salt}'.encode('utf-8')).digest()
+
+    @staticmethod
+    def short_id(key: bytes, tx_hash: str) -> str:
+        return hashlib.blake2b(tx_hash.encode('utf-8'), key = key, digest_size = CompactBlockCodec.SHORT_ID_BYTES).hexdigest()
+
+    @staticmethod
+    def index_transactions(transactions: Iterable[Transaction], key: bytes) -> Dict[str, Optional[Transaction]]:
+        index: Dict[str, Optional[Transaction]] = {}
+        for tx in transactions:
+            short_id = CompactBlockCodec.short_id(key, tx.tx_hash)
+            index[short_id] = None if short_id in index else tx
+        return index
\ No newline at end of file
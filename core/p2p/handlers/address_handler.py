@@ -0,0 +1,92 @@
+# core/p2p/handlers/address_handler.py
+'''
+class AddressHandler:
+    Estrategia (Handler) especializada en el descubrimiento de pares.
+
+    Responsabilidad:
+        Manejar los mensajes 'getaddr' y 'addr' y aprender la dirección de escucha de cada par desde su 'version'.
+        Así los nodos se conocen entre sí aunque cada uno arranque con un único seed, y la libreta
+        (AddressManager) tiene a quién reconectarse cuando un par se cae.
+
+    Attributes:
+        _p2p_service (P2PService): Transporte (pares conectados y libreta de direcciones).
+        _address_manager (AddressManager): Libreta de direcciones ('peers.dat').
+
+    Methods:
+        handle_version(payload, peer) -> None:
+            1. Registrar la dirección de escucha del par (host de la conexión + 'listen_port' de su 'version').
+            2. Si es nueva, anunciarla a unos pocos pares ('addr' de una dirección).
+            3. Si la conexión es saliente, pedir sus direcciones ('getaddr').
+
+        handle_get_addr(peer) -> None: Responde 'addr' con una muestra de la libreta (AddressManager.get_addresses).
+
+        handle_addr(payload, peer) -> None:
+            1. Registrar las direcciones válidas (hasta Config.NETWORK_MAX_ADDR_PER_MESSAGE).
+            2. Si es un anuncio corto (hasta Config.NETWORK_ADDR_RELAY_MAX), reenviar las nuevas
+               a Config.NETWORK_ADDR_RELAY_FANOUT pares al azar (excepto el emisor).
+'''
+
+import random
+import logging
+import asyncio
+from typing import Any, Dict, List
+
+# --- Importaciones de P2P ---
+from core.p2p.p2p_service import P2PService
+from core.p2p.peer import Peer
+from core.p2p.address_manager import AddressManager
+from core.p2p.payloads.version_payload import VersionPayload
+from core.p2p.payloads.get_addr_payload import GetAddrPayload
+from core.p2p.payloads.addr_payload import AddrPayload
+
+# Importacion de la configuracion
+from config import Config
+
+class AddressHandler:
+
+    def __init__(self, p2p_service: P2PService, address_manager: AddressManager):
+        self._p2p_service = p2p_service
+        self._address_manager = address_manager
+        logging.info("AddressHandler (Descubrimiento de pares) inicializado.")
+
+    # --- Handlers de Mensajes ---
+
+    def handle_version(self, payload: VersionPayload, peer: Peer) -> None:
+        '''El par nos dijo dónde escucha: registrarlo y pedirle a quién conoce.'''
+        # 1. y 2. Dirección de escucha (la de una conexión entrante es un puerto efímero).
+        if 0 < payload.listen_port < 65536 and self._p2p_service.note_listen_address(peer, payload.listen_port):
+            self._relay([{'host': peer.host, 'port': payload.listen_port, 'timestamp': payload.timestamp}], peer)
+
+        # 3. Descubrimiento.
+        if peer.outbound:
+            asyncio.create_task(self._p2p_service.send_message(peer, 'getaddr', GetAddrPayload()))
+
+    def handle_get_addr(self, peer: Peer) -> None:
+        '''Un par nos pide direcciones conocidas.'''
+        addresses = self._address_manager.get_addresses(Config.NETWORK_MAX_ADDR_PER_MESSAGE)
+        if addresses:
+            asyncio.create_task(self._p2p_service.send_message(peer, 'addr', AddrPayload(addresses = addresses)))
+
+    def handle_addr(self, payload: AddrPayload, peer: Peer) -> None:
+        '''Recibimos direcciones: guardarlas y, si es un anuncio, propagarlo.'''
+        # 1. Registrar (descartando entradas malformadas).
+        new_addresses: List[Dict[str, Any]] = []
+        for entry in payload.addresses[:Config.NETWORK_MAX_ADDR_PER_MESSAGE]:
+            host, port, timestamp = entry.get('host'), entry.get('port'), entry.get('timestamp')
+            if not isinstance(host, str) or not host or not isinstance(port, int) or not 0 < port < 65536: continue
+            if self._address_manager.add(host, port, timestamp if isinstance(timestamp, (int, float)) else None):
+                new_addresses.append({'host': host, 'port': port, 'timestamp': timestamp})
+
+        if new_addresses:
+            logging.info(f'Direcciones: {len(new_addresses)} pares nuevos aprendidos de {peer.host}.')
+
+        # 2. Reenviar anuncios cortos.
+        if new_addresses and len(payload.addresses) <= Config.NETWORK_ADDR_RELAY_MAX:
+            self._relay(new_addresses, peer)
+
+    # --- Helpers ---
+
+    def _relay(self, addresses: List[Dict[str, Any]], source: Peer) -> None:
+        targets = [p for p in self._p2p_service.get_peers() if p.peer_id != source.peer_id]
+        for target in random.sample(targets, min(Config.NETWORK_ADDR_RELAY_FANOUT, len(targets))):
+            asyncio.create_task(self._p2p_service.send_message(target, 'addr', AddrPayload(addresses = addresses)))
\ No newline at end of file
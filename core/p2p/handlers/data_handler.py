@@ -6,6 +6,7 @@ class DataHandler:
     Responsabilidad:
         Manejar mensajes 'getdata'. Busca los items solicitados (Bloques o TXs)
         en el almacenamiento local (Blockchain/Mempool) y los envía al par solicitante.
+        Sirve también los bloques compactos ('cmpctblock') y sus TXs faltantes ('getblocktxn').
 
     Attributes:
         _blockchain (Blockchain): Referencia al estado de la cadena.
@@ -15,15 +16,30 @@ class DataHandler:
     Methods:
         handle_get_data(payload: GetDataPayload, peer: Peer) -> None:
             1. Itera sobre el inventario solicitado.
-            2. Si piden Bloque (Type 2): Lo busca, serializa y envía mensaje 'block'.
+            2. Si piden Bloque (Type 2): Lo busca y lo encola para envío.
             3. Si piden TX (Type 1): La busca, serializa y envía mensaje 'tx'.
+               Si piden Bloque compacto (Type 3): envía 'cmpctblock' (CompactBlockCodec).
+            4. Envía los bloques encolados en orden, en una sola tarea (_send_blocks).
+            (Todo item enviado queda como conocido por el par: Peer.known_inventory.)
+
+        handle_get_block_txn(payload, peer) -> None: Responde 'blocktxn' con las TXs pedidas de un bloque compacto.
+
+        _send_blocks(peer, blocks) -> None: (Async) Envía los bloques uno tras otro (sus fragmentos no se intercalan).
+
+        _send_block(peer, block) -> None: (Async) Envía un bloque completo.
+            1. Generar los fragmentos de forma perezosa (BlockChunker).
+            2. Si cabe en un solo fragmento: enviar el mensaje 'block' clásico.
+            3. Si no: enviar los 'blockchunk' en orden, esperando 'drain' entre cada uno
+               (el emisor nunca materializa el bloque serializado completo).
 '''
 
 import logging
 import asyncio
+from typing import List
 
 # --- Importaciones de Modelos y Estado ---
 from core.models.blockchain import Blockchain
+from core.models.block import Block
 from core.mempool.mempool import Mempool
 
 # --- Importaciones de P2P ---
@@ -32,6 +48,10 @@ from core.p2p.peer import Peer
 from core.p2p.payloads.get_data_payload import GetDataPayload
 from core.p2p.payloads.block_payload import BlockPayload
 from core.p2p.payloads.tx_payload import TxPayload
+from core.p2p.payloads.get_block_txn_payload import GetBlockTxnPayload
+from core.p2p.payloads.block_txn_payload import BlockTxnPayload
+from core.p2p.block_chunker import BlockChunker
+from core.p2p.compact_block_codec import CompactBlockCodec
 
 # --- Importaciones de Serializadores (Núcleo Estático) ---
 from core.serializers.block_serializer import BlockSerializer
@@ -56,6 +76,8 @@ class DataHandler:
         Procesa una solicitud 'getdata' y responde con los objetos encontrados.
         '''
         
+        blocks_to_send: List[Block] = []
+
         # 1. Iterar sobre cada item solicitado en el inventario del payload.
         for item in payload.inventory:
             
@@ -67,15 +89,22 @@ class DataHandler:
                 block = self._find_block_by_hash(item.hash)
                 
                 if block:
-                    # 3. Si existe, serializarlo a DTO.
-                    block_dict = BlockSerializer.to_dict(block)
-                    block_payload = BlockPayload(block_data=block_dict)
-                    
-                    # 4. Enviar el mensaje 'block' al par solicitante.
+                    # 3. Si existe, encolarlo para enviarlo (fragmentado si es grande).
+                    peer.known_inventory.add(block.hash)
+                    blocks_to_send.append(block)
+            
+            # ---------------------------------------------------------
+            # CASO A2: Solicitud de BLOQUE COMPACTO (Type = 3)
+            # ---------------------------------------------------------
+            elif item.type == 3:
+                block = self._find_block_by_hash(item.hash)
+
+                if block:
+                    peer.known_inventory.add(block.hash)
                     asyncio.create_task(
-                        self._p2p_service.send_message(peer, 'block', block_payload)
+                        self._p2p_service.send_message(peer, 'cmpctblock', CompactBlockCodec.encode(block))
                     )
-            
+
             # ---------------------------------------------------------
             # CASO B: Solicitud de TRANSACCIÓN (Type = 1)
             # ---------------------------------------------------------
@@ -84,6 +113,8 @@ class DataHandler:
                 tx = self._mempool.get_transaction(item.hash)
                 
                 if tx:
+                    peer.known_inventory.add(tx.tx_hash)
+
                     # 6. Si existe, serializarla a DTO.
                     tx_dict = TransactionSerializer.to_dict(tx)
                     tx_payload = TxPayload(tx_data=tx_dict)
@@ -93,11 +124,42 @@ class DataHandler:
                         self._p2p_service.send_message(peer, 'tx', tx_payload)
                     )
 
+        # 8. Enviar los bloques en el orden solicitado.
+        if blocks_to_send:
+            asyncio.create_task(self._send_blocks(peer, blocks_to_send))
+
+    def handle_get_block_txn(self, payload: GetBlockTxnPayload, peer: Peer) -> None:
+        '''El par no encontró en su Mempool algunas TXs de un bloque compacto: enviárselas.'''
+        block = self._find_block_by_hash(payload.block_hash)
+        if block is None: return
+
+        indexes = [i for i in payload.indexes if 0 <= i < len(block.data)]
+        transactions = [TransactionSerializer.to_dict(block.data[i]) for i in indexes]
+        block_txn = BlockTxnPayload(block_hash=block.hash, indexes=indexes, transactions=transactions)
+        asyncio.create_task(self._p2p_service.send_message(peer, 'blocktxn', block_txn))
+
+    async def _send_blocks(self, peer: Peer, blocks: List[Block]) -> None:
+        for block in blocks:
+            await self._send_block(peer, block)
+
+    async def _send_block(self, peer: Peer, block: Block) -> None:
+        chunks = BlockChunker.iter_chunks(block)
+        first_chunk = next(chunks, None)
+
+        if first_chunk is None or first_chunk.is_last:
+            block_payload = BlockPayload(block_data=BlockSerializer.to_dict(block))
+            await self._p2p_service.send_message(peer, 'block', block_payload)
+            return
+
+        await self._p2p_service.send_message(peer, 'blockchunk', first_chunk)
+        sent = 1
+        for chunk in chunks:
+            await self._p2p_service.send_message(peer, 'blockchunk', chunk)
+            sent += 1
+        logging.info(f"DataHandler: Bloque {block.index} enviado a {peer.host} en {sent} fragmentos.")
+
     # --- Método Helper Privado ---
 
     def _find_block_by_hash(self, block_hash: str):
-        '''Helper interno para buscar en la blockchain lineal.'''
-        for block in reversed(self._blockchain.chain):
-            if block.hash == block_hash:
-                return block
-        return None
\ No newline at end of file
+        '''Helper interno para buscar en la blockchain (índice por hash).'''
+        return self._blockchain.get_block_by_hash(block_hash)
\ No newline at end of file
@@ -13,27 +13,77 @@ class GossipHandler:
         _mempool (Mempool): Para verificar si ya tenemos una TX.
         _p2p_service (P2PService): Transporte para enviar mensajes.
         _validator_role (IBlockValidatorRole): El Gestor de Consenso para validar reglas.
+        _download_scheduler (BlockDownloadScheduler | None): Recibe los bloques pedidos por la sincronización.
+        _request_tracker (InventoryRequestTracker): Items pedidos por 'getdata' que aún no llegaron (a quién y cuándo).
+        _compact_assembler (CompactBlockAssembler): Reconstrucción de bloques compactos con la Mempool.
+        _compact_stats (Dict[str, int]): Bloques compactos recibidos, reconstruidos sin ida y vuelta, TXs faltantes, etc.
+        _peer_tails (Dict[str, asyncio.Task]): Último 'block' / 'blockchunk' / 'tx' en curso de cada par: la deserialización
+            (re-hasheo de TXs, Merkle Root y cabecera) corre en paralelo en el pool de validación
+            (IBlockValidatorRole.run_in_validation_pool), pero su resultado se despacha en el orden de llegada del par.
 
     Methods:
-        handle_inv(payload, peer): Procesa inventarios y pide lo que falta via 'getdata'.
+        handle_inv(payload, peer): Procesa inventarios y pide lo que falta via 'getdata'
+            (las TXs recién confirmadas no se vuelven a pedir: IBlockValidatorRole.has_recent_tx).
+            Los items anunciados quedan como conocidos por el par (Peer.known_inventory).
+            Un item ya pedido a otro par no se vuelve a pedir: este par queda como alternativa
+            si el pedido vence (InventoryRequestTracker, reintentos en '_retry_loop').
+            Los bloques anunciados se piden compactos (Type 3 -> 'cmpctblock').
         
         handle_block(payload, peer_id): 
-            1. Deserializa. 
-            2. Delega al Validador. 
+            1. Deserializa (fuera del event loop) y marca el bloque como conocido por el par emisor
+               (si lo pidió la sincronización, lo conecta el BlockDownloadScheduler, en orden). 
+            2. Delega al Validador (asíncrono: pool de validación + commit ordenado, sin bloquear el loop). 
             3. Si es válido, hace broadcast.
+            (Un bloque corrupto, o que el Validador marcó como inválido, penaliza al emisor: 'invalid_block'.
+             Uno ya conocido como inválido no se vuelve a validar.)
             
+        handle_block_chunk(payload, peer_id):
+            1. Deserializa las TXs del fragmento fuera del event loop (BlockAssembler.decode_chunk).
+            2. Lo entrega al BlockAssembler en el orden de llegada (consume sus TXs, con presupuesto de memoria).
+            3. Si el bloque quedó completo, lo reconstruye fuera del event loop (Merkle Root y hash)
+               y lo procesa igual que 'handle_block'.
+
+        handle_compact_block(payload, peer):
+            0. Solo se aceptan los pedidos al par (Type 3) o los de un par al que pedimos que nos empuje sus
+               bloques (P2PService.is_block_push_source); el resto se ignora. La cabecera debe tener un hash
+               íntegro con PoW válido ('malformed_message' / 'invalid_block' si no) y un padre conocido
+               (si no, se pide el bloque completo): indexar la Mempool no es gratis.
+            1. Indexar la Mempool por los IDs cortos del bloque (fuera del event loop).
+            2. Reconstruir el bloque (CompactBlockAssembler.reconstruct, fuera del event loop: deserializa las TXs
+               completas y verifica Merkle Root y hash): si está completo, procesarlo como 'handle_block'.
+            3. Si faltan TXs, pedirlas con 'getblocktxn'. Si no encaja con la Mempool, pedir el bloque completo
+               (un payload malformado penaliza al emisor: 'malformed_message').
+
+        handle_block_txn(payload, peer_id): Completa un bloque compacto con las TXs faltantes (fuera del event loop,
+            en el orden de llegada del par) y lo procesa
+            (si no encaja, pide el bloque completo; si respondía a un 'getblocktxn' en curso, penaliza al emisor:
+             'malformed_message'. Una colisión de IDs cortos también la causa, pero es rara y la puntuación decae).
+
         handle_tx(payload, peer_id): 
-            1. Deserializa. 
-            2. Delega al Validador. 
+            1. Deserializa (fuera del event loop) y marca la TX como conocida por el par emisor. 
+            2. Delega al Validador (asíncrono: pool de validación + commit ordenado, sin bloquear el loop). 
             3. Si es válida, hace broadcast.
+            (Una TX corrupta o inválida por su contenido penaliza al emisor: 'invalid_tx'.)
             
-        broadcast_new_block(block): Crea un 'inv' y lo envía a todos.
-        broadcast_new_tx(tx): Crea un 'inv' y lo envía a todos.
+        handle_peer_disconnected(peer_id): Descarta los bloques fragmentados a medio reensamblar del par
+            (no retiene su parte de Config.NETWORK_BLOCK_ASSEMBLY_BUDGET) y sus bloques compactos a la espera de
+            'blocktxn'. Un fragmento o bloque compacto aún en el pool se ignora.
+
+        prune_expired(): Mantenimiento periódico: descarta los reensamblados (fragmentados y compactos) vencidos
+            aunque no llegue otro mensaje.
+
+        get_metrics() -> Dict: Pedidos 'getdata' (en curso, duplicados evitados, reintentos) y bloques compactos.
+
+        broadcast_new_block(block): Difunde el bloque a los pares que no lo conocen (P2PService.broadcast_block):
+            compacto y directo a los pares de alto ancho de banda, con un 'inv' al resto.
+        broadcast_new_tx(tx): Encola el anuncio de la TX para los pares que no la conocen.
+        broadcast_new_txs(txs): Encola el anuncio de un lote de TXs (P2PService.queue_tx_inventory):
+            cada par las recibe agrupadas con otras en UN 'inv' (goteo periódico o lote lleno).
 '''
 
 import logging
 import asyncio
-from typing import List, Optional
+from typing import Any, Callable, Coroutine, Dict, List, Optional, TypeVar
 
 # --- Importaciones de Interfaces y Estado ---
 from core.interfaces.i_node_roles import IBlockValidatorRole
@@ -50,23 +100,45 @@ from core.p2p.payloads.get_data_payload import GetDataPayload
 from core.p2p.payloads.block_payload import BlockPayload
 from core.p2p.payloads.tx_payload import TxPayload
 from core.p2p.payloads.inv_vector import InvVector
+from core.p2p.payloads.block_chunk_payload import BlockChunkPayload
+from core.p2p.block_assembler import BlockAssembler
+from core.p2p.block_download_scheduler import BlockDownloadScheduler
+from core.p2p.inventory_request_tracker import InventoryRequestTracker
+from core.p2p.compact_block_assembler import CompactBlockAssembler
+from core.p2p.compact_block_codec import CompactBlockCodec
+from core.p2p.payloads.compact_block_payload import CompactBlockPayload
+from core.p2p.payloads.get_block_txn_payload import GetBlockTxnPayload
+from core.p2p.payloads.block_txn_payload import BlockTxnPayload
 
 # --- Importaciones del Núcleo Estático ---
 from core.deserializers.block_deserializer import BlockDeserializer
 from core.deserializers.transaction_deserializer import TransactionDeserializer
 
+# Importacion de la configuracion
+from config import Config
+
+T = TypeVar('T')
+
 class GossipHandler:
 
     def __init__(self, 
                  blockchain: Optional[Blockchain], 
                  mempool: Optional[Mempool], 
                  p2p_service: P2PService,
-                 validator_role: Optional[IBlockValidatorRole]):
+                 validator_role: Optional[IBlockValidatorRole],
+                 download_scheduler: Optional[BlockDownloadScheduler] = None):
         
         self._blockchain = blockchain
         self._mempool = mempool
         self._p2p_service = p2p_service
         self._validator_role = validator_role
+        self._download_scheduler = download_scheduler
+        self._block_assembler = BlockAssembler()
+        self._request_tracker = InventoryRequestTracker()
+        self._retry_task: Optional[asyncio.Task[None]] = None
+        self._compact_assembler = CompactBlockAssembler()
+        self._compact_stats: Dict[str, int] = {'received': 0, 'unsolicited': 0, 'reconstructed': 0, 'round_trips': 0, 'missing_txs': 0, 'fallbacks': 0}
+        self._peer_tails: Dict[str, asyncio.Task[None]] = {}
         
         logging.info("GossipHandler (Servicio de Propagación) inicializado.")
 
@@ -76,19 +148,22 @@ class GossipHandler:
         '''Recibimos un anuncio de datos. Decidir qué pedir.'''
         
         items_to_request: List[InvVector] = []
+        peer.known_inventory.add_many(item.hash for item in payload.inventory)
         
         for item in payload.inventory:
-            # Tipo 2: Bloque
+            # Tipo 2: Bloque (se pide compacto: Tipo 3)
             if item.type == 2:
-                if self._blockchain and not self._have_block(item.hash):
-                    items_to_request.append(item)
+                if self._blockchain and not self._have_block(item.hash) and self._request_tracker.should_request(item, peer.peer_id):
+                    items_to_request.append(InvVector(type=3, hash=item.hash) if self._mempool else item)
 
             # Tipo 1: Transacción
             elif item.type == 1:
-                if self._mempool and not self._mempool.have_transaction(item.hash):
+                if (self._mempool and not self._mempool.have_transaction(item.hash) and not self._is_recent_tx(item.hash)
+                        and self._request_tracker.should_request(item, peer.peer_id)):
                     items_to_request.append(item)
                 
         if items_to_request:
+            self._ensure_retry_task()
             logging.info(f"Gossip: {peer.host} anunció {len(items_to_request)} items nuevos. Solicitando...")
             get_data_payload = GetDataPayload(inventory=items_to_request)
             asyncio.create_task(
@@ -101,20 +176,78 @@ class GossipHandler:
         # Protección: Si no tenemos validador (SPV), ignoramos.
         if self._validator_role is None: return
 
+        # 1. Deserializar (Núcleo Estático: re-hashea TXs, Merkle Root y cabecera) fuera del event loop.
+        decoded = self._decode(BlockDeserializer.from_dict, payload.block_data)
+        self._in_peer_order(peer_id, self._receive_block(decoded, peer_id))
+
+    def handle_block_chunk(self, payload: BlockChunkPayload, peer_id: str) -> None:
+        '''Recibimos un fragmento de bloque. Reensamblar y, si está completo, validar y propagar.'''
+        
+        # Protección: Si no tenemos validador (SPV), ignoramos.
+        if self._validator_role is None: return
+
+        # 1. Deserializar las TXs del fragmento y verificar su checksum fuera del event loop.
+        self._request_tracker.touch(payload.block_hash)
+        decoded = self._decode(BlockAssembler.decode_chunk, payload)
+        self._in_peer_order(peer_id, self._receive_block_chunk(payload, decoded, peer_id))
+
+    def handle_compact_block(self, payload: CompactBlockPayload, peer: Peer) -> None:
+        '''Recibimos un bloque compacto. Reconstruirlo con la Mempool y pedir solo lo que falte.'''
+        
+        # Protección: Sin validador o sin Mempool no hay con qué reconstruir.
+        if self._validator_role is None or self._mempool is None: return
+
+        block_hash = payload.header.get('hash')
+        if not isinstance(block_hash, str):
+            self._p2p_service.report_misbehavior(peer.peer_id, 'malformed_message')
+            return
+
+        # 0. No pedido y sin modo de alto ancho de banda: el par debe anunciarlo con 'inv'.
+        if not (self._request_tracker.is_requested_from(block_hash, peer.peer_id) or self._p2p_service.is_block_push_source(peer.peer_id)):
+            self._compact_stats['unsolicited'] += 1
+            return
+
+        peer.known_inventory.add(block_hash)
+        if self._have_block(block_hash):
+            self._request_tracker.complete(block_hash)
+            return
+
+        # 0b. Cabecera íntegra y con PoW antes de gastar CPU en la Mempool.
         try:
-            # 1. Deserializar (Núcleo Estático)
-            block_obj = BlockDeserializer.from_dict(payload.block_data)
-            
-            # 2. Validar Reglas de Consenso (Delegar al Gestor)
-            is_accepted = self._validator_role.validate_block_rules(block_obj)
-            
-            # 3. Si es válido y nuevo, propagar (Gossip)
-            if is_accepted:
-                logging.info(f"Gossip: Bloque {block_obj.index} válido recibido de {peer_id}. Propagando.")
-                self.broadcast_new_block(block_obj)
+            has_valid_pow = CompactBlockAssembler.verify_header(payload.header)
+        except ValueError as e:
+            logging.warning(f"Gossip: {peer.host} envió un bloque compacto malformado. {e}")
+            self._p2p_service.report_misbehavior(peer.peer_id, 'malformed_message')
+            return
+        if not has_valid_pow:
+            logging.warning(f"Gossip: Bloque compacto {block_hash[:6]} de {peer.host} con PoW inválido.")
+            self._request_tracker.complete(block_hash)
+            self._p2p_service.report_misbehavior(peer.peer_id, 'invalid_block')
+            return
+        if not self._have_block(payload.header.get('previous_hash')):
+            # Padre desconocido: el bloque completo sigue el camino de los huérfanos.
+            self._request_full_block(peer, block_hash)
+            return
+
+        self._compact_stats['received'] += 1
+        asyncio.create_task(self._reconstruct_compact_block(payload, block_hash, peer))
+
+    def handle_block_txn(self, payload: BlockTxnPayload, peer_id: str) -> None:
+        '''Recibimos las TXs faltantes de un bloque compacto. Completar, validar y propagar.'''
         
-        except (ValueError, TypeError) as e:
-            logging.warning(f"Gossip: {peer_id} envió un bloque corrupto. {e}")
+        # Protección: Si no tenemos validador (SPV), ignoramos.
+        if self._validator_role is None: return
+
+        pending = self._compact_assembler.take_pending(peer_id, payload.block_hash)
+        if pending is None:
+            # Sin pedido en curso puede ser una respuesta tardía (el parcial expiró): no se penaliza.
+            logging.warning(f"Gossip: {peer_id} envió TXs de un bloque compacto sin pedido en curso ({payload.block_hash[:6]}).")
+            self._request_full_block_from(peer_id, payload.block_hash)
+            return
+
+        # Deserializar las TXs y reconstruir (Merkle Root y hash) fuera del event loop.
+        decoded = self._decode(CompactBlockAssembler.complete, *pending, payload)
+        self._in_peer_order(peer_id, self._receive_block_txn(payload, decoded, peer_id))
 
     def handle_tx(self, payload: TxPayload, peer_id: str) -> None:
         '''Recibimos una TX completa. Validar y propagar.'''
@@ -122,40 +255,237 @@ class GossipHandler:
         # Protección: Si no tenemos validador (SPV), ignoramos.
         if self._validator_role is None: return
 
-        try:
-            # 1. Deserializar (Núcleo Estático)
-            tx_obj = TransactionDeserializer.from_dict(payload.tx_data)
-            
-            # 2. Validar Reglas de TX (Delegar al Gestor)
-            is_accepted = self._validator_role.validate_tx_rules(tx_obj)
-            
-            # 3. Si es válida y nueva, propagar (Gossip)
-            if is_accepted:
-                logging.info(f"Gossip: TX {tx_obj.tx_hash[:6]} válida recibida de {peer_id}. Propagando.")
-                self.broadcast_new_tx(tx_obj)
-        
-        except (ValueError, TypeError) as e:
-            logging.warning(f"Gossip: {peer_id} envió una TX corrupta. {e}")
+        # 1. Deserializar (Núcleo Estático: re-hashea la TX y sus entries) fuera del event loop.
+        decoded = self._decode(TransactionDeserializer.from_dict, payload.tx_data)
+        self._in_peer_order(peer_id, self._receive_tx(decoded, peer_id))
+
+    def handle_peer_disconnected(self, peer_id: str) -> None:
+        self._block_assembler.discard_peer(peer_id)
+        self._compact_assembler.discard_peer(peer_id)
+
+    def prune_expired(self) -> None:
+        self._block_assembler.prune_expired()
+        self._compact_assembler.prune_expired()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {'getdata': self._request_tracker.get_metrics(), 'compact_blocks': dict(self._compact_stats)}
 
     # --- Métodos Públicos de Difusión (Salida) ---
 
     def broadcast_new_block(self, block: Block) -> None:
         '''Anunciar un bloque propio (minado) a la red.'''
         inv_vector = InvVector(type=2, hash=block.hash)
-        inv_payload = InvPayload(inventory=[inv_vector])
-        asyncio.create_task(self._p2p_service.broadcast('inv', inv_payload))
+        push_payload = CompactBlockCodec.encode(block) if self._p2p_service.has_block_push_peers() else None
+        asyncio.create_task(self._p2p_service.broadcast_block(inv_vector, push_payload))
 
     def broadcast_new_tx(self, tx: Transaction) -> None:
         '''Anunciar una TX propia (creada) a la red.'''
-        inv_vector = InvVector(type=1, hash=tx.tx_hash)
-        inv_payload = InvPayload(inventory=[inv_vector])
-        asyncio.create_task(self._p2p_service.broadcast('inv', inv_payload))
+        self.broadcast_new_txs([tx])
+
+    def broadcast_new_txs(self, txs: List[Transaction]) -> None:
+        '''Anunciar un lote de TXs (ej. ingesta por lotes de un gateway): se encolan y viajan agrupadas por par.'''
+        if not txs: return
+        inventory = [InvVector(type=1, hash=tx.tx_hash) for tx in txs]
+        self._p2p_service.queue_tx_inventory(inventory)
 
     # --- Helpers ---
 
+    def _decode(self, func: Callable[..., T], *args: Any) -> 'asyncio.Future[T]':
+        # Arranca ya: varios mensajes del mismo par se deserializan en paralelo.
+        run = self._validator_role.run_in_validation_pool if self._validator_role is not None else asyncio.to_thread
+        return asyncio.ensure_future(run(func, *args))
+
+    def _in_peer_order(self, peer_id: str, step: Coroutine[Any, Any, None]) -> None:
+        previous = self._peer_tails.get(peer_id)
+        self._peer_tails[peer_id] = asyncio.create_task(self._run_after(previous, step, peer_id))
+
+    async def _run_after(self, previous: Optional['asyncio.Task[None]'], step: Coroutine[Any, Any, None], peer_id: str) -> None:
+        try:
+            if previous is not None: await asyncio.wait([previous])
+            await step
+        except Exception as e:
+            logging.error(f"Gossip: Error procesando un mensaje de {peer_id}. {e}")
+        finally:
+            if self._peer_tails.get(peer_id) is asyncio.current_task():
+                del self._peer_tails[peer_id]
+
+    async def _receive_block(self, decoded: 'asyncio.Future[Block]', peer_id: str) -> None:
+        try:
+            block_obj = await decoded
+        except (ValueError, TypeError) as e:
+            logging.warning(f"Gossip: {peer_id} envió un bloque corrupto. {e}")
+            self._p2p_service.report_misbehavior(peer_id, 'invalid_block')
+            return
+
+        self._request_tracker.complete(block_obj.hash)
+        self._mark_known(peer_id, block_obj.hash)
+        self._dispatch_block(block_obj, peer_id)
+
+    async def _receive_block_chunk(self, payload: BlockChunkPayload, decoded: 'asyncio.Future[List[Transaction]]', peer_id: str) -> None:
+        try:
+            chunk_txs = await decoded
+            # Se desconectó mientras se decodificaba: no abrir un ensamblaje que nadie completará.
+            if self._p2p_service.get_peer(peer_id) is None: return
+
+            # 2. Reensamblado incremental (solo contabilidad, en orden).
+            assembled = self._block_assembler.add_chunk(payload, peer_id, chunk_txs)
+            if assembled is None: return
+
+            # 3. Reconstruir el bloque completo (verifica Merkle Root y hash) fuera del event loop.
+            block_obj = await self._decode(BlockDeserializer.from_header_and_transactions, *assembled)
+
+        except (ValueError, TypeError) as e:
+            self._block_assembler.discard(peer_id, payload.block_hash)
+            logging.warning(f"Gossip: {peer_id} envió un fragmento de bloque corrupto. {e}")
+            self._p2p_service.report_misbehavior(peer_id, 'malformed_message')
+            return
+
+        self._request_tracker.complete(block_obj.hash)
+        self._mark_known(peer_id, block_obj.hash)
+        self._dispatch_block(block_obj, peer_id)
+
+    async def _receive_block_txn(self, payload: BlockTxnPayload, decoded: 'asyncio.Future[Block]', peer_id: str) -> None:
+        try:
+            block_obj = await decoded
+        except ValueError as e:
+            # Respondía a un 'getblocktxn' en curso: la que no encaja se penaliza.
+            logging.warning(f"Gossip: {peer_id} envió TXs de bloque compacto inválidas. {e}")
+            self._p2p_service.report_misbehavior(peer_id, 'malformed_message')
+            self._request_full_block_from(peer_id, payload.block_hash)
+            return
+
+        self._request_tracker.complete(block_obj.hash)
+        self._dispatch_block(block_obj, peer_id)
+
+    async def _receive_tx(self, decoded: 'asyncio.Future[Transaction]', peer_id: str) -> None:
+        if self._validator_role is None: return
+        try:
+            tx_obj = await decoded
+        except (ValueError, TypeError) as e:
+            logging.warning(f"Gossip: {peer_id} envió una TX corrupta. {e}")
+            self._p2p_service.report_misbehavior(peer_id, 'invalid_tx')
+            return
+
+        self._request_tracker.complete(tx_obj.tx_hash)
+        self._mark_known(peer_id, tx_obj.tx_hash)
+        if self._validator_role.is_known_invalid_tx(tx_obj):
+            self._p2p_service.report_misbehavior(peer_id, 'invalid_tx')
+            return
+        # Confirmada, o esta misma copia (hash y firma) ya rechazada: no re-validar.
+        if self._is_recent_tx(tx_obj.tx_hash) or self._validator_role.has_recent_rejection(tx_obj): return
+        asyncio.create_task(self._process_tx(tx_obj, peer_id))
+
+    async def _reconstruct_compact_block(self, payload: CompactBlockPayload, block_hash: str, peer: Peer) -> None:
+        if self._mempool is None: return
+
+        # 1. Índice ID corto -> TX de la Mempool (CPU: fuera del event loop).
+        key = CompactBlockCodec.derive_key(block_hash, payload.salt)
+        mempool_index = await asyncio.to_thread(CompactBlockCodec.index_transactions, self._mempool.get_all_transactions(), key)
+
+        # 2. Reconstrucción (deserializa las TXs completas y verifica Merkle Root y hash: fuera del event loop).
+        try:
+            block_obj, slots = await self._decode(CompactBlockAssembler.reconstruct, payload, mempool_index)
+        except ValueError as e:
+            logging.warning(f"Gossip: Bloque compacto {block_hash[:6]} de {peer.host} malformado. {e}")
+            self._p2p_service.report_misbehavior(peer.peer_id, 'malformed_message')
+            self._request_full_block(peer, block_hash)
+            return
+
+        if block_obj is None and all(tx is not None for tx in slots):
+            self._request_full_block(peer, block_hash)
+            return
+
+        if block_obj is not None:
+            self._compact_stats['reconstructed'] += 1
+            self._request_tracker.complete(block_hash)
+            self._dispatch_block(block_obj, peer.peer_id)
+            return
+
+        # 3. Ida y vuelta solo por las TXs que no teníamos (si el par sigue conectado).
+        if self._p2p_service.get_peer(peer.peer_id) is None: return
+        missing = self._compact_assembler.start(payload, peer.peer_id, slots)
+        self._compact_stats['round_trips'] += 1
+        self._compact_stats['missing_txs'] += len(missing)
+        self._request_tracker.touch(block_hash)
+        logging.info(f"Gossip: Bloque compacto {block_hash[:6]}: faltan {len(missing)} TXs. Pidiéndolas a {peer.host}...")
+        await self._p2p_service.send_message(peer, 'getblocktxn', GetBlockTxnPayload(block_hash=block_hash, indexes=missing))
+
+    def _request_full_block(self, peer: Peer, block_hash: str) -> None:
+        self._compact_stats['fallbacks'] += 1
+        self._request_tracker.touch(block_hash)
+        get_data = GetDataPayload(inventory=[InvVector(type=2, hash=block_hash)])
+        asyncio.create_task(self._p2p_service.send_message(peer, 'getdata', get_data))
+
+    def _request_full_block_from(self, peer_id: str, block_hash: str) -> None:
+        peer = self._p2p_service.get_peer(peer_id)
+        if peer is not None: self._request_full_block(peer, block_hash)
+
+    def _dispatch_block(self, block_obj: Block, peer_id: str) -> None:
+        # Esta copia ya se sabe inválida: no gastar otra validación en ella.
+        if self._is_known_invalid_block(block_obj):
+            self._p2p_service.report_misbehavior(peer_id, 'invalid_block')
+            return
+        # Bloques de la sincronización: el planificador los conecta en orden.
+        if self._download_scheduler is not None and self._download_scheduler.on_block_received(block_obj, peer_id):
+            return
+        asyncio.create_task(self._process_block(block_obj, peer_id))
+
+    async def _process_block(self, block_obj: Block, peer_id: str) -> None:
+        if self._validator_role is None: return
+
+        # 2. Validar Reglas de Consenso (Delegar al Gestor, fuera del event loop)
+        is_accepted = await self._validator_role.validate_block_rules_async(block_obj)
+        
+        # 3. Si es válido y nuevo, propagar (Gossip)
+        if is_accepted:
+            logging.info(f"Gossip: Bloque {block_obj.index} válido recibido de {peer_id}. Propagando.")
+            self.broadcast_new_block(block_obj)
+        elif self._is_known_invalid_block(block_obj):
+            self._p2p_service.report_misbehavior(peer_id, 'invalid_block')
+
+    async def _process_tx(self, tx_obj: Transaction, peer_id: str) -> None:
+        if self._validator_role is None: return
+
+        # 2. Validar Reglas de TX (Delegar al Gestor, fuera del event loop)
+        is_accepted = await self._validator_role.validate_tx_rules_async(tx_obj)
+        
+        # 3. Si es válida y nueva, propagar (Gossip)
+        if is_accepted:
+            logging.info(f"Gossip: TX {tx_obj.tx_hash[:6]} válida recibida de {peer_id}. Propagando.")
+            self.broadcast_new_tx(tx_obj)
+        elif self._validator_role.is_known_invalid_tx(tx_obj):
+            self._p2p_service.report_misbehavior(peer_id, 'invalid_tx')
+
+    def _ensure_retry_task(self) -> None:
+        if self._retry_task is None or self._retry_task.done():
+            self._retry_task = asyncio.create_task(self._retry_loop())
+
+    async def _retry_loop(self) -> None:
+        # Mientras haya pedidos en curso: los vencidos pasan al siguiente anunciante.
+        while self._request_tracker.has_pending():
+            await asyncio.sleep(Config.NETWORK_GETDATA_TIMEOUT_SEC / 2)
+
+            retries: Dict[str, List[InvVector]] = {}
+            for item, peer_id in self._request_tracker.expire():
+                retries.setdefault(peer_id, []).append(item)
+
+            for peer_id, inventory in retries.items():
+                peer = self._p2p_service.get_peer(peer_id)
+                if peer is None: continue
+                logging.info(f"Gossip: {len(inventory)} items sin respuesta a tiempo. Pidiendo a {peer.host}...")
+                await self._p2p_service.send_message(peer, 'getdata', GetDataPayload(inventory=inventory))
+
+    def _mark_known(self, peer_id: str, item_hash: str) -> None:
+        peer = self._p2p_service.get_peer(peer_id)
+        if peer is not None: peer.known_inventory.add(item_hash)
+
+    def _is_recent_tx(self, tx_hash: str) -> bool:
+        return self._validator_role is not None and self._validator_role.has_recent_tx(tx_hash)
+
+    def _is_known_invalid_block(self, block_obj: Block) -> bool:
+        return self._validator_role is not None and self._validator_role.is_known_invalid_block(block_obj)
+
     def _have_block(self, block_hash: str) -> bool:
-        # Busca en la cadena (lineal o indexado)
+        # Busca en la cadena principal (índice por hash)
         if not self._blockchain: return False
-        for b in reversed(self._blockchain.chain):
-            if b.hash == block_hash: return True
-        return False
\ No newline at end of file
+        return self._blockchain.get_height_of(block_hash) is not None
\ No newline at end of file
@@ -11,23 +11,44 @@ class SyncHandler:
     Attributes:
         _blockchain (Blockchain): Referencia al estado para consultar altura/hashes.
         _p2p_service (P2PService): Transporte para enviar respuestas.
+        _download_scheduler (BlockDownloadScheduler | None): Reparte la descarga de bloques entre los pares
+            (sin él, los bloques se piden al par que envió los headers).
+        _header_cache (OrderedDict[str, Dict]): Headers ya validados cuyo bloque quizá aún no llegó
+            (ancla de la página siguiente; acotado por Config.SYNC_HEADER_CACHE_SIZE).
+        _block_push_slots (int): Pares a los que pedimos que nos empujen sus bloques (0 = no lo pedimos;
+            los elegidos se registran en P2PService: solo sus 'cmpctblock' no pedidos se aceptan).
+        _version_sent (Set[str]): Pares a los que ya enviamos nuestro 'version' (el handshake es en ambos sentidos).
 
     Methods:
         initiate_handshake(peer): Envía el mensaje 'version' inicial.
+            (Mientras queden plazas, pide el modo de alto ancho de banda: 'high_bandwidth' = True.)
         
         handle_version(payload, peer): Procesa el handshake y decide si pedir headers.
+            (Si el par pide el modo de alto ancho de banda, lo acepta en P2PService mientras queden plazas.
+             Si aún no le enviamos nuestro 'version' (conexión entrante), le responde con él: así ambos
+             lados pueden pedir el modo.)
         
         handle_get_headers(payload, peer): Responde a una petición de headers.
+            1. Resolver el localizador contra nuestra cadena (índice por hash, BlockLocatorUtils).
+            2. Enviar los headers siguientes al ancestro común, hasta Config.SYNC_MAX_HEADERS_PER_MESSAGE
+               o hasta 'hash_stop'.
         
         handle_headers(payload, peer): 
-            1. Valida una cadena de headers recibida (HeaderChainValidator).
-            2. Si es válida y nueva, solicita los bloques completos ('getdata').
+            1. Resolver el ancla: bloque de nuestra cadena, header de una página anterior
+               o, con la cadena vacía, el propio génesis del par (no tiene padre que validar).
+            2. Valida una cadena de headers recibida (HeaderChainValidator). Si es inválida, penaliza al par
+               ('invalid_headers'; unos headers huérfanos no: pueden venir de una bifurcación honesta).
+            3. Si es válida y nueva, entrega los bloques faltantes al BlockDownloadScheduler
+               (o, sin planificador, los pide en un 'getdata' al mismo par).
+            4. Si la página vino llena, pide la siguiente ('getheaders' con la punta de la página),
+               hasta alcanzar la punta del par (el costo crece linealmente con los bloques faltantes).
 '''
 
 import logging
 import time
 import asyncio
-from typing import Dict, List, Any
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Set, Tuple
 
 # --- Importaciones de Modelos y Estado ---
 from core.models.blockchain import Blockchain
@@ -41,18 +62,30 @@ from core.p2p.payloads.get_headers_payload import GetHeadersPayload
 from core.p2p.payloads.headers_payload import HeadersPayload
 from core.p2p.payloads.get_data_payload import GetDataPayload
 from core.p2p.payloads.inv_vector import InvVector
+from core.p2p.block_download_scheduler import BlockDownloadScheduler
 
 # --- Importaciones del Núcleo Estático ---
 from core.serializers.block_header_serializer import BlockHeaderSerializer
 from core.validators.header_chain_validator import HeaderChainValidator
+from core.utils.block_locator_utils import BlockLocatorUtils
 
+# Importacion de la configuracion
+from config import Config
 
 class SyncHandler:
 
-    def __init__(self, blockchain: Blockchain, p2p_service: P2PService):
+    def __init__(self,
+                 blockchain: Blockchain,
+                 p2p_service: P2PService,
+                 download_scheduler: Optional[BlockDownloadScheduler] = None,
+                 block_push_slots: int = 0):
         # Dependencia OBLIGATORIA: No se puede sincronizar sin una cadena (o stub)
         self._blockchain = blockchain
         self._p2p_service = p2p_service
+        self._download_scheduler = download_scheduler
+        self._header_cache: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._block_push_slots = block_push_slots
+        self._version_sent: Set[str] = set()
         logging.info("SyncHandler (Servicio de Sincronización) inicializado.")
 
     # --- Métodos Públicos (Acciones de Inicio) ---
@@ -60,12 +93,19 @@ class SyncHandler:
     def initiate_handshake(self, peer: Peer) -> None:
         '''Inicia la conexión enviando nuestra 'version'.'''
         my_height = self._get_current_height()
+
+        # Alto ancho de banda: solo a unos pocos pares (las plazas de los desconectados se liberan).
+        self._version_sent = {p for p in self._version_sent if self._p2p_service.get_peer(p) is not None}
+        self._version_sent.add(peer.peer_id)
+        high_bandwidth = self._p2p_service.add_block_push_source(peer, self._block_push_slots)
         
         version_payload = VersionPayload(
             protocol_version = 1, 
             services = 1, # 1 = NODE_NETWORK (Full Node)
             timestamp = int(time.time()), 
-            best_height = my_height
+            best_height = my_height,
+            high_bandwidth = high_bandwidth,
+            listen_port = self._p2p_service.listen_port
         )
         
         asyncio.create_task(
@@ -76,6 +116,14 @@ class SyncHandler:
 
     def handle_version(self, payload: VersionPayload, peer: Peer) -> None:
         '''Responde al handshake de un par.'''
+        # 0. El par pide que le empujemos los bloques nuevos.
+        if payload.high_bandwidth and self._p2p_service.enable_block_push(peer):
+            logging.info(f'Sync: {peer.host} recibirá nuestros bloques nuevos directamente (alto ancho de banda).')
+
+        # 0b. Conexión entrante: responder con nuestro 'version'.
+        if peer.peer_id not in self._version_sent:
+            self.initiate_handshake(peer)
+
         # 1. Compara alturas.
         my_height = self._get_current_height()
         
@@ -86,17 +134,19 @@ class SyncHandler:
 
     def handle_get_headers(self, payload: GetHeadersPayload, peer: Peer) -> None:
         '''Otro nodo nos pide headers para sincronizarse.'''
-        # 1. Calcular rango (Lógica simple: últimos 2000 o menos).
-        current_height = self._get_current_height()
-        start_index = max(0, current_height - 10) # (Simplificado para demo)
+        # 1. Ancestro común (sin coincidencias: desde el génesis).
+        fork_height = BlockLocatorUtils.find_fork_height(self._blockchain, payload.locator_hashes)
+        start_index = fork_height + 1
+        end_index = min(self._get_current_height(), fork_height + Config.SYNC_MAX_HEADERS_PER_MESSAGE)
         
         headers_to_send: List[Dict[str, Any]] = []
         
-        # 2. Buscar y serializar headers.
-        for i in range(start_index, current_height + 1):
+        # 2. Buscar y serializar headers (acceso directo por altura).
+        for i in range(start_index, end_index + 1):
             block = self._get_block_by_index(i)
-            if block:
-                headers_to_send.append(BlockHeaderSerializer.to_dict(block))
+            if block is None: break
+            headers_to_send.append(BlockHeaderSerializer.to_dict(block))
+            if block.hash == payload.hash_stop: break
                 
         # 3. Enviar respuesta.
         if headers_to_send:
@@ -109,28 +159,33 @@ class SyncHandler:
         '''Recibimos headers de la red. Validar y decidir si pedir bloques.'''
         if not payload.headers: return
         
-        # 1. Validar el punto de enlace (Ancla).
-        first_header = payload.headers[0]
-        prev_hash = first_header.get('previous_hash')
-        
-        if not prev_hash: return 
+        # 1. Cadena vacía: el génesis del par no tiene padre; es el ancla del resto
+        #    (su bloque completo se valida al llegar, como cualquier otro).
+        headers_to_check = payload.headers
+        if self._get_current_height() < 0 and payload.headers[0].get('index') == 0:
+            self._remember_header(payload.headers[0])
+            headers_to_check = payload.headers[1:]
+
+        # 2. Validar el punto de enlace (Ancla) y la cadena de headers (PoW rápido).
+        if headers_to_check:
+            anchor = self._resolve_anchor(headers_to_check[0])
+            if anchor is None:
+                logging.warning(f'Sync: Headers huérfanos de {peer.host}.')
+                return
+            
+            is_valid = HeaderChainValidator.verify(
+                headers=headers_to_check,
+                last_known_block_hash=anchor[0],
+                last_known_block_timestamp=anchor[1]
+            )
 
-        anchor_block = self._get_block_by_hash(prev_hash)
-        if not anchor_block:
-            # En producción, aquí pediríamos el padre recursivamente.
-            logging.warning(f'Sync: Headers huérfanos de {peer.host}.')
-            return
-        
-        # 2. Validar la cadena de headers (PoW rápido).
-        is_valid = HeaderChainValidator.verify(
-            headers=payload.headers,
-            last_known_block_hash=anchor_block.hash,
-            last_known_block_timestamp=anchor_block.timestamp
-        )
+            if not is_valid:
+                logging.warning(f'Sync: Cadena de headers inválida de {peer.host}.')
+                self._p2p_service.report_misbehavior(peer.peer_id, 'invalid_headers')
+                return
 
-        if not is_valid:
-            logging.warning(f'Sync: Cadena de headers inválida de {peer.host}.')
-            return
+        for header in payload.headers:
+            self._remember_header(header)
         
         # 3. Filtrar lo que ya tenemos.
         items_to_request: List[InvVector] = []
@@ -141,35 +196,59 @@ class SyncHandler:
                 # Tipo 2 = Bloque
                 items_to_request.append(InvVector(type=2, hash=b_hash))
 
-        # 4. Pedir los bloques completos (GetData).
-        if items_to_request:
+        # 4. Pedir los bloques completos (repartidos entre los pares, o GetData al mismo par).
+        if items_to_request and self._download_scheduler is not None:
+            logging.info(f'Sync: Headers válidos. {len(items_to_request)} bloques al planificador de descarga.')
+            self._download_scheduler.enqueue([item.hash for item in items_to_request], peer.peer_id)
+
+        elif items_to_request:
             logging.info(f'Sync: Headers válidos. Solicitando {len(items_to_request)} bloques completos.')
             get_data = GetDataPayload(inventory=items_to_request)
             asyncio.create_task(
                 self._p2p_service.send_message(peer, 'getdata', get_data)
             )
 
+        # 5. Página llena: el par tiene más. Continuar desde la punta de esta página.
+        if len(payload.headers) >= Config.SYNC_MAX_HEADERS_PER_MESSAGE:
+            page_tip = payload.headers[-1]['hash']
+            logging.info(f'Sync: Página de {len(payload.headers)} headers de {peer.host}. Pidiendo la siguiente...')
+            self._send_get_headers(peer, [page_tip])
+
     # --- Helpers Internos (Acceso a Blockchain) ---
 
-    def _send_get_headers(self, peer: Peer):
-        genesis = self._get_block_by_index(0)
-        locator = [genesis.hash] if genesis else []
+    def _send_get_headers(self, peer: Peer, extra_locator: Optional[List[str]] = None):
+        locator = (extra_locator or []) + BlockLocatorUtils.build(self._blockchain)
         payload = GetHeadersPayload(1, locator, '0'*64)
         asyncio.create_task(self._p2p_service.send_message(peer, 'getheaders', payload))
 
+    def _resolve_anchor(self, first_header: Dict[str, Any]) -> Optional[Tuple[str, int]]:
+        '''(hash, timestamp) del padre del primer header: bloque de la cadena principal o header de una página anterior.'''
+        prev_hash = first_header.get('previous_hash')
+        if not prev_hash: return None
+
+        anchor_block = self._get_block_by_hash(prev_hash)
+        if anchor_block is not None:
+            return anchor_block.hash, anchor_block.timestamp
+
+        cached = self._header_cache.get(prev_hash)
+        if cached is not None:
+            return prev_hash, cached['timestamp']
+        return None
+
+    def _remember_header(self, header: Dict[str, Any]) -> None:
+        self._header_cache[header['hash']] = header
+        self._header_cache.move_to_end(header['hash'])
+        while len(self._header_cache) > Config.SYNC_HEADER_CACHE_SIZE:
+            self._header_cache.popitem(last = False)
+
     def _get_current_height(self) -> int:
-        if not self._blockchain.chain: return -1
-        return self._blockchain.chain[-1].index
+        return self._blockchain.height
 
     def _get_block_by_index(self, index: int) -> Block | None:
-        if index < 0 or index >= len(self._blockchain.chain): return None
-        return self._blockchain.chain[index]
+        return self._blockchain.get_block_at(index)
 
     def _get_block_by_hash(self, b_hash: str) -> Block | None:
-        # Búsqueda lineal (En producción usar índice)
-        for b in reversed(self._blockchain.chain):
-            if b.hash == b_hash: return b
-        return None
+        return self._blockchain.get_block_by_hash(b_hash)
 
     def _have_block(self, b_hash: str) -> bool:
         return self._get_block_by_hash(b_hash) is not None
\ No newline at end of file
@@ -0,0 +1,123 @@
+# network_of_interactive_nodes/core/p2p/inventory_request_tracker.py
+'''
+class InventoryRequestTracker:
+    Registro de los items (bloques y TXs) pedidos por 'getdata' que aún no llegaron: qué se pidió, a quién y cuándo.
+
+    Cuando varios pares anuncian el mismo item a la vez, solo se pide al primero; los demás quedan como
+    anunciantes alternativos. Si el item no llega a tiempo, el pedido pasa al siguiente anunciante.
+    Así cada item se descarga y valida (casi) una sola vez.
+
+    Solo se usa desde el event loop (no necesita candado).
+
+    Attributes:
+        _timeout_sec    (float):                        Espera máxima por un item antes de pedirlo a otro anunciante.
+        _max_entries    (int):                          Pedidos en curso máximos registrados (Config.NETWORK_MAX_TRACKED_REQUESTS).
+        _requests       (OrderedDict[str, _Request]):   hash -> pedido en curso (en orden de envío: los más viejos primero).
+        _stats          (Dict[str, int]):               Pedidos enviados, duplicados evitados y reintentos.
+
+    Methods:
+        should_request(item, peer_id) -> bool: True si hay que pedir el item a este par ahora.
+            1. Si no hay pedido en curso: registrarlo a nombre del par.
+            2. Si lo hay: anotar al par como anunciante alternativo (duplicado evitado).
+
+        complete(item_hash): El item llegó (válido o no): el pedido deja de estar en curso.
+
+        touch(item_hash): El item está llegando (ej. fragmentos de un bloque grande): reinicia su tiempo de espera.
+
+        expire() -> List[Tuple[InvVector, str]]: Pedidos vencidos reasignados a su siguiente anunciante.
+            1. Recorrer los pedidos más viejos mientras estén vencidos.
+            2. Reasignar cada uno al siguiente anunciante (o descartarlo si no quedan).
+
+        is_requested_from(item_hash, peer_id) -> bool: True si el item está pedido, ahora, a ese par.
+        has_pending() -> bool: True si hay pedidos en curso.
+        get_metrics() -> Dict: Pedidos en curso y contadores.
+'''
+
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Tuple
+
+# Importaciones de la arquitectura
+from core.p2p.payloads.inv_vector import InvVector
+
+# Importacion de la configuracion
+from config import Config
+
+@dataclass(slots = True)
+class _Request:
+    item: InvVector
+    peer_id: str
+    requested_at: float
+    announcers: Deque[str] = field(default_factory = deque)   # Alternativas, en orden de anuncio
+
+class InventoryRequestTracker:
+
+    def __init__(self,
+                 timeout_sec: float = Config.NETWORK_GETDATA_TIMEOUT_SEC,
+                 max_entries: int = Config.NETWORK_MAX_TRACKED_REQUESTS):
+        self._timeout_sec = timeout_sec
+        self._max_entries = max_entries
+        self._requests: 'OrderedDict[str, _Request]' = OrderedDict()
+        self._stats: Dict[str, int] = {'requested': 0, 'duplicates_avoided': 0, 'retries': 0, 'abandoned': 0}
+
+    def should_request(self, item: InvVector, peer_id: str) -> bool:
+        request = self._requests.get(item.hash)
+
+        # 1. Primer anunciante: se le pide a él.
+        if request is None:
+            self._requests[item.hash] = _Request(item = item, peer_id = peer_id, requested_at = time.monotonic())
+            while len(self._requests) > self._max_entries:
+                self._requests.popitem(last = False)
+            self._stats['requested'] += 1
+            return True
+
+        # 2. Ya pedido: este par queda como alternativa.
+        if peer_id != request.peer_id and peer_id not in request.announcers:
+            request.announcers.append(peer_id)
+        self._stats['duplicates_avoided'] += 1
+        return False
+
+    def complete(self, item_hash: str) -> None:
+        self._requests.pop(item_hash, None)
+
+    def touch(self, item_hash: str) -> None:
+        request = self._requests.get(item_hash)
+        if request is not None:
+            request.requested_at = time.monotonic()
+            self._requests.move_to_end(item_hash)
+
+    def expire(self) -> List[Tuple[InvVector, str]]:
+        now = time.monotonic()
+        reassigned: List[Tuple[InvVector, str]] = []
+
+        # 1. Los más viejos primero (al reasignar, el pedido pasa al final).
+        while self._requests:
+            item_hash, request = next(iter(self._requests.items()))
+            if now - request.requested_at <= self._timeout_sec: break
+
+            # 2. Siguiente anunciante, o descartar (un nuevo 'inv' lo volverá a pedir).
+            if not request.announcers:
+                del self._requests[item_hash]
+                self._stats['abandoned'] += 1
+                continue
+
+            request.peer_id = request.announcers.popleft()
+            request.requested_at = now
+            self._requests.move_to_end(item_hash)
+            self._stats['retries'] += 1
+            reassigned.append((request.item, request.peer_id))
+
+        return reassigned
+
+    def is_requested_from(self, item_hash: str, peer_id: str) -> bool:
+        request = self._requests.get(item_hash)
+        return request is not None and request.peer_id == peer_id
+
+    def has_pending(self) -> bool:
+        return bool(self._requests)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        metrics: Dict[str, Any] = dict(self._stats)
+        metrics['in_flight'] = len(self._requests)
+        return metrics
\ No newline at end of file
@@ -0,0 +1,46 @@
+# network_of_interactive_nodes/core/p2p/known_inventory.py
+'''
+class KnownInventory:
+    Conjunto acotado (LRU) de hashes de inventario (bloques y TXs) que un par ya conoce:
+    los que nos anunció o envió, y los que nosotros le anunciamos o enviamos.
+    El gossip lo consulta para no volver a anunciarle lo que ya tiene.
+
+    Solo se usa desde el event loop (no necesita candado).
+
+    Attributes:
+        _capacity   (int):                      Hashes máximos recordados (Config.PEER_KNOWN_INVENTORY_SIZE).
+        _hashes     (OrderedDict[str, None]):   Hashes en orden de uso (el más antiguo se descarta primero).
+
+    Methods:
+        add(item_hash): Registra un hash (lo refresca si ya estaba).
+        add_many(item_hashes): Registra varios hashes.
+        contains(item_hash) -> bool: True si el par ya conoce el hash.
+'''
+
+from collections import OrderedDict
+from typing import Iterable
+
+# Importacion de la configuracion
+from config import Config
+
+class KnownInventory:
+
+    def __init__(self, capacity: int = Config.PEER_KNOWN_INVENTORY_SIZE):
+        self._capacity = max(1, capacity)
+        self._hashes: 'OrderedDict[str, None]' = OrderedDict()
+
+    def add(self, item_hash: str) -> None:
+        self._hashes[item_hash] = None
+        self._hashes.move_to_end(item_hash)
+        if len(self._hashes) > self._capacity:
+            self._hashes.popitem(last = False)
+
+    def add_many(self, item_hashes: Iterable[str]) -> None:
+        for item_hash in item_hashes:
+            self.add(item_hash)
+
+    def contains(self, item_hash: str) -> bool:
+        return item_hash in self._hashes
+
+    def __len__(self) -> int:
+        return len(self._hashes)
\ No newline at end of file
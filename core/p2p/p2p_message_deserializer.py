@@ -16,10 +16,10 @@ class P2PMessageDeserializer:
             5. Usa el PAYLOAD_MAPPER para encontrar la clase DTO correspondiente.
             6. Deserializa los bytes del payload (JSON) en una instancia del DTO.
             7. Construye y retorna el objeto 'Message' final.
-'''
 
-'''
-(Docstring sin cambios)
+        deserialize_payload(command_bytes, checksum_bytes, payload_bytes) -> Message: Deserializa un frame ya cortado por el transporte.
+            Acepta el payload como 'memoryview' (Zero-Copy desde el buffer de P2PProtocol).
+            Ejecuta los pasos 3 a 7 de 'deserialize'.
 '''
 
 import json
@@ -39,6 +39,14 @@ from core.p2p.payloads.block_payload import BlockPayload
 from core.p2p.payloads.tx_payload import TxPayload
 from core.p2p.payloads.get_headers_payload import GetHeadersPayload
 from core.p2p.payloads.headers_payload import HeadersPayload
+from core.p2p.payloads.block_chunk_payload import BlockChunkPayload
+from core.p2p.payloads.compact_block_payload import CompactBlockPayload
+from core.p2p.payloads.get_block_txn_payload import GetBlockTxnPayload
+from core.p2p.payloads.block_txn_payload import BlockTxnPayload
+from core.p2p.payloads.get_addr_payload import GetAddrPayload
+from core.p2p.payloads.addr_payload import AddrPayload
+from core.p2p.payloads.ping_payload import PingPayload
+from core.p2p.payloads.pong_payload import PongPayload
 
 # Importar el DTO Anidado 
 from core.p2p.payloads.inv_vector import InvVector
@@ -52,27 +60,42 @@ class P2PMessageDeserializer:
         'block': BlockPayload,
         'tx': TxPayload,
         'getheaders': GetHeadersPayload,
-        'headers': HeadersPayload
+        'headers': HeadersPayload,
+        'blockchunk': BlockChunkPayload,
+        'cmpctblock': CompactBlockPayload,
+        'getblocktxn': GetBlockTxnPayload,
+        'blocktxn': BlockTxnPayload,
+        'getaddr': GetAddrPayload,
+        'addr': AddrPayload,
+        'ping': PingPayload,
+        'pong': PongPayload
     }
 
     @staticmethod
     def deserialize(data: bytes) -> Message:
     
+        data_view = memoryview(data)
+
         try:
-            header_bytes: bytes = data[:P2PMessageSerializer.HEADER_SIZE]
             header_format: str = P2PMessageSerializer.HEADER_FORMAT
-            unpacked_data: tuple[bytes, int, bytes] = struct.unpack(header_format, header_bytes)
+            unpacked_data: tuple[bytes, int, bytes] = struct.unpack_from(header_format, data_view, 0)
             command_bytes: bytes = unpacked_data[0]
             payload_size: int = unpacked_data[1] 
             checksum_bytes: bytes = unpacked_data[2]
         except struct.error:
             raise ValueError('Error P2P: Paquete de red incompleto (Header).')
 
-        payload_bytes = data[P2PMessageSerializer.HEADER_SIZE : P2PMessageSerializer.HEADER_SIZE + payload_size]
+        # Slicing de 'memoryview': no copia el payload.
+        payload_view = data_view[P2PMessageSerializer.HEADER_SIZE : P2PMessageSerializer.HEADER_SIZE + payload_size]
         
-        if len(payload_bytes) != payload_size:
+        if len(payload_view) != payload_size:
             raise ValueError('Error P2P: Tamaño de payload no coincide (Corrupto).')
 
+        return P2PMessageDeserializer.deserialize_payload(command_bytes, checksum_bytes, payload_view)
+
+    @staticmethod
+    def deserialize_payload(command_bytes: bytes, checksum_bytes: bytes, payload_bytes: bytes | memoryview) -> Message:
+
         # (Validación de Checksum - Correcta)
         first_hash_obj = hashlib.sha256(payload_bytes)
         first_hash_bytes: bytes = first_hash_obj.digest()
@@ -92,10 +115,11 @@ class P2PMessageDeserializer:
             raise ValueError(f'''Error P2P: Comando '{command}' desconocido.''')
 
         try:
-            payload_json_str: str = payload_bytes.decode('utf-8')
+            # Decodifica directamente desde el buffer (bytes o memoryview) sin copia intermedia.
+            payload_json_str: str = str(payload_bytes, 'utf-8')
             payload_dict: Dict[str, Any] = json.loads(payload_json_str)
 
-        except json.JSONDecodeError:
+        except (json.JSONDecodeError, UnicodeDecodeError):
             raise ValueError(f'''Error P2P: Payload JSON malformado para '{command}'.''')
 
         if command == 'inv' or command == 'getdata':
@@ -17,6 +17,9 @@ class P2PMessageSerializer:
             5. Empaquetar el Header
             6. Combinar y Retornar
 
+        serialize_frame(command: str, payload_dto: Any) -> Tuple[bytes, bytes]: Igual que 'serialize', pero retorna (header, payload) por separado.
+            Permite escribir ambas partes en el transporte sin concatenarlas (evita copiar payloads grandes).
+
         _calculate_checksum(payload: bytes) -> bytes: Método helper privado para calcular el checksum (doble SHA-256).
 '''
 
@@ -24,7 +27,7 @@ import json
 import struct 
 import hashlib
 from dataclasses import asdict, is_dataclass
-from typing import Any
+from typing import Any, Tuple
 
 class P2PMessageSerializer:
 
@@ -38,6 +41,11 @@ class P2PMessageSerializer:
 
     @staticmethod
     def serialize(command: str, payload_dto: Any) -> bytes:
+        header, payload_bytes = P2PMessageSerializer.serialize_frame(command, payload_dto)
+        return header + payload_bytes
+
+    @staticmethod
+    def serialize_frame(command: str, payload_dto: Any) -> Tuple[bytes, bytes]:
         if not is_dataclass(payload_dto) or isinstance(payload_dto, type):
             raise ValueError('El payload debe ser un OBJETO (instancia) dataclass (DTO P2P)')
             
@@ -51,4 +59,4 @@ class P2PMessageSerializer:
         command_bytes = command.encode('utf-8').ljust(P2PMessageSerializer.COMMAND_LENGTH, b'\x00')
         
         header = struct.pack(P2PMessageSerializer.HEADER_FORMAT, command_bytes, payload_size, checksum_bytes)
-        return header + payload_bytes
\ No newline at end of file
+        return header, payload_bytes
\ No newline at end of file
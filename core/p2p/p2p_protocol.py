@@ -0,0 +1,237 @@
+# network_of_interactive_nodes/core/p2p/p2p_protocol.py
+'''
+class P2PProtocol(asyncio.BufferedProtocol):
+    Transporte de bajo nivel (Zero-Copy) para UNA conexión P2P.
+    Lee directamente del socket a un buffer reutilizable por conexión y corta los 'frames'
+    (header + payload) con 'memoryview', sin concatenar ni copiar el payload.
+
+    Además expone la interfaz de escritura que antes daba 'asyncio.StreamWriter'
+    (write, drain, is_closing, close, wait_closed) para que P2PService no cambie su lógica de envío.
+
+    Attributes:
+        peer_id             (str | None):       Identificador 'host:port' del par (None hasta registrarse si es entrante).
+        _buffer             (bytearray):        Buffer de lectura reutilizable de la conexión.
+        _read_pos           (int):              Inicio de los bytes aún no consumidos.
+        _write_pos          (int):              Fin de los bytes recibidos.
+        _transport          (asyncio.Transport): Transporte asyncio subyacente.
+        _on_connection_made (Callable):         Callback al establecerse la conexión.
+        _on_frame           (Callable):         Callback por cada frame completo (command, checksum, payload_view).
+        _on_connection_lost (Callable):         Callback al cerrarse la conexión.
+        rate_limiter        (PeerRateLimiter | None): Presupuesto de entrada del par (mensajes y bytes por clase de comando).
+        _throttle_handle    (asyncio.TimerHandle | None): Reanudación pendiente de la lectura frenada por el límite.
+
+    Methods:
+        get_buffer(sizehint) -> memoryview: (asyncio) Entrega el espacio libre del buffer para 'recv_into'.
+            1. Compactar: mover el frame parcial pendiente al inicio (solo si ya se consumieron frames).
+            2. Devolver el buffer a su tamaño inicial si quedó vacío tras un frame grande.
+            3. Crecer (una sola vez por frame) si el frame pendiente no cabe.
+            4. Retornar una vista del espacio libre.
+
+        buffer_updated(nbytes): (asyncio) Procesa los bytes recién escritos en el buffer.
+            1. Avanzar el puntero de escritura.
+            2. Mientras haya un header completo: desempaquetarlo con 'unpack_from' (sin copiar).
+            3. **Validar tamaño contra Config.NETWORK_MAX_PAYLOAD_SIZE**
+            4. Si el payload está completo, consultar el límite de entrada (PeerRateLimiter.admit):
+               - Dentro del presupuesto: entregar una 'memoryview' del payload al callback.
+               - Fuera del presupuesto: dejar de leer del socket (TCP frena al par) y reintentar el frame al vencer la espera.
+               - Espera excesiva: descartar el frame.
+            5. Reiniciar punteros si el buffer quedó vacío.
+
+        is_throttled() -> bool: True si la lectura está frenada por el límite de entrada.
+
+        write(data) / drain() / is_closing() / close() / wait_closed(): Interfaz de escritura (estilo StreamWriter).
+'''
+
+import asyncio
+import logging
+import struct
+from typing import Any, Callable, List, Optional
+
+# Importaciones de la arquitectura
+from core.p2p.p2p_message_serializer import P2PMessageSerializer
+from core.p2p.peer_rate_limiter import PeerRateLimiter
+
+# Importacion de la configuracion
+from config import Config
+
+class P2PProtocol(asyncio.BufferedProtocol):
+
+    # Tamaño inicial del buffer de lectura (suficiente para mensajes de control: inv, version, headers)
+    INITIAL_BUFFER_SIZE: int = 64 * 1024
+
+    def __init__(self,
+                 on_connection_made: Callable[['P2PProtocol'], None],
+                 on_frame: Callable[['P2PProtocol', bytes, bytes, memoryview], None],
+                 on_connection_lost: Callable[['P2PProtocol'], None],
+                 peer_id: Optional[str] = None,
+                 rate_limiter: Optional[PeerRateLimiter] = None):
+
+        self.peer_id: Optional[str] = peer_id
+        self.rate_limiter: Optional[PeerRateLimiter] = rate_limiter
+        self._throttle_handle: Optional[asyncio.TimerHandle] = None
+        self._on_connection_made = on_connection_made
+        self._on_frame = on_frame
+        self._on_connection_lost = on_connection_lost
+
+        self._buffer: bytearray = bytearray(P2PProtocol.INITIAL_BUFFER_SIZE)
+        self._read_pos: int = 0
+        self._write_pos: int = 0
+
+        self._transport: Optional[asyncio.Transport] = None
+        self._paused: bool = False
+        self._drain_waiters: List[asyncio.Future[None]] = []
+        self._closed: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+
+    # --- Ciclo de Vida (asyncio) ---
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self._transport = transport # type: ignore[assignment]
+        self._on_connection_made(self)
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        if self._throttle_handle is not None:
+            self._throttle_handle.cancel()
+            self._throttle_handle = None
+        self._wake_drain_waiters(ConnectionResetError('Conexión P2P cerrada.'))
+        if not self._closed.done():
+            self._closed.set_result(None)
+        self._on_connection_lost(self)
+
+    # --- Lectura (Zero-Copy) ---
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        pending: int = self._write_pos - self._read_pos
+
+        # 1. Compactar: el frame parcial pasa al inicio (cada byte se mueve como máximo una vez).
+        if self._read_pos > 0:
+            self._buffer[:pending] = self._buffer[self._read_pos:self._write_pos]
+            self._read_pos = 0
+            self._write_pos = pending
+
+        # 2. Liberar la memoria de un frame grande ya procesado.
+        if pending == 0 and len(self._buffer) > P2PProtocol.INITIAL_BUFFER_SIZE:
+            self._buffer = bytearray(P2PProtocol.INITIAL_BUFFER_SIZE)
+
+        # 3. Crecer hasta el tamaño exacto del frame pendiente (una sola realocación).
+        required: int = self._write_pos + self._missing_bytes()
+        #    (Nuevo bytearray en lugar de 'extend': no falla si aún hay vistas exportadas del anterior.)
+        if required > len(self._buffer):
+            grown_buffer = bytearray(required)
+            grown_buffer[:self._write_pos] = self._buffer[:self._write_pos]
+            self._buffer = grown_buffer
+
+        return memoryview(self._buffer)[self._write_pos:]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        self._write_pos += nbytes
+        self._process_frames()
+
+    def is_throttled(self) -> bool:
+        return self._throttle_handle is not None
+
+    def _process_frames(self) -> None:
+        header_size: int = P2PMessageSerializer.HEADER_SIZE
+
+        with memoryview(self._buffer) as view:
+            while self._write_pos - self._read_pos >= header_size:
+                if self._transport is not None and self._transport.is_closing():
+                    return # Desconexión solicitada durante el procesamiento
+
+                command_bytes, payload_size, checksum_bytes = struct.unpack_from(
+                    P2PMessageSerializer.HEADER_FORMAT, view, self._read_pos
+                )
+
+                if payload_size > Config.NETWORK_MAX_PAYLOAD_SIZE:
+                    logging.warning(f'SEGURIDAD P2P: Par {self.peer_id} excedió límite de configuración ({payload_size} bytes). Desconectando.')
+                    self.close()
+                    return
+
+                frame_end: int = self._read_pos + header_size + payload_size
+                if frame_end > self._write_pos:
+                    break # Frame incompleto: esperar más bytes
+
+                if self.rate_limiter is not None:
+                    delay = self.rate_limiter.admit(command_bytes, header_size + payload_size)
+                    if delay is None:
+                        self._read_pos = frame_end # Descartado
+                        continue
+                    if delay > 0:
+                        self._throttle(delay)
+                        return # El frame queda en el buffer hasta que haya presupuesto
+
+                with view[self._read_pos + header_size:frame_end] as payload_view:
+                    self._read_pos = frame_end
+                    self._on_frame(self, command_bytes, checksum_bytes, payload_view)
+
+        if self._read_pos == self._write_pos:
+            self._read_pos = 0
+            self._write_pos = 0
+
+    def _throttle(self, delay: float) -> None:
+        if self._transport is not None:
+            self._transport.pause_reading()
+        self._throttle_handle = asyncio.get_running_loop().call_later(delay, self._resume_after_throttle)
+
+    def _resume_after_throttle(self) -> None:
+        self._throttle_handle = None
+        if self._transport is None or self._transport.is_closing(): return
+        self._process_frames()
+        if self._throttle_handle is None:
+            self._transport.resume_reading()
+
+    def _missing_bytes(self) -> int:
+        '''Bytes que faltan para completar el frame pendiente (o el header, si aún no llegó).'''
+        pending: int = self._write_pos - self._read_pos
+        header_size: int = P2PMessageSerializer.HEADER_SIZE
+
+        if pending < header_size:
+            return header_size - pending
+
+        _command, payload_size, _checksum = struct.unpack_from(
+            P2PMessageSerializer.HEADER_FORMAT, self._buffer, self._read_pos
+        )
+        return max(0, min(payload_size, Config.NETWORK_MAX_PAYLOAD_SIZE) + header_size - pending)
+
+    # --- Escritura (Interfaz estilo StreamWriter) ---
+
+    def get_extra_info(self, name: str, default: Any = None) -> Any:
+        if self._transport is None: return default
+        return self._transport.get_extra_info(name, default)
+
+    def write(self, data: bytes) -> None:
+        if self._transport is None or self._transport.is_closing():
+            raise ConnectionResetError('Conexión P2P cerrada.')
+        self._transport.write(data)
+
+    async def drain(self) -> None:
+        if self.is_closing():
+            raise ConnectionResetError('Conexión P2P cerrada.')
+        if not self._paused:
+            return
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._drain_waiters.append(waiter)
+        await waiter
+
+    def pause_writing(self) -> None:
+        self._paused = True
+
+    def resume_writing(self) -> None:
+        self._paused = False
+        self._wake_drain_waiters(None)
+
+    def is_closing(self) -> bool:
+        return self._transport is None or self._transport.is_closing()
+
+    def close(self) -> None:
+        if self._transport is not None:
+            self._transport.close()
+
+    async def wait_closed(self) -> None:
+        await asyncio.shield(self._closed)
+
+    def _wake_drain_waiters(self, exc: Optional[Exception]) -> None:
+        waiters, self._drain_waiters = self._drain_waiters, []
+        for waiter in waiters:
+            if waiter.done(): continue
+            if exc is None: waiter.set_result(None)
+            else: waiter.set_exception(exc)
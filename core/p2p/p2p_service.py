@@ -11,9 +11,24 @@ class P2PService:
         _host       (str):              El host donde escucha el servidor.
         _port       (int):              El puerto donde escucha el servidor.
         _seed_peers (List):             Una lista de tuplas (host, port) para la conexión inicial.
+        _address_manager (AddressManager | None): Libreta de direcciones ('peers.dat'). Sin ella, solo se usan los seeds.
+        _pending_connections (Set[str]): Conexiones salientes en curso ('host:port').
+        _listen_addresses (Dict[str, str]): peer_id -> 'host:puerto de escucha' anunciado en su 'version'.
+        _maintenance_task (asyncio.Task): Revisión periódica de las conexiones salientes.
+        _ping_task  (asyncio.Task):     'ping' periódico a cada par (vida y latencia).
+        _timeout_disconnects (int):     Pares desconectados por no responder o por inactividad.
+        _inv_stats  (Dict[str, int]):   Contadores de anuncios 'inv' enviados y suprimidos (el par ya conocía los items).
+        _trickle_task (asyncio.Task):   Vaciado periódico de las colas de anuncios de TXs de cada par.
+        _block_push_peers (Set[str]):   Pares que pidieron en su 'version' recibir los bloques nuevos sin 'inv' (alto ancho de banda).
+        _block_push_sources (Set[str]): Pares a los que se lo pedimos en nuestro 'version' (se aceptan sus 'cmpctblock' no pedidos).
+        _ban_manager (PeerBanManager | None): Puntuación de mal comportamiento y vetos ('banlist.json'). Sin él, las faltas solo se registran.
+        _throttle_totals (Dict[str, Dict[str, float]]): Frames demorados / descartados por el límite de entrada
+            de las conexiones ya cerradas, por clase de comando (las abiertas se suman en 'get_metrics').
 
     Methods:
         start_service(): Inicia el servicio (escucha y conexión a seeds).
+            0. Cargar la libreta de direcciones (añadiendo los seeds) y los vetos, y arrancar el mantenimiento
+               de conexiones y los 'ping'
             1. Iniciar el servidor (escuchar)
             2. Conectar a los 'seeds' (hablar)
 
@@ -25,79 +40,190 @@ class P2PService:
             2. Iterar sobre los seeds y crear tareas de conexión
 
         stop_service(self): Detiene el servicio P2P (cierra el servidor y desconecta a los pares).
+            0. Detener el vaciado periódico de anuncios de TXs, los 'ping' y el mantenimiento (guardando la libreta y los vetos)
             1. Detener el servidor (no más conexiones entrantes)
             2. Desconectar todos los pares (cerrar conexiones)
-            3. Crear tareas para cerrar cada 'writer'
-            4. Esperar a que todos los writers se cierren
+            3. Crear tareas para cerrar cada conexión
+            4. Esperar a que todas las conexiones se cierren
             
         connect_to_peer(host, port): Inicia una conexión saliente a un par.
-            1. Generar ID y evitar reconexión
-            2. Intentar abrir la conexión (outbound)
-            3. Registrar la nueva conexión
+            1. Generar ID y evitar reconexión (o un intento ya en curso, o un par vetado)
+            2. Intentar abrir la conexión (outbound, con tiempo máximo)
+            3. Registrar el resultado en la libreta (éxito con su latencia, o fallo: espera exponencial)
 
-        _handle_inbound_connection(reader, writer): (Callback) Maneja conexiones entrantes.
-            1. Obtener ID del par entrante
+        _create_protocol(peer_id): (Privado) Fábrica de P2PProtocol (una instancia por conexión, con su propio
+            límite de entrada PeerRateLimiter: un par abusivo solo frena su propia conexión).
+
+        _on_connection_made(connection): (Callback) Maneja conexiones nuevas (entrantes y salientes).
+            1. Si es entrante, obtener ID del par desde el socket (y cerrarla si su IP está vetada; rechazarla si ya hay
+               Config.NETWORK_MAX_INBOUND_PEERS entrantes, enviándole antes otras direcciones a las que conectarse)
             2. Registrar la nueva conexión
 
-        handle_new_connection(reader, writer, peer_id, is_outbound): (Lógica) Registra un nuevo par (entrante o saliente).
+        handle_new_connection(connection, peer_id, is_outbound): (Lógica) Registra un nuevo par (entrante o saliente).
             1. Crear y almacenar el objeto Peer
-            2. Iniciar la tarea de escucha para este par
-            3. Si somos el iniciador (outbound), enviar handshake
-
-        _listen_to_peer(peer, peer_id): (Bucle) Tarea principal que escucha mensajes de un par conectado.
-            1. Bucle principal de escucha
-            2. Leer el header (tamaño fijo)
-            3. Pre-parsear el header (solo para obtener el tamaño)
-            4. **Validar tamaño contra NetworkConfig.MAX_PAYLOAD_SIZE**
-            5. Leer el payload (tamaño variable)
-            6. Combinar header + payload
-            7. Deserializar el paquete completo
-            8. Pasar el mensaje al Nodo (capa superior)
-            9. Manejar desconexión y limpiar
+            2. Si somos el iniciador (outbound), enviar handshake
+
+        _on_frame(connection, command_bytes, checksum_bytes, payload_view): (Callback) Procesa un frame completo.
+            (El corte del frame y la validación de tamaño contra Config.NETWORK_MAX_PAYLOAD_SIZE
+             ocurren en P2PProtocol, leyendo a un buffer reutilizable sin concatenar header + payload)
+            1. Deserializar el payload directamente desde la 'memoryview'
+            2. Marcar al par como vivo; 'ping'/'pong' se resuelven aquí (responder / medir el RTT)
+            3. Pasar el resto de mensajes al Nodo (capa superior)
+            4. Un mensaje corrupto penaliza al par ('malformed_message', o 'unknown_command' si el comando no existe)
+            5. Ante un error inesperado, desconectar al par
+
+        _on_connection_lost(connection): (Callback) Maneja desconexión y limpia (incluido el modo de alto ancho de banda;
+            los contadores de su límite de entrada pasan a los totales). Avisa al Nodo (INode.handle_peer_disconnected)
+            para que libere lo que guardaba del par (ej. bloques a medio reensamblar).
+            Una conexión saliente cerrada antes de recibir el 'version' del par cuenta como fallo en la libreta.
 
         get_peer(peer_id): Retorna un objeto Peer si está conectado.
 
+        get_peers() -> List[Peer]: Pares conectados.
+
+        get_peer_stats() -> List[Dict]: Por par: dirección, sentido, RTT (EWMA, jitter, mínimo, último), inactividad,
+            puntuación de mal comportamiento y frenado por el límite de entrada, del más rápido al más lento.
+
+        note_listen_address(peer, listen_port) -> bool: Registra la dirección de escucha de un par
+            (anunciada en su 'version') en la libreta. True si era nueva.
+            (En loopback el veto es por 'IP:puerto de escucha': si esa dirección está vetada, cierra la conexión.)
+
+        report_misbehavior(peer_id, reason): Penaliza al par por una falta (PeerBanManager.penalize).
+            Si cruza el umbral, desconecta todas las conexiones de su origen (IP) y ya no se aceptan ni se inician
+            conexiones con él: deja de consumir CPU de validación.
+
+        _ping_loop(): (Privado) Cada Config.NETWORK_PING_INTERVAL_SEC, por cada par:
+            1. Desconectarlo si su 'ping' lleva más de Config.NETWORK_PING_TIMEOUT_SEC sin 'pong', o si no envió
+               nada en Config.NETWORK_IDLE_TIMEOUT_SEC (una conexión TCP muerta no da error hasta escribir)
+            2. Si no tiene 'ping' en curso, enviarle uno con un nonce aleatorio
+
+        _maintenance_loop(): (Privado) Cada Config.NETWORK_CONNECTION_CHECK_INTERVAL_SEC:
+            0. Mantenimiento del Nodo (INode.run_maintenance: ej. descartar reensamblados vencidos)
+            1. Si hay menos de Config.NETWORK_TARGET_OUTBOUND_PEERS salientes, conectar a los mejores candidatos
+               de la libreta (los caídos vuelven a intentarse cuando vence su espera exponencial; los vetados no)
+            2. Guardar la libreta si cambió
+
         send_message(peer, command, payload_dto): Serializa y envía un mensaje a un par.
-            1. Serializar el mensaje (a 'tu manera')
-            2. Enviar los bytes por el 'writer'
+            1. Serializar el mensaje (header y payload por separado)
+            2. Enviar los bytes por la conexión (sin concatenarlos)
 
         broadcast(command, payload_dto): Envía un mensaje a todos los pares conectados.
             1. Iterar sobre todos los pares conectados
             2. Enviar el mensaje a cada uno
+
+        broadcast_inventory(inventory): Anuncia un inventario ('inv') solo a quien no lo conoce.
+            1. Por cada par, filtrar los items que ya conoce (Peer.known_inventory)
+            2. Si no queda ninguno, suprimir el mensaje (y contarlo)
+            3. Marcar los items restantes como conocidos y enviar un 'inv' con ellos
+
+        enable_block_push(peer) -> bool: Acepta al par en el modo de alto ancho de banda
+            (hasta Config.NETWORK_HIGH_BANDWIDTH_PEERS pares conectados). False si no quedan plazas.
+
+        has_block_push_peers() -> bool: True si algún par conectado recibe los bloques empujados.
+
+        add_block_push_source(peer, max_sources) -> bool: Registra que pedimos al par que nos empuje sus bloques
+            (hasta 'max_sources' pares conectados). False si no quedan plazas.
+
+        is_block_push_source(peer_id) -> bool: True si le pedimos al par que nos empuje sus bloques.
+
+        broadcast_block(inv_vector, push_payload): Difunde un bloque nuevo a quien no lo conoce.
+            1. Por cada par, omitir si ya conoce el bloque y, si no, marcarlo como conocido
+            2. Pares de alto ancho de banda: enviar el bloque compacto directamente ('cmpctblock')
+            3. El resto: anunciarlo con un 'inv' (3 pasos: inv, getdata, bloque)
+
+        queue_tx_inventory(inventory): Encola anuncios de TXs por par (goteo / 'trickle').
+            1. Por cada par, descartar los items que ya conoce y marcar el resto como conocidos
+            2. Añadirlos a la cola del par (Peer.pending_tx_inventory)
+            3. Si la cola llegó a Config.NETWORK_TX_INV_BATCH_SIZE, vaciarla ya; si no, esperar al próximo goteo
+
+        _trickle_loop(): (Privado) Cada Config.NETWORK_TX_TRICKLE_INTERVAL_SEC (aleatorizado) vacía la cola de cada par.
+
+        _flush_tx_inventory(peer): (Privado) Envía la cola del par en 'inv' de hasta Config.NETWORK_TX_INV_BATCH_SIZE items.
+
+        get_metrics() -> Dict: Pares conectados (salientes / entrantes), direcciones conocidas, contadores de 'inv'
+            enviados / suprimidos / encolados, bloques empujados a pares de alto ancho de banda, faltas / vetos
+            y frames demorados / descartados por el límite de entrada (por clase de comando, y pares frenados ahora).
 '''
 
+import time
+import random
 import asyncio
 import logging
-import struct 
-from typing import Dict, Any, List, Tuple, Coroutine
+from typing import Dict, Any, List, Optional, Set, Tuple, Coroutine
 
 # Importaciones de la arquitectura
 from core.interfaces.i_node import INode 
 from core.p2p.peer import Peer
+from core.p2p.p2p_protocol import P2PProtocol
 from core.p2p.p2p_message_serializer import P2PMessageSerializer
 from core.p2p.p2p_message_deserializer import P2PMessageDeserializer  
 from core.p2p.message import Message 
+from core.p2p.payloads.inv_payload import InvPayload
+from core.p2p.payloads.inv_vector import InvVector
+from core.p2p.payloads.compact_block_payload import CompactBlockPayload
+from core.p2p.payloads.addr_payload import AddrPayload
+from core.p2p.payloads.ping_payload import PingPayload
+from core.p2p.payloads.pong_payload import PongPayload
+from core.p2p.address_manager import AddressManager
+from core.p2p.peer_ban_manager import PeerBanManager
+from core.p2p.peer_rate_limiter import PeerRateLimiter
 
 # Importacion de la configuracion
 from config import Config
 
 class P2PService:
 
-    def __init__(self, node: INode, host: str, port: int, seed_peers: List[Tuple[str, int]] | None = None):
+    def __init__(self,
+                 node: INode,
+                 host: str,
+                 port: int,
+                 seed_peers: List[Tuple[str, int]] | None = None,
+                 address_manager: AddressManager | None = None,
+                 ban_manager: PeerBanManager | None = None):
         self._node: INode = node
         self._peers: Dict[str, Peer] = {}
         self._server: asyncio.Server | None = None
         self._host: str = host
         self._port: int = port
         self._seed_peers: List[Tuple[str, int]] = seed_peers or []
+        self._inv_stats: Dict[str, int] = {'sent_messages': 0, 'suppressed_messages': 0, 'suppressed_items': 0, 'trickled_items': 0, 'pushed_blocks': 0}
+        self._block_push_peers: Set[str] = set()
+        self._block_push_sources: Set[str] = set()
+        self._trickle_task: asyncio.Task[None] | None = None
+        self._address_manager: AddressManager | None = address_manager
+        self._pending_connections: Set[str] = set()
+        self._listen_addresses: Dict[str, str] = {}
+        self._maintenance_task: asyncio.Task[None] | None = None
+        self._ping_task: asyncio.Task[None] | None = None
+        self._timeout_disconnects: int = 0
+        self._ban_manager: PeerBanManager | None = ban_manager
+        self._throttle_totals: Dict[str, Dict[str, float]] = {}
+
+    @property
+    def listen_port(self) -> int:
+        return self._port
+
+    @property
+    def address_manager(self) -> AddressManager | None:
+        return self._address_manager
 
     async def start_service(self):
+        if self._address_manager is not None:
+            self._address_manager.load()
+            for host, port in self._seed_peers:
+                self._address_manager.add(host, port)
+        self._maintenance_task = asyncio.create_task(self._maintenance_loop())
+        if self._ban_manager is not None:
+            self._ban_manager.load()
+        self._ping_task = asyncio.create_task(self._ping_loop())
+
         asyncio.create_task(self._start_listening())
         asyncio.create_task(self._connect_to_seeds())
 
     async def _start_listening(self):
         try:
-            self._server = await asyncio.start_server(self._handle_inbound_connection, self._host, self._port)
+            loop = asyncio.get_running_loop()
+            self._server = await loop.create_server(lambda: self._create_protocol(None), self._host, self._port)
             logging.info(f'Servidor P2P escuchando en {self._host}:{self._port}')
         except OSError as e:
             logging.error(f'Error P2P: No se pudo iniciar el servidor en {self._port}. {e}')
@@ -110,23 +236,72 @@ class P2PService:
 
     async def connect_to_peer(self, host: str, port: int):
         peer_id = f'{host}:{port}'
-        if peer_id in self._peers: return
+        if peer_id in self._peers or peer_id in self._pending_connections: return
+        if self._is_banned(host, port):
+            logging.info(f'P2P: {peer_id} está vetado. No se conecta.')
+            return
+        self._pending_connections.add(peer_id)
+        if self._address_manager is not None: self._address_manager.mark_attempt(host, port)
         
         try:
-            logging.info(f'P2P: Conectando a (seed) {peer_id}...')
-            reader, writer = await asyncio.open_connection(host, port)
-            self.handle_new_connection(reader, writer, peer_id, is_outbound = True)
+            logging.info(f'P2P: Conectando a {peer_id}...')
+            loop = asyncio.get_running_loop()
+            started = time.monotonic()
+            await asyncio.wait_for(
+                loop.create_connection(lambda: self._create_protocol(peer_id), host, port),
+                timeout = Config.NETWORK_CONNECT_TIMEOUT_SEC
+            )
+            if self._address_manager is not None: self._address_manager.mark_success(host, port, time.monotonic() - started)
             
-        except OSError as e:
-            logging.warning(f'Error P2P: No se pudo conectar a {peer_id}. {e}')
+        except (OSError, asyncio.TimeoutError) as e:
+            logging.warning(f'Error P2P: No se pudo conectar a {peer_id}. {e or "Tiempo agotado"}')
+            if self._address_manager is not None: self._address_manager.mark_failure(host, port)
+
+        finally:
+            self._pending_connections.discard(peer_id)
+
+    def _create_protocol(self, peer_id: str | None) -> P2PProtocol:
+        return P2PProtocol(
+            on_connection_made = self._on_connection_made,
+            on_frame = self._on_frame,
+            on_connection_lost = self._on_connection_lost,
+            peer_id = peer_id,
+            rate_limiter = PeerRateLimiter()
+        )
 
-    async def _handle_inbound_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
-        addr = writer.get_extra_info('peername')
-        peer_id = f'{addr[0]}:{addr[1]}'
-        logging.info(f'Nueva conexión P2P entrante de: {peer_id}')
-        self.handle_new_connection(reader, writer, peer_id, is_outbound = False)
+    def _on_connection_made(self, connection: P2PProtocol):
+        is_outbound = connection.peer_id is not None
+        
+        if not is_outbound:
+            addr = connection.get_extra_info('peername')
+            connection.peer_id = f'{addr[0]}:{addr[1]}'
+
+            if self._is_banned(addr[0], addr[1]):
+                logging.info(f'P2P: Conexión entrante de {connection.peer_id} rechazada (vetado).')
+                connection.close()
+                return
+
+            if sum(1 for peer in self._peers.values() if not peer.outbound) >= Config.NETWORK_MAX_INBOUND_PEERS:
+                logging.info(f'P2P: Conexión entrante de {connection.peer_id} rechazada (límite de {Config.NETWORK_MAX_INBOUND_PEERS} entrantes).')
+                asyncio.create_task(self._refer_and_close(connection))
+                return
+            logging.info(f'Nueva conexión P2P entrante de: {connection.peer_id}')
+        
+        self.handle_new_connection(connection, str(connection.peer_id), is_outbound)
 
     async def stop_service(self):
+
+        if self._trickle_task is not None:
+            self._trickle_task.cancel()
+            self._trickle_task = None
+
+        for task in (self._maintenance_task, self._ping_task):
+            if task is not None: task.cancel()
+        self._maintenance_task = self._ping_task = None
+        if self._address_manager is not None:
+            self._address_manager.save()
+        if self._ban_manager is not None:
+            self._ban_manager.save()
         
         if self._server:
             self._server.close()
@@ -141,71 +316,307 @@ class P2PService:
             tasks: List[Coroutine[Any, Any, None]] = [] 
 
             for peer in peers_to_disconnect:
-                if not peer.writer.is_closing():
-                    peer.writer.close()
-                    tasks.append(peer.writer.wait_closed())
+                if not peer.connection.is_closing():
+                    peer.connection.close()
+                    tasks.append(peer.connection.wait_closed())
             
             await asyncio.gather(*tasks, return_exceptions = True)
         self._peers.clear()
         logging.info('Servicio P2P completamente detenido.')
 
-    def handle_new_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, peer_id: str, is_outbound: bool):
-        peer = Peer(host = peer_id.split(':')[0], port = int(peer_id.split(':')[1]), reader = reader, writer = writer)
+    def handle_new_connection(self, connection: P2PProtocol, peer_id: str, is_outbound: bool):
+        host, _, port = peer_id.rpartition(':')
+        peer = Peer(host = host, port = int(port), connection = connection, outbound = is_outbound)
         self._peers[peer_id] = peer
-        asyncio.create_task(self._listen_to_peer(peer, peer_id))
         
         if is_outbound:
             self._node.initiate_handshake(peer)
 
-    async def _listen_to_peer(self, peer: Peer, peer_id: str):
+    def _on_frame(self, connection: P2PProtocol, command_bytes: bytes, checksum_bytes: bytes, payload_view: memoryview):
+        peer_id = str(connection.peer_id)
 
         try:
-            while True:
-                header_data = await peer.reader.readexactly(P2PMessageSerializer.HEADER_SIZE)
-                
-                try:
-                    _command, payload_size, _checksum = struct.unpack(P2PMessageSerializer.HEADER_FORMAT, header_data)
-                except struct.error:
-                    logging.warning(f'Error P2P: Header corrupto de {peer_id}. Desconectando.')
-                    break
-                
-                # Usamos Config.NETWORK_MAX_PAYLOAD_SIZE en lugar de NetworkConfig directo
-                if payload_size > Config.NETWORK_MAX_PAYLOAD_SIZE:
-                    logging.warning(f'SEGURIDAD P2P: Par {peer_id} excedió límite de configuración ({payload_size} bytes). Desconectando.')
-                    break
-
-                payload_data = await peer.reader.readexactly(payload_size)
-                full_packet = header_data + payload_data
-                
-                try:
-                    message: Message = P2PMessageDeserializer.deserialize(full_packet)
-                    self._node.handle_message(message, peer_id)
-                    
-                except ValueError as e:
-                    logging.warning(f'Error P2P: Mensaje corrupto de {peer_id}. {e}')
-                    
-        except (asyncio.IncompleteReadError, ConnectionResetError):
-            logging.info(f'Par {peer_id} desconectado (Fin de stream).')
+            message: Message = P2PMessageDeserializer.deserialize_payload(command_bytes, checksum_bytes, payload_view)
+
+            peer = self._peers.get(peer_id)
+            if peer is not None:
+                peer.latency.touch()
+                if self._handle_keepalive(peer, message): return
+
+            self._node.handle_message(message, peer_id)
+            
+        except ValueError as e:
+            logging.warning(f'Error P2P: Mensaje corrupto de {peer_id}. {e}')
+            self.report_misbehavior(peer_id, 'unknown_command' if self._is_unknown_command(command_bytes) else 'malformed_message')
         except Exception as e:
             logging.error(f'Error inesperado en conexión con {peer_id}: {e}')
-        finally:
+            connection.close()
+
+    def _on_connection_lost(self, connection: P2PProtocol):
+        peer_id = str(connection.peer_id)
+        peer = self._peers.get(peer_id)
+        if connection.rate_limiter is not None:
+            self._merge_throttle_stats(self._throttle_totals, connection.rate_limiter.stats)
+        
+        if peer and peer.connection is connection:
             self._peers.pop(peer_id, None)
-            if not peer.writer.is_closing():
-                peer.writer.close()
-                await peer.writer.wait_closed()
+            self._block_push_peers.discard(peer_id)
+            self._block_push_sources.discard(peer_id)
+            self._node.handle_peer_disconnected(peer_id)
+            handshaken = self._listen_addresses.pop(peer_id, None) is not None
+            if peer.outbound and not handshaken and self._address_manager is not None:
+                self._address_manager.mark_failure(peer.host, peer.port)
+        logging.info(f'Par {peer_id} desconectado (Fin de stream).')
 
     def get_peer(self, peer_id: str) -> Peer | None:
         return self._peers.get(peer_id)
 
+    def get_peers(self) -> List[Peer]:
+        return list(self._peers.values())
+
+    def get_peer_stats(self) -> List[Dict[str, Any]]:
+        stats: List[Dict[str, Any]] = []
+        for peer in self._peers.values():
+            entry: Dict[str, Any] = {
+                'peer_id': peer.peer_id,
+                'direction': 'outbound' if peer.outbound else 'inbound',
+                'listen_address': self._listen_addresses.get(peer.peer_id),
+                'high_bandwidth': peer.peer_id in self._block_push_peers,
+                'misbehavior_score': round(self._ban_manager.get_score(self._ban_key(peer)), 1) if self._ban_manager is not None else 0.0,
+                'throttled': peer.connection.is_throttled(),
+                'throttling': peer.connection.rate_limiter.stats if peer.connection.rate_limiter is not None else {}
+            }
+            entry.update(peer.latency.to_dict())
+            stats.append(entry)
+        stats.sort(key = lambda entry: entry['rtt_ms'] if entry['rtt_ms'] is not None else float('inf'))
+        return stats
+
+    def note_listen_address(self, peer: Peer, listen_port: int) -> bool:
+        self._listen_addresses[peer.peer_id] = f'{peer.host}:{listen_port}'
+        if self._is_banned(peer.host, listen_port):
+            logging.info(f'P2P: {peer.peer_id} escucha en una dirección vetada. Desconectando...')
+            peer.connection.close()
+            return False
+        if self._address_manager is None: return False
+        return self._address_manager.add(peer.host, listen_port)
+
+    def report_misbehavior(self, peer_id: str, reason: str) -> None:
+        peer = self._peers.get(peer_id)
+        if peer is None or self._ban_manager is None: return
+
+        key = self._ban_key(peer)
+        if not self._ban_manager.penalize(key, reason): return
+
+        # Vetado: fuera todas sus conexiones (un par hostil no sigue consumiendo validación).
+        for other in list(self._peers.values()):
+            if self._ban_key(other) == key and not other.connection.is_closing():
+                other.connection.close()
+
     async def send_message(self, peer: Peer, command: str, payload_dto: Any):
         try:
-            message_bytes = P2PMessageSerializer.serialize(command, payload_dto)
-            peer.writer.write(message_bytes)
-            await peer.writer.drain()
+            header_bytes, payload_bytes = P2PMessageSerializer.serialize_frame(command, payload_dto)
+            peer.connection.write(header_bytes)
+            peer.connection.write(payload_bytes)
+            await peer.connection.drain()
             
         except (OSError, BrokenPipeError) as e:
             logging.warning(f'Error P2P: No se pudo enviar mensaje a {peer.host}. {e}')
 
     async def broadcast(self, command: str, payload_dto: Any):
         for peer in self._peers.values():
-            await self.send_message(peer, command, payload_dto)
\ No newline at end of file
+            await self.send_message(peer, command, payload_dto)
+
+    async def broadcast_inventory(self, inventory: List[InvVector]):
+        for peer in list(self._peers.values()):
+            unknown = [item for item in inventory if not peer.known_inventory.contains(item.hash)]
+            self._inv_stats['suppressed_items'] += len(inventory) - len(unknown)
+
+            if not unknown:
+                self._inv_stats['suppressed_messages'] += 1
+                continue
+
+            peer.known_inventory.add_many(item.hash for item in unknown)
+            self._inv_stats['sent_messages'] += 1
+            await self.send_message(peer, 'inv', InvPayload(inventory = unknown))
+
+    def enable_block_push(self, peer: Peer) -> bool:
+        if peer.peer_id in self._block_push_peers: return True
+        if len(self._block_push_peers) >= Config.NETWORK_HIGH_BANDWIDTH_PEERS: return False
+        self._block_push_peers.add(peer.peer_id)
+        return True
+
+    def has_block_push_peers(self) -> bool:
+        return bool(self._block_push_peers)
+
+    def add_block_push_source(self, peer: Peer, max_sources: int) -> bool:
+        if peer.peer_id in self._block_push_sources: return True
+        if len(self._block_push_sources) >= max_sources: return False
+        self._block_push_sources.add(peer.peer_id)
+        return True
+
+    def is_block_push_source(self, peer_id: str) -> bool:
+        return peer_id in self._block_push_sources
+
+    async def broadcast_block(self, inv_vector: InvVector, push_payload: Optional[CompactBlockPayload] = None):
+        for peer in list(self._peers.values()):
+            if peer.known_inventory.contains(inv_vector.hash):
+                self._inv_stats['suppressed_items'] += 1
+                self._inv_stats['suppressed_messages'] += 1
+                continue
+            peer.known_inventory.add(inv_vector.hash)
+
+            # Alto ancho de banda: el bloque viaja sin esperar al 'getdata' del par.
+            if push_payload is not None and peer.peer_id in self._block_push_peers:
+                self._inv_stats['pushed_blocks'] += 1
+                await self.send_message(peer, 'cmpctblock', push_payload)
+                continue
+
+            self._inv_stats['sent_messages'] += 1
+            await self.send_message(peer, 'inv', InvPayload(inventory = [inv_vector]))
+
+    def queue_tx_inventory(self, inventory: List[InvVector]):
+        self._ensure_trickle_task()
+
+        for peer in list(self._peers.values()):
+            unknown = [item for item in inventory if not peer.known_inventory.contains(item.hash)]
+            self._inv_stats['suppressed_items'] += len(inventory) - len(unknown)
+            if not unknown: continue
+
+            peer.known_inventory.add_many(item.hash for item in unknown)
+            queued_before = len(peer.pending_tx_inventory)
+            peer.pending_tx_inventory.extend(unknown)
+
+            # Un solo vaciado anticipado al cruzar el tamaño de lote (ese vaciado se lleva toda la cola).
+            if queued_before < Config.NETWORK_TX_INV_BATCH_SIZE <= len(peer.pending_tx_inventory):
+                asyncio.create_task(self._flush_tx_inventory(peer))
+
+    def get_metrics(self) -> Dict[str, Any]:
+        inv_metrics: Dict[str, Any] = dict(self._inv_stats)
+        inv_metrics['queued_tx_items'] = sum(len(peer.pending_tx_inventory) for peer in self._peers.values())
+        outbound = sum(1 for peer in self._peers.values() if peer.outbound)
+        connections: Dict[str, Any] = {
+            'outbound': outbound, 'inbound': len(self._peers) - outbound,
+            'pending': len(self._pending_connections), 'timeout_disconnects': self._timeout_disconnects
+        }
+        if self._address_manager is not None:
+            connections['known_addresses'] = len(self._address_manager)
+        metrics: Dict[str, Any] = {'peers': len(self._peers), 'connections': connections, 'inv': inv_metrics, 'block_push_peers': len(self._block_push_peers)}
+        if self._ban_manager is not None:
+            metrics['misbehavior'] = self._ban_manager.get_metrics()
+
+        throttling: Dict[str, Dict[str, float]] = {}
+        self._merge_throttle_stats(throttling, self._throttle_totals)
+        for peer in self._peers.values():
+            if peer.connection.rate_limiter is not None:
+                self._merge_throttle_stats(throttling, peer.connection.rate_limiter.stats)
+        metrics['throttling'] = {
+            'throttled_peers': sum(1 for peer in self._peers.values() if peer.connection.is_throttled()),
+            'delayed': sum(int(stats['delayed']) for stats in throttling.values()),
+            'dropped': sum(int(stats['dropped']) for stats in throttling.values()),
+            'by_class': {command_class: {**stats, 'delay_sec': round(stats['delay_sec'], 3)} for command_class, stats in throttling.items()}
+        }
+        return metrics
+
+    @staticmethod
+    def _merge_throttle_stats(target: Dict[str, Dict[str, float]], source: Dict[str, Dict[str, float]]) -> None:
+        for command_class, stats in source.items():
+            totals = target.setdefault(command_class, {'delayed': 0, 'dropped': 0, 'delay_sec': 0.0})
+            for key, value in stats.items():
+                totals[key] += value
+
+    def _ban_key(self, peer: Peer) -> str:
+        # Una entrante llega desde un puerto efímero: su dirección es la de escucha que anunció (si ya la conocemos).
+        listen_address = self._listen_addresses.get(peer.peer_id)
+        port = int(listen_address.rpartition(':')[2]) if listen_address is not None else peer.port
+        return PeerBanManager.ban_key(peer.host, port)
+
+    def _is_banned(self, host: str, port: int) -> bool:
+        return self._ban_manager is not None and self._ban_manager.is_banned(PeerBanManager.ban_key(host, port))
+
+    @staticmethod
+    def _is_unknown_command(command_bytes: bytes) -> bool:
+        command = command_bytes.decode('utf-8', errors = 'replace').strip('\x00')
+        return command not in P2PMessageDeserializer.PAYLOAD_MAPPER
+
+    def _handle_keepalive(self, peer: Peer, message: Message) -> bool:
+        if message.command == 'ping' and isinstance(message.payload, PingPayload):
+            asyncio.create_task(self.send_message(peer, 'pong', PongPayload(nonce = message.payload.nonce)))
+            return True
+
+        if message.command == 'pong' and isinstance(message.payload, PongPayload):
+            rtt_ms = peer.latency.on_pong(message.payload.nonce)
+            # Las salientes se conectaron a su dirección de escucha: la medida sirve para elegir conexiones.
+            if rtt_ms is not None and peer.outbound and self._address_manager is not None:
+                self._address_manager.record_latency(peer.host, peer.port, rtt_ms / 1000)
+            return True
+
+        return False
+
+    async def _ping_loop(self):
+        while True:
+            await asyncio.sleep(Config.NETWORK_PING_INTERVAL_SEC)
+
+            for peer in list(self._peers.values()):
+                # 1. Sin respuesta o inactivo: la conexión está muerta aunque TCP no lo sepa.
+                if peer.latency.ping_pending_for() > Config.NETWORK_PING_TIMEOUT_SEC or peer.latency.idle_for() > Config.NETWORK_IDLE_TIMEOUT_SEC:
+                    logging.warning(f'P2P: {peer.peer_id} no responde (inactivo {peer.latency.idle_for():.0f}s). Desconectando...')
+                    self._timeout_disconnects += 1
+                    peer.connection.close()
+                    continue
+
+                # 2. Nueva medida.
+                if peer.latency.ping_pending_for() == 0:
+                    nonce = random.getrandbits(63)
+                    peer.latency.start_ping(nonce)
+                    await self.send_message(peer, 'ping', PingPayload(nonce = nonce))
+
+    async def _refer_and_close(self, connection: P2PProtocol):
+        # Sin plaza: antes de cerrar, otras direcciones para que el par no dependa solo de nosotros.
+        if self._address_manager is not None:
+            addresses = self._address_manager.get_addresses(Config.NETWORK_MAX_ADDR_PER_MESSAGE)
+            if addresses:
+                host, _, port = str(connection.peer_id).rpartition(':')
+                await self.send_message(Peer(host = host, port = int(port), connection = connection), 'addr', AddrPayload(addresses = addresses))
+        connection.close()
+
+    async def _maintenance_loop(self):
+        own_addresses = {f'{host}:{self._port}' for host in ('127.0.0.1', 'localhost', '0.0.0.0', self._host)}
+
+        while True:
+            await asyncio.sleep(Config.NETWORK_CONNECTION_CHECK_INTERVAL_SEC)
+
+            # 0. Lo que venció sin tráfico nuevo (ej. bloques a medio reensamblar).
+            self._node.run_maintenance()
+            if self._address_manager is None: continue
+
+            # 1. Completar las conexiones salientes.
+            outbound = sum(1 for peer in self._peers.values() if peer.outbound)
+            missing = Config.NETWORK_TARGET_OUTBOUND_PEERS - outbound - len(self._pending_connections)
+            if missing > 0:
+                exclude = set(self._peers) | self._pending_connections | set(self._listen_addresses.values()) | own_addresses
+                for host, port in self._address_manager.select_candidates(exclude, missing, skip = self._is_banned):
+                    asyncio.create_task(self.connect_to_peer(host, port))
+
+            # 2. Persistir la libreta.
+            self._address_manager.save()
+
+    def _ensure_trickle_task(self):
+        if self._trickle_task is None or self._trickle_task.done():
+            self._trickle_task = asyncio.create_task(self._trickle_loop())
+
+    async def _trickle_loop(self):
+        while True:
+            # Intervalo aleatorizado: los pares no pueden correlacionar el momento del anuncio con el origen de la TX.
+            await asyncio.sleep(Config.NETWORK_TX_TRICKLE_INTERVAL_SEC * random.uniform(0.5, 1.5))
+            for peer in list(self._peers.values()):
+                if peer.pending_tx_inventory:
+                    await self._flush_tx_inventory(peer)
+
+    async def _flush_tx_inventory(self, peer: Peer):
+        while peer.pending_tx_inventory:
+            batch = peer.pending_tx_inventory[:Config.NETWORK_TX_INV_BATCH_SIZE]
+            del peer.pending_tx_inventory[:Config.NETWORK_TX_INV_BATCH_SIZE]
+
+            self._inv_stats['sent_messages'] += 1
+            self._inv_stats['trickled_items'] += len(batch)
+            await self.send_message(peer, 'inv', InvPayload(inventory = batch))
\ No newline at end of file
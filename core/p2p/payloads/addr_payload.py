@@ -0,0 +1,16 @@
+# network_of_interactive_nodes/core/p2p/payloads/addr_payload.py
+'''
+class AddrPayload:
+    Comparte direcciones de pares conocidos (respuesta a 'getaddr').
+
+    Attributes:
+        addresses (List[Dict[str, Any]]): Direcciones [{'host': str, 'port': int, 'timestamp': int}]
+                                          ('timestamp' = última vez que se vio activa).
+'''
+
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+@dataclass(frozen = True, slots = True)
+class AddrPayload:
+    addresses: List[Dict[str, Any]]
\ No newline at end of file
@@ -0,0 +1,26 @@
+# network_of_interactive_nodes/core/p2p/payloads/block_chunk_payload.py
+'''
+class BlockChunkPayload:
+    Transporta un FRAGMENTO acotado de un bloque grande (transferencia por streaming).
+    El receptor consume las transacciones de cada fragmento al llegar, sin esperar al bloque completo.
+
+    Attributes:
+        block_hash      (str):                          Hash del bloque al que pertenece el fragmento.
+        chunk_index     (int):                          Posición del fragmento (0, 1, 2, ...).
+        is_last         (bool):                         True si es el último fragmento del bloque.
+        checksum        (str):                          SHA-256 (hex) de los tx_hash del fragmento (integridad por fragmento).
+        transactions    (List[Dict[str, Any]]):         Transacciones serializadas incluidas en este fragmento.
+        header          (Optional[Dict[str, Any]]):     Cabecera del bloque (solo en el fragmento 0).
+'''
+
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional
+
+@dataclass(frozen = True, slots = True)
+class BlockChunkPayload:
+    block_hash: str
+    chunk_index: int
+    is_last: bool
+    checksum: str
+    transactions: List[Dict[str, Any]]
+    header: Optional[Dict[str, Any]] = None
\ No newline at end of file
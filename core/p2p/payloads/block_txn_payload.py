@@ -0,0 +1,19 @@
+# network_of_interactive_nodes/core/p2p/payloads/block_txn_payload.py
+'''
+class BlockTxnPayload:
+    Responde a 'getblocktxn' con las transacciones faltantes de un bloque compacto.
+
+    Attributes:
+        block_hash      (str):                      Hash del bloque compacto.
+        indexes         (List[int]):                Posiciones pedidas (mismo orden que 'transactions').
+        transactions    (List[Dict[str, Any]]):     TXs serializadas.
+'''
+
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+@dataclass(frozen = True, slots = True)
+class BlockTxnPayload:
+    block_hash: str
+    indexes: List[int]
+    transactions: List[Dict[str, Any]]
\ No newline at end of file
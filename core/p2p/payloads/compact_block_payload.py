@@ -0,0 +1,23 @@
+# network_of_interactive_nodes/core/p2p/payloads/compact_block_payload.py
+'''
+class CompactBlockPayload:
+    Transporta un bloque "compacto": la cabecera y un ID corto (con sal) por transacción.
+    El receptor reconstruye el bloque con las TXs de su Mempool y pide solo las que le faltan ('getblocktxn').
+
+    Attributes:
+        header      (Dict[str, Any]):           Cabecera del bloque (BlockHeaderSerializer + 'mining_time').
+        salt        (int):                      Sal aleatoria de los IDs cortos (evita colisiones fabricadas de antemano).
+        short_ids   (List[str]):                IDs cortos (hex) de las TXs no incluidas, en el orden del bloque.
+        prefilled   (List[Dict[str, Any]]):     TXs incluidas completas: [{'index': posición, 'tx': TX serializada}]
+                                                (ej. la coinbase, que ningún receptor tiene en su Mempool).
+'''
+
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+@dataclass(frozen = True, slots = True)
+class CompactBlockPayload:
+    header: Dict[str, Any]
+    salt: int
+    short_ids: List[str]
+    prefilled: List[Dict[str, Any]]
\ No newline at end of file
@@ -0,0 +1,11 @@
+# network_of_interactive_nodes/core/p2p/payloads/get_addr_payload.py
+'''
+class GetAddrPayload:
+    Pide al par direcciones de otros pares que conozca (responde con 'addr'). No lleva datos.
+'''
+
+from dataclasses import dataclass
+
+@dataclass(frozen = True, slots = True)
+class GetAddrPayload:
+    pass
\ No newline at end of file
@@ -0,0 +1,17 @@
+# network_of_interactive_nodes/core/p2p/payloads/get_block_txn_payload.py
+'''
+class GetBlockTxnPayload:
+    Pide las transacciones de un bloque compacto que el receptor no pudo encontrar en su Mempool.
+
+    Attributes:
+        block_hash  (str):          Hash del bloque compacto.
+        indexes     (List[int]):    Posiciones (dentro del bloque) de las TXs faltantes.
+'''
+
+from dataclasses import dataclass
+from typing import List
+
+@dataclass(frozen = True, slots = True)
+class GetBlockTxnPayload:
+    block_hash: str
+    indexes: List[int]
\ No newline at end of file
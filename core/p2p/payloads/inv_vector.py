@@ -4,7 +4,7 @@ class InvVector:
     Representa un único objeto (un hash) en el inventario.
 
     Attributes:
-        type (int): El tipo de objeto (ej. 1 = TX, 2 = Block).
+        type (int): El tipo de objeto (ej. 1 = TX, 2 = Block, 3 = Block compacto: solo en 'getdata', se responde con 'cmpctblock').
         hash (str): El hash (hex) del objeto.
 '''
 
@@ -0,0 +1,14 @@
+# network_of_interactive_nodes/core/p2p/payloads/ping_payload.py
+'''
+class PingPayload:
+    Comprueba que el par sigue vivo y mide la latencia (ida y vuelta) de la conexión.
+
+    Attributes:
+        nonce (int): Número aleatorio que el par debe devolver en su 'pong'.
+'''
+
+from dataclasses import dataclass
+
+@dataclass(frozen = True, slots = True)
+class PingPayload:
+    nonce: int
\ No newline at end of file
@@ -0,0 +1,14 @@
+# network_of_interactive_nodes/core/p2p/payloads/pong_payload.py
+'''
+class PongPayload:
+    Respuesta a un 'ping'.
+
+    Attributes:
+        nonce (int): El nonce del 'ping' que se responde.
+'''
+
+from dataclasses import dataclass
+
+@dataclass(frozen = True, slots = True)
+class PongPayload:
+    nonce: int
\ No newline at end of file
@@ -8,6 +8,8 @@ class VersionPayload:
         services            (int):  Banderas (flags) que indican los roles (Punto 6).
         timestamp           (int):  Marca de tiempo UNIX de este nodo.
         best_height         (int):  El índice (altura) del último bloque que tiene este nodo.
+        high_bandwidth      (bool): True si pedimos al par que nos empuje sus bloques nuevos ('cmpctblock' sin 'inv').
+        listen_port         (int):  Puerto donde escucha este nodo (el de la conexión entrante es efímero). 0 = desconocido.
 '''
 
 from dataclasses import dataclass
@@ -17,4 +19,6 @@ class VersionPayload:
     protocol_version: int
     services: int
     timestamp: int
-    best_height: int
\ No newline at end of file
+    best_height: int
+    high_bandwidth: bool = False
+    listen_port: int = 0
\ No newline at end of file
@@ -1,21 +1,40 @@
 # network_of_interactive_nodes/core/p2p/peer.py
 '''
 class Peer:
-    Almacena el estado y los objetos de conexión (reader/writer) para un amigo.
+    Almacena el estado y el objeto de conexión para un amigo.
 
     Attributes:
-        host (str): La dirección IP del par.
-        port (int): El puerto del par.
-        reader (asyncio.StreamReader): El stream para LEER datos del par.
-        writer (asyncio.StreamWriter): El stream para ESCRIBIR datos al par.
+        host        (str):          La dirección IP del par.
+        port        (int):          El puerto del par.
+        connection  (P2PProtocol):  La conexión (Zero-Copy) para LEER y ESCRIBIR datos con el par.
+        outbound    (bool):         True si nosotros iniciamos la conexión (saliente).
+        known_inventory (KnownInventory): Hashes (bloques y TXs) que el par ya conoce (no se le vuelven a anunciar).
+        pending_tx_inventory (List[InvVector]): TXs encoladas para el próximo 'inv' agrupado hacia este par.
+        latency (PeerLatency): 'ping' en curso, RTT (EWMA y jitter) y último mensaje recibido.
+
+    Properties:
+        peer_id (str): Identificador 'host:port' (clave del par en P2PService).
 '''
 
-import asyncio
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import List
+
+# Importaciones de la arquitectura
+from core.p2p.p2p_protocol import P2PProtocol
+from core.p2p.known_inventory import KnownInventory
+from core.p2p.peer_latency import PeerLatency
+from core.p2p.payloads.inv_vector import InvVector
 
 @dataclass(frozen = True, slots = True)
 class Peer:
     host: str
     port: int
-    reader: asyncio.StreamReader
-    writer: asyncio.StreamWriter
\ No newline at end of file
+    connection: P2PProtocol
+    outbound: bool = field(default = False, compare = False)
+    known_inventory: KnownInventory = field(default_factory = KnownInventory, compare = False, repr = False)
+    pending_tx_inventory: List[InvVector] = field(default_factory = list, compare = False, repr = False)
+    latency: PeerLatency = field(default_factory = PeerLatency, compare = False, repr = False)
+
+    @property
+    def peer_id(self) -> str:
+        return f'{self.host}:{self.port}'
\ No newline at end of file
@@ -0,0 +1,154 @@
+# network_of_interactive_nodes/core/p2p/peer_ban_manager.py
+'''
+class PeerBanManager:
+    Puntuación de mal comportamiento por par y vetos temporales, persistidos en 'banlist.json'.
+
+    Cada falta suma puntos según su clase (Config.P2P_MISBEHAVIOR_PENALTIES). Al llegar a
+    Config.P2P_BAN_THRESHOLD, el origen queda vetado Config.P2P_BAN_DURATION_SEC: se le desconecta
+    y no se aceptan ni se inician conexiones con él. La puntuación se reduce a la mitad cada
+    Config.P2P_MISBEHAVIOR_HALF_LIFE_SEC: las faltas aisladas de un par honesto (ej. un bloque inválido
+    que él mismo recibió) se olvidan. Como cada falta de validación cuesta puntos, el CPU que un par
+    hostil puede hacernos gastar en validaciones fallidas está acotado por umbral / penalización.
+
+    El origen se identifica por IP (ban_key). En loopback todos los nodos comparten la IP, así que
+    se usa 'IP:puerto de escucha' para no vetar a todos los nodos locales a la vez.
+
+    Solo se usa desde el event loop (no necesita candado).
+
+    Attributes:
+        _path       (str):                      Ruta de 'banlist.json'.
+        _scores     (Dict[str, _Score]):        Origen -> puntuación actual.
+        _bans       (Dict[str, float]):         Origen -> fin del veto (time.time()).
+        _stats      (Dict[str, int]):           Faltas por clase y vetos aplicados.
+
+    Methods:
+        ban_key(host, port) -> str: (Estático) Identificador del origen: la IP (o 'IP:puerto' en loopback).
+
+        penalize(key, reason) -> bool: Suma la penalización de la clase de falta. True si el origen queda vetado.
+            (Un origen ya vetado no suma: sus mensajes en vuelo no cuentan como faltas nuevas.)
+            1. Aplicar el decaimiento a la puntuación acumulada y sumar los puntos.
+            2. Si alcanza el umbral: vetar (guardando 'banlist.json') y olvidar la puntuación.
+
+        is_banned(key) -> bool: True si el origen está vetado (los vetos vencidos se olvidan).
+        get_score(key) -> float: Puntuación actual (con decaimiento).
+
+        load(): Carga 'banlist.json' (descartando los vetos vencidos).
+        save() -> bool: Guarda los vetos de forma atómica (archivo temporal + os.replace).
+        get_metrics() -> Dict: Vetos activos, vetos aplicados y faltas por clase.
+'''
+
+import os
+import json
+import time
+import logging
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Dict
+
+# Importacion de la configuracion
+from config import Config
+
+_LOOPBACK_HOSTS = ('127.0.0.1', '::1', 'localhost')
+
+@dataclass(slots = True)
+class _Score:
+    points: float
+    updated_at: float
+
+class PeerBanManager:
+
+    def __init__(self, path: str):
+        self._path = path
+        self._scores: Dict[str, _Score] = {}
+        self._bans: Dict[str, float] = {}
+        self._stats: Dict[str, int] = {'bans': 0}
+
+    @staticmethod
+    def ban_key(host: str, port: int) -> str:
+        return f'{host}:{port}' if host in _LOOPBACK_HOSTS else host
+
+    # --- Puntuación ---
+
+    def penalize(self, key: str, reason: str) -> bool:
+        if self.is_banned(key): return False
+        points = Config.P2P_MISBEHAVIOR_PENALTIES.get(reason, 0)
+        self._stats[reason] = self._stats.get(reason, 0) + 1
+        if points <= 0: return False
+
+        # 1. Decaimiento y suma.
+        now = time.time()
+        score = self._scores.get(key)
+        current = self._decayed(score, now) if score is not None else 0.0
+        self._scores[key] = _Score(points = current + points, updated_at = now)
+        logging.warning(f'Seguridad P2P: {key} +{points} puntos ({reason}). Total {current + points:.0f}/{Config.P2P_BAN_THRESHOLD}.')
+
+        # 2. Umbral: veto.
+        if current + points < Config.P2P_BAN_THRESHOLD: return False
+        self._bans[key] = now + Config.P2P_BAN_DURATION_SEC
+        self._scores.pop(key, None)
+        self._stats['bans'] += 1
+        logging.warning(f'Seguridad P2P: {key} VETADO durante {Config.P2P_BAN_DURATION_SEC}s por mal comportamiento.')
+        self.save()
+        return True
+
+    def is_banned(self, key: str) -> bool:
+        until = self._bans.get(key)
+        if until is None: return False
+        if until > time.time(): return True
+        del self._bans[key]
+        return False
+
+    def get_score(self, key: str) -> float:
+        score = self._scores.get(key)
+        return self._decayed(score, time.time()) if score is not None else 0.0
+
+    def get_metrics(self) -> Dict[str, Any]:
+        now = time.time()
+        return {'banned': sum(1 for until in self._bans.values() if until > now), 'offenses': dict(self._stats)}
+
+    # --- Persistencia ---
+
+    def load(self) -> None:
+        if not os.path.exists(self._path): return
+
+        try:
+            with open(self._path, 'r') as f:
+                bans = json.load(f)
+            now = time.time()
+            self._bans = {str(key): float(until) for key, until in bans.items() if float(until) > now}
+            if self._bans: logging.info(f'PeerBanManager: {len(self._bans)} vetos activos cargados de {self._path}.')
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            logging.warning(f'PeerBanManager: {self._path} ilegible ({e}). Se empieza sin vetos.')
+            self._bans = {}
+
+    def save(self) -> bool:
+        temp_path = None
+        now = time.time()
+
+        try:
+            directory = os.path.dirname(self._path)
+            if directory: os.makedirs(directory, exist_ok = True)
+            temp_fd, temp_path = tempfile.mkstemp(dir = directory or None, text = True)
+
+            with os.fdopen(temp_fd, 'w') as tmp_file:
+                json.dump({key: until for key, until in self._bans.items() if until > now}, tmp_file)
+                tmp_file.flush()
+                os.fsync(tmp_file.fileno())
+
+            os.replace(temp_path, self._path)
+            return True
+
+        except OSError as e:
+            logging.error(f'PeerBanManager: No se pudo guardar {self._path}. {e}')
+            if temp_path and os.path.exists(temp_path):
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+            return False
+
+    # --- Helpers ---
+
+    @staticmethod
+    def _decayed(score: _Score, now: float) -> float:
+        return score.points * 0.5 ** ((now - score.updated_at) / Config.P2P_MISBEHAVIOR_HALF_LIFE_SEC)
\ No newline at end of file
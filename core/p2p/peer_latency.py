@@ -0,0 +1,85 @@
+# network_of_interactive_nodes/core/p2p/peer_latency.py
+'''
+class PeerLatency:
+    Estado de vida y latencia de un par, medido con 'ping'/'pong'.
+
+    El RTT se suaviza como en TCP (RFC 6298): media móvil exponencial (SRTT, alfa = 1/8) y jitter
+    como desviación media (RTTVAR, beta = 1/4). Un 'pong' solo cuenta si trae el nonce del 'ping' en
+    curso (uno a la vez): así una respuesta atrasada o inventada no falsea la medida.
+
+    Solo se usa desde el event loop (no necesita candado).
+
+    Attributes:
+        rtt_ms          (float | None): RTT suavizado (EWMA). None hasta la primera medida.
+        jitter_ms       (float | None): Variación media del RTT.
+        min_rtt_ms      (float | None): RTT mínimo observado.
+        last_rtt_ms     (float | None): Última medida.
+        samples         (int):          Medidas tomadas.
+        _pending_nonce  (int | None):   Nonce del 'ping' en curso.
+        _ping_sent_at   (float):        Envío del 'ping' en curso (time.monotonic).
+        _connected_at   (float):        Alta de la conexión.
+        _last_received_at (float):      Último mensaje recibido del par (cualquiera).
+
+    Methods:
+        start_ping(nonce): Registra un 'ping' enviado.
+        on_pong(nonce) -> float | None: Registra el 'pong'. Retorna el RTT (ms) si el nonce es el esperado.
+        touch(): El par envió un mensaje (está vivo).
+        ping_pending_for() -> float: Segundos que lleva el 'ping' en curso sin respuesta (0 si no hay).
+        idle_for() -> float: Segundos desde el último mensaje recibido.
+        to_dict() -> Dict: Estadísticas para la API.
+'''
+
+import time
+from typing import Any, Dict, Optional
+
+class PeerLatency:
+
+    def __init__(self):
+        self.rtt_ms: Optional[float] = None
+        self.jitter_ms: Optional[float] = None
+        self.min_rtt_ms: Optional[float] = None
+        self.last_rtt_ms: Optional[float] = None
+        self.samples: int = 0
+        self._pending_nonce: Optional[int] = None
+        self._ping_sent_at: float = 0.0
+        self._connected_at = self._last_received_at = time.monotonic()
+
+    def start_ping(self, nonce: int) -> None:
+        self._pending_nonce = nonce
+        self._ping_sent_at = time.monotonic()
+
+    def on_pong(self, nonce: int) -> Optional[float]:
+        if self._pending_nonce is None or nonce != self._pending_nonce: return None
+        self._pending_nonce = None
+        sample = (time.monotonic() - self._ping_sent_at) * 1000
+
+        if self.rtt_ms is None or self.jitter_ms is None:
+            self.rtt_ms, self.jitter_ms = sample, sample / 2
+        else:
+            self.jitter_ms = 0.75 * self.jitter_ms + 0.25 * abs(self.rtt_ms - sample)
+            self.rtt_ms = 0.875 * self.rtt_ms + 0.125 * sample
+
+        self.min_rtt_ms = sample if self.min_rtt_ms is None else min(self.min_rtt_ms, sample)
+        self.last_rtt_ms = sample
+        self.samples += 1
+        return sample
+
+    def touch(self) -> None:
+        self._last_received_at = time.monotonic()
+
+    def ping_pending_for(self) -> float:
+        return time.monotonic() - self._ping_sent_at if self._pending_nonce is not None else 0.0
+
+    def idle_for(self) -> float:
+        return time.monotonic() - self._last_received_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        def rounded(value: Optional[float]) -> Optional[float]:
+            return round(value, 2) if value is not None else None
+
+        return {
+            'rtt_ms': rounded(self.rtt_ms), 'jitter_ms': rounded(self.jitter_ms),
+            'min_rtt_ms': rounded(self.min_rtt_ms), 'last_rtt_ms': rounded(self.last_rtt_ms),
+            'ping_samples': self.samples, 'ping_pending': self._pending_nonce is not None,
+            'idle_sec': round(self.idle_for(), 1), 'connected_sec': round(time.monotonic() - self._connected_at, 1)
+        }
\ No newline at end of file
@@ -0,0 +1,83 @@
+# network_of_interactive_nodes/core/p2p/peer_rate_limiter.py
+'''
+class PeerRateLimiter:
+    Límite de entrada de UNA conexión: por clase de comando, una cubeta de mensajes y otra de bytes (TokenBucket).
+
+    Las clases separan el trabajo que provoca cada mensaje: 'control' (version, ping, pong), 'request'
+    (getdata, getheaders, getblocktxn, getaddr: nos hacen servir datos), 'announce' (inv, addr), 'tx' y
+    'block' (headers, block, blockchunk, cmpctblock, blocktxn: validación). Así una inundación de TXs no
+    consume el presupuesto de los 'ping' ni el de los bloques. Los comandos desconocidos cuentan como 'announce'.
+
+    P2PProtocol consulta 'admit' antes de entregar cada frame: si hace falta esperar, deja de leer del socket
+    (el par queda frenado por TCP sin afectar a las demás conexiones); si la espera supera
+    Config.P2P_RATE_LIMIT_MAX_DELAY_SEC (o el frame no cabe nunca en la cubeta), el frame se descarta.
+
+    Attributes:
+        _buckets (Dict[str, Tuple[TokenBucket, TokenBucket]]): Clase -> (cubeta de mensajes, cubeta de bytes).
+        stats    (Dict[str, Dict[str, float]]):                 Por clase: frames demorados, descartados y segundos de demora.
+
+    Methods:
+        admit(command_bytes, frame_size) -> float | None: Decide sobre un frame completo.
+            1. Clasificar el comando y calcular la espera hasta tener 1 mensaje y 'frame_size' bytes.
+            2. Sin espera: consumir las fichas y retornar 0.0.
+            3. Espera excesiva: contar el descarte y retornar None.
+            4. Espera admisible: contarla y retornarla (el frame se vuelve a presentar al vencer).
+
+        command_class(command_bytes) -> str: (Estático) Clase de presupuesto del comando.
+'''
+
+import math
+from typing import Dict, Optional, Tuple
+
+# Importaciones de la arquitectura
+from core.p2p.token_bucket import TokenBucket
+
+# Importacion de la configuracion
+from config import Config
+
+_COMMAND_CLASSES: Dict[bytes, str] = {
+    b'version': 'control', b'ping': 'control', b'pong': 'control',
+    b'getdata': 'request', b'getheaders': 'request', b'getblocktxn': 'request', b'getaddr': 'request',
+    b'inv': 'announce', b'addr': 'announce',
+    b'tx': 'tx',
+    b'headers': 'block', b'block': 'block', b'blockchunk': 'block', b'cmpctblock': 'block', b'blocktxn': 'block'
+}
+
+class PeerRateLimiter:
+
+    def __init__(self):
+        self._buckets: Dict[str, Tuple[TokenBucket, TokenBucket]] = {
+            command_class: (TokenBucket(msg_rate, msg_burst), TokenBucket(byte_rate, byte_burst))
+            for command_class, (msg_rate, msg_burst, byte_rate, byte_burst) in Config.P2P_RATE_LIMITS.items()
+        }
+        self.stats: Dict[str, Dict[str, float]] = {}
+
+    @staticmethod
+    def command_class(command_bytes: bytes) -> str:
+        return _COMMAND_CLASSES.get(command_bytes.rstrip(b'\x00'), 'announce')
+
+    def admit(self, command_bytes: bytes, frame_size: int) -> Optional[float]:
+        # 1. Espera necesaria en ambas cubetas de la clase.
+        command_class = self.command_class(command_bytes)
+        buckets = self._buckets.get(command_class)
+        if buckets is None: return 0.0
+        messages, payload_bytes = buckets
+        wait = max(messages.wait_time(1), payload_bytes.wait_time(frame_size))
+
+        # 2. Dentro del presupuesto.
+        if wait == 0.0:
+            messages.consume(1)
+            payload_bytes.consume(frame_size)
+            return 0.0
+
+        stats = self.stats.setdefault(command_class, {'delayed': 0, 'dropped': 0, 'delay_sec': 0.0})
+
+        # 3. Nunca cabría o tardaría demasiado: descartar.
+        if math.isinf(wait) or wait > Config.P2P_RATE_LIMIT_MAX_DELAY_SEC:
+            stats['dropped'] += 1
+            return None
+
+        # 4. Demorar.
+        stats['delayed'] += 1
+        stats['delay_sec'] += wait
+        return wait
\ No newline at end of file
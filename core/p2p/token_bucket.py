@@ -0,0 +1,43 @@
+# network_of_interactive_nodes/core/p2p/token_bucket.py
+'''
+class TokenBucket:
+    Cubeta de fichas (token bucket): permite ráfagas de hasta 'capacity' unidades y, sostenido, 'rate' unidades por segundo.
+
+    Solo se usa desde el event loop (no necesita candado).
+
+    Attributes:
+        rate        (float): Fichas que se reponen por segundo.
+        capacity    (float): Fichas máximas acumuladas (tamaño de la ráfaga).
+        _tokens     (float): Fichas disponibles.
+        _updated_at (float): Última reposición (time.monotonic).
+
+    Methods:
+        wait_time(amount) -> float: Segundos hasta tener 'amount' fichas (0 si ya las hay; infinito si supera la capacidad).
+        consume(amount): Retira 'amount' fichas (llamar tras comprobar 'wait_time').
+'''
+
+import math
+import time
+
+class TokenBucket:
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens: float = capacity
+        self._updated_at: float = time.monotonic()
+
+    def wait_time(self, amount: float) -> float:
+        if amount > self.capacity: return math.inf
+        self._refill()
+        deficit = amount - self._tokens
+        return deficit / self.rate if deficit > 0 else 0.0
+
+    def consume(self, amount: float) -> None:
+        self._refill()
+        self._tokens -= amount
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
\ No newline at end of file
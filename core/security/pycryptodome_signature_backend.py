@@ -0,0 +1,41 @@
+# network_of_interactive_nodes/core/security/pycryptodome_signature_backend.py
+'''
+class PycryptodomeSignatureBackend(ISignatureBackend):
+    Motor de verificación basado en pycryptodome (DSS FIPS-186-3). Es el motor por defecto:
+    su aritmética de curva está implementada en C.
+
+    El contexto por clave es el verificador DSS ya ligado a la clave (se evita un DSS.new por firma).
+
+    Methods:
+        prepare(public_key) -> Any: Construye el verificador DSS de la clave.
+        verify(context, message, signature) -> bool: OP_CHECKSIG sobre SHA-256(message).
+'''
+
+from typing import Any
+from Crypto.PublicKey.ECC import EccKey
+from Crypto.Signature import DSS
+from Crypto.Hash import SHA256
+
+# Importación del Contrato
+from core.interfaces.i_signature_backend import ISignatureBackend
+
+class PycryptodomeSignatureBackend(ISignatureBackend):
+
+    name: str = 'pycryptodome'
+
+    def is_available(self) -> bool:
+        return True
+
+    def prepare(self, public_key: EccKey) -> Any:
+        # Usamos el estándar FIPS-186-3 para ECDSA (Curva NIST P-256 / secp256r1)
+        # Nota: RFC 6979 se usa para firmar (generar k), pero la verificación
+        # sigue el estándar matemático normal ECDSA.
+        return DSS.new(public_key, 'fips-186-3') # type: ignore
+
+    def verify(self, context: Any, message: bytes, signature: bytes) -> bool:
+        try:
+            context.verify(SHA256.new(message), signature)
+            return True
+        except ValueError:
+            # La firma no es válida para esta clave y mensaje
+            return False
\ No newline at end of file
@@ -0,0 +1,112 @@
+# network_of_interactive_nodes/core/security/signature_backend_benchmark.py
+'''
+class SignatureBackendBenchmark:
+    Herramienta estática que mide, al arrancar el nodo, la velocidad de cada motor de verificación
+    disponible y elige el más rápido.
+
+    Methods:
+        run(backends, samples, workers) -> Dict[str, Dict[str, Any]]: Mide cada motor.
+            1. Generar una clave efímera y firmar 'samples' mensajes (TransactionSigner).
+            2. Por cada motor disponible: construir el contexto de la clave (tiempo de preparación).
+            3. Verificar todas las firmas en UN hilo -> verificaciones/segundo por núcleo.
+            4. Verificar todas las firmas repartidas entre 'workers' hilos (como el pool de BatchSignatureVerifier)
+               -> verificaciones/segundo reales del nodo. No se extrapola desde el paso 3: un motor que no libera
+               el GIL (ej. 'ecdsa', Python puro) no escala con los hilos.
+            5. Comprobar que el motor rechaza una firma inválida (un motor incorrecto queda descalificado).
+
+        select_fastest(backends, samples, workers) -> Tuple[ISignatureBackend, Dict]: Ejecuta 'run' y retorna el motor
+            válido con más verificaciones/segundo con 'workers' hilos (y el reporte completo).
+'''
+
+import os
+import time
+import logging
+from binascii import unhexlify
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+# Importaciones de la arquitectura
+from core.interfaces.i_signature_backend import ISignatureBackend
+from core.security.transaction_signer import TransactionSigner
+from identity.key_factory import KeyFactory
+
+class SignatureBackendBenchmark:
+
+    @staticmethod
+    def run(backends: List[ISignatureBackend], samples: int, workers: int = 1) -> Dict[str, Dict[str, Any]]:
+
+        # 1. Firmas de prueba
+        private_key = KeyFactory.generate_private_key()
+        messages: List[bytes] = [os.urandom(32) for _ in range(samples)]
+        signatures: List[bytes] = [unhexlify(TransactionSigner.sign(private_key, message.hex())) for message in messages]
+
+        report: Dict[str, Dict[str, Any]] = {}
+
+        for backend in backends:
+            if not backend.is_available():
+                report[backend.name] = {'available': False}
+                continue
+
+            try:
+                # 2. Preparación (contexto por clave)
+                start = time.perf_counter()
+                context = backend.prepare(private_key.public_key())
+                prepare_ms = (time.perf_counter() - start) * 1000
+
+                # 3. Verificación en un solo hilo (= por núcleo)
+                start = time.perf_counter()
+                all_valid = all(backend.verify(context, m, s) for m, s in zip(messages, signatures))
+                elapsed = time.perf_counter() - start
+                per_core = samples / elapsed if elapsed > 0 else 0.0
+
+                # 4. Verificación repartida en el pool (lo que el nodo obtiene de verdad)
+                pooled, pooled_valid = per_core, True
+                if workers > 1:
+                    pooled, pooled_valid = SignatureBackendBenchmark._measure_pooled(backend, context, messages, signatures, workers)
+
+                # 5. Sanidad: debe rechazar una firma que no corresponde al mensaje
+                rejects_invalid = len(messages) < 2 or not backend.verify(context, messages[0], signatures[1])
+
+                report[backend.name] = {
+                    'available': True,
+                    'correct': all_valid and pooled_valid and rejects_invalid,
+                    'prepare_ms': round(prepare_ms, 2),
+                    'verifications_per_sec_per_core': round(per_core, 1),
+                    'verifications_per_sec': round(pooled, 1),
+                    'workers': workers
+                }
+
+            except Exception as e:
+                logging.warning(f'Benchmark de firmas: Motor {backend.name} falló ({e}).')
+                report[backend.name] = {'available': True, 'correct': False}
+
+        return report
+
+    @staticmethod
+    def select_fastest(backends: List[ISignatureBackend], samples: int, workers: int = 1) -> Tuple[ISignatureBackend, Dict[str, Dict[str, Any]]]:
+        report = SignatureBackendBenchmark.run(backends, samples, workers)
+
+        candidates = [b for b in backends if report[b.name].get('correct')]
+        if not candidates:
+            raise RuntimeError('Ningún motor de verificación de firmas superó el benchmark.')
+
+        fastest = max(candidates, key = lambda b: report[b.name]['verifications_per_sec'])
+        return fastest, report
+
+    # --- Helpers ---
+
+    @staticmethod
+    def _measure_pooled(backend: ISignatureBackend, context: Any, messages: List[bytes], signatures: List[bytes], workers: int) -> Tuple[float, bool]:
+        slice_size = max(1, -(-len(messages) // workers))
+
+        def verify_slice(start: int) -> bool:
+            end = start + slice_size
+            return all(backend.verify(context, m, s) for m, s in zip(messages[start:end], signatures[start:end]))
+
+        with ThreadPoolExecutor(max_workers = workers, thread_name_prefix = 'sigbench') as executor:
+            list(executor.map(lambda _: None, range(workers))) # Arrancar los hilos antes de medir
+            start = time.perf_counter()
+            all_valid = all(executor.map(verify_slice, range(0, len(messages), slice_size)))
+            elapsed = time.perf_counter() - start
+
+        return (len(messages) / elapsed if elapsed > 0 else 0.0), all_valid
\ No newline at end of file
@@ -7,7 +7,7 @@ class BlockchainSerializer:
         to_dict(blockchain: Blockchain) -> dict[str, Any]:
             1. Obtener la lista de bloques (la 'cadena') del objeto Blockchain.
             2. Serializar la lista de Bloques.
-            3. Ensamblar el diccionario final (con 'chain' como clave).
+            3. Ensamblar el diccionario final (con 'chain' como clave y el índice de TXs en 'tx_index').
             4. Retornar el diccionario.
 '''
 
@@ -16,6 +16,7 @@ from typing import Any, List, Dict
 # Importaciones de la arquitectura
 from core.models.blockchain import Blockchain
 from core.serializers.block_serializer import BlockSerializer
+from core.serializers.tx_index_serializer import TxIndexSerializer
 
 class BlockchainSerializer:
     @staticmethod
@@ -27,7 +28,8 @@ class BlockchainSerializer:
         ]
 
         blockchain_dict: Dict[str, Any] = {
-            'chain': serialized_blocks
+            'chain': serialized_blocks,
+            'tx_index': TxIndexSerializer.to_dict(blockchain.tx_index, block_list[-1].hash if block_list else None)
         }
 
         return blockchain_dict
\ No newline at end of file
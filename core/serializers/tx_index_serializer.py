@@ -0,0 +1,27 @@
+# network_of_interactive_nodes/core/serializers/tx_index_serializer.py
+'''
+class TxIndexSerializer:
+    Contiene la lógica pura para serializar un TxIndex a un diccionario (se guarda junto a la cadena).
+
+    Methods:
+        to_dict(tx_index: TxIndex, tip_hash: Optional[str]) -> dict[str, Any]:
+            1. Registrar el hash de la punta de la cadena a la que corresponde el índice.
+            2. Serializar cada entrada como tx_hash -> [altura, posición].
+            3. Serializar las ubicaciones apiladas de las TXs repetidas como tx_hash -> [[altura, posición], ...].
+            4. Retornar el diccionario.
+'''
+
+from typing import Any, Dict, Optional
+
+# Importaciones de la arquitectura
+from core.models.tx_index import TxIndex
+
+class TxIndexSerializer:
+
+    @staticmethod
+    def to_dict(tx_index: TxIndex, tip_hash: Optional[str]) -> Dict[str, Any]:
+        return {
+            'tip_hash': tip_hash,
+            'entries': {tx_hash: [location.height, location.position] for tx_hash, location in tx_index.items()},
+            'shadowed': {tx_hash: [[location.height, location.position] for location in stack] for tx_hash, stack in tx_index.shadowed_items()}
+        }
\ No newline at end of file
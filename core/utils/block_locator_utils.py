@@ -0,0 +1,47 @@
+# network_of_interactive_nodes/core/utils/block_locator_utils.py
+'''
+class BlockLocatorUtils:
+    Lógica pura del "block locator" usado por 'getheaders' para encontrar el ancestro común con un par.
+
+    El localizador lista hashes de nuestra cadena principal desde la punta hacia atrás:
+    los 10 más recientes uno por uno y luego con saltos que se duplican, terminando siempre en el génesis.
+    Así tiene O(log n) hashes y el par encuentra el último bloque compartido aunque estemos en una rama.
+
+    Methods:
+        build(blockchain, max_recent) -> List[str]: Construye el localizador de nuestra cadena.
+            1. Recorrer alturas desde la punta: paso 1 para los primeros 'max_recent', luego el paso se duplica.
+            2. Añadir siempre el hash del génesis al final.
+
+        find_fork_height(blockchain, locator_hashes) -> int: (Lado que responde) Altura del primer hash del
+            localizador presente en nuestra cadena principal (índice por hash). -1 si no compartimos ninguno.
+'''
+
+from typing import List
+
+# Importaciones de la arquitectura
+from core.models.blockchain import Blockchain
+
+class BlockLocatorUtils:
+
+    @staticmethod
+    def build(blockchain: Blockchain, max_recent: int = 10) -> List[str]:
+        locator: List[str] = []
+        height = blockchain.height
+        step = 1
+
+        while height > 0:
+            block = blockchain.get_block_at(height)
+            if block is not None: locator.append(block.hash)
+            if len(locator) >= max_recent: step *= 2
+            height -= step
+
+        genesis = blockchain.get_block_at(0)
+        if genesis is not None: locator.append(genesis.hash)
+        return locator
+
+    @staticmethod
+    def find_fork_height(blockchain: Blockchain, locator_hashes: List[str]) -> int:
+        for block_hash in locator_hashes:
+            height = blockchain.get_height_of(block_hash)
+            if height is not None: return height
+        return -1
\ No newline at end of file
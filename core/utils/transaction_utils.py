@@ -5,6 +5,8 @@ class TransactionUtils:
     
     Methods:
         calculate_data_size(entries: List[DataEntry]) -> int: Calcula el tamaño (en bytes) del "payload" principal (source_id, data_type, value) de una lista de DataEntry.
+        estimate_size(entries: List[DataEntry]) -> int: Tamaño del payload más un sobrecosto fijo por DataEntry (hashes, timestamp, metadata).
+            Es la medida del tamaño máximo de bloque (Config.BLOCK_MAX_SIZE_BYTES) y del presupuesto de ensamblaje.
 '''
 
 from typing import List
@@ -12,6 +14,9 @@ from core.models.data_entry import DataEntry
 
 class TransactionUtils:
 
+    # Sobrecosto estimado por DataEntry (hashes, timestamp, metadata) además de su contenido.
+    ENTRY_OVERHEAD_BYTES: int = 256
+
     @staticmethod
     def calculate_data_size(entries: List[DataEntry]) -> int:
         total_size = 0
@@ -20,5 +25,7 @@ class TransactionUtils:
             total_size += len(e.data_type.encode('utf-8'))
             total_size += len(e.value) # (value es bytes)
         return total_size
-    
-    
\ No newline at end of file
+
+    @staticmethod
+    def estimate_size(entries: List[DataEntry]) -> int:
+        return TransactionUtils.calculate_data_size(entries) + TransactionUtils.ENTRY_OVERHEAD_BYTES * len(entries)
\ No newline at end of file
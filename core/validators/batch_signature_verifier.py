@@ -0,0 +1,121 @@
+# network_of_interactive_nodes/core/validators/batch_signature_verifier.py
+'''
+class BatchSignatureVerifier:
+    Verifica en paralelo las firmas ECDSA de un lote (ej. todas las TXs de un bloque).
+    La verificación ECDSA P-256 es el paso más costoso de aceptar un bloque, así que el lote
+    se reparte entre un pool de hilos propio (la aritmética EC de pycryptodome libera el GIL).
+
+    El pool es independiente del pool de validación (ValidationManager): un hilo de validación
+    puede esperar a este pool sin riesgo de bloqueo mutuo.
+
+    Methods:
+        verify_block_signatures(block, public_key_map, verified_positions) -> BatchVerificationResult:
+            1. Armar el lote con las TXs firmadas cuyo dueño tiene clave registrada (omitiendo las posiciones ya verificadas).
+            2. Delegar a 'verify_batch'.
+            3. Retornar los resultados alineados con 'block.data' (None = TX sin firma verificable).
+
+        verify_batch(checks, stop_on_failure) -> BatchVerificationResult:
+            1. Lotes pequeños (< Config.SIGNATURE_BATCH_MIN_PARALLEL): verificar en el hilo actual.
+            2. Dividir el lote en porciones y enviarlas al pool.
+            3. Cada porción usa el contexto compartido de cada clave (TransactionVerifier.get_context)
+               y, si 'stop_on_failure' (un bloque), se detiene si otra porción ya encontró un fallo.
+               Con 'stop_on_failure = False' (lote de TXs independientes) se verifican todas.
+            4. Retornar el resultado por firma (None = no verificada por parada temprana).
+'''
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Set
+from Crypto.PublicKey.ECC import EccKey
+
+# Importaciones de la arquitectura
+from core.models.block import Block
+from core.dto.signature_check import SignatureCheck
+from core.dto.batch_verification_result import BatchVerificationResult
+from core.validators.transaction_verifier import TransactionVerifier
+
+# Importacion de la configuracion
+from config import Config
+
+class BatchSignatureVerifier:
+
+    # Porciones por hilo: más porciones = parada temprana más rápida, a cambio de más tareas.
+    _SLICES_PER_WORKER: int = 4
+
+    _executor: Optional[ThreadPoolExecutor] = None
+    _executor_lock: threading.Lock = threading.Lock()
+
+    @staticmethod
+    def verify_block_signatures(block: Block, public_key_map: Dict[str, EccKey], verified_positions: Optional[Set[int]] = None) -> BatchVerificationResult:
+        checks: List[SignatureCheck] = []
+        positions: List[int] = []
+        skip: Set[int] = verified_positions or set()
+
+        for position, tx in enumerate(block.data):
+            if tx.signature is None or not tx.entries or position in skip: continue
+            public_key = public_key_map.get(tx.entries[0].source_id)
+            if public_key:
+                checks.append(SignatureCheck(public_key = public_key, tx_hash = tx.tx_hash, signature = tx.signature))
+                positions.append(position)
+
+        batch_result = BatchSignatureVerifier.verify_batch(checks)
+
+        results: List[Optional[bool]] = [True if position in skip else None for position in range(len(block.data))]
+        for check_index, position in enumerate(positions):
+            results[position] = batch_result.results[check_index]
+        return BatchSignatureVerifier._build_result(results)
+
+    @staticmethod
+    def verify_batch(checks: List[SignatureCheck], stop_on_failure: bool = True) -> BatchVerificationResult:
+        results: List[Optional[bool]] = [None] * len(checks)
+        stop_event = threading.Event() if stop_on_failure else None
+
+        # 1. Lotes pequeños: el costo de coordinar hilos supera la ganancia.
+        if len(checks) < Config.SIGNATURE_BATCH_MIN_PARALLEL or Config.SIGNATURE_VERIFY_WORKERS <= 1:
+            BatchSignatureVerifier._verify_slice(checks, 0, len(checks), results, stop_event)
+            return BatchSignatureVerifier._build_result(results)
+
+        # 2. Repartir en porciones contiguas.
+        slice_count = Config.SIGNATURE_VERIFY_WORKERS * BatchSignatureVerifier._SLICES_PER_WORKER
+        slice_size = max(1, -(-len(checks) // slice_count))
+        executor = BatchSignatureVerifier._get_executor()
+
+        futures = [
+            executor.submit(BatchSignatureVerifier._verify_slice, checks, start, min(start + slice_size, len(checks)), results, stop_event)
+            for start in range(0, len(checks), slice_size)
+        ]
+        wait(futures)
+
+        for future in futures:
+            future.result() # Propagar errores inesperados
+        return BatchSignatureVerifier._build_result(results)
+
+    # --- Helpers ---
+
+    @staticmethod
+    def _verify_slice(checks: List[SignatureCheck], start: int, end: int, results: List[Optional[bool]], stop_event: Optional[threading.Event]) -> None:
+        for position in range(start, end):
+            if stop_event is not None and stop_event.is_set(): return
+
+            check = checks[position]
+            is_valid = TransactionVerifier.verify(check.public_key, check.tx_hash, check.signature)
+            results[position] = is_valid
+
+            if not is_valid and stop_event is not None:
+                stop_event.set()
+                return
+
+    @staticmethod
+    def _build_result(results: List[Optional[bool]]) -> BatchVerificationResult:
+        first_failure = next((i for i, ok in enumerate(results) if ok is False), None)
+        return BatchVerificationResult(results = results, first_failure = first_failure)
+
+    @staticmethod
+    def _get_executor() -> ThreadPoolExecutor:
+        with BatchSignatureVerifier._executor_lock:
+            if BatchSignatureVerifier._executor is None:
+                BatchSignatureVerifier._executor = ThreadPoolExecutor(
+                    max_workers = Config.SIGNATURE_VERIFY_WORKERS,
+                    thread_name_prefix = 'sigverify'
+                )
+            return BatchSignatureVerifier._executor
\ No newline at end of file
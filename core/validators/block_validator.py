@@ -4,18 +4,21 @@ class BlockValidator:
     Verifica la integridad y el PoW de un Bloque ya existente.
 
     Methods:
-        verify(block: Block) -> bool:
+        verify(block: Block, verified_positions: Optional[Set[int]] = None) -> bool:
             1. Verificar Timestamp (usando tolerancia de Config).
             2. Ensamblar DTO de Hashing (BlockHashingData) con datos del bloque.
-            3. Recalcular el hash.
+            3. Recalcular el hash (omitido si el bloque ya viene verificado del deserializador: 'integrity_verified';
+               ese hasheo ya se hizo fuera del event loop, ver BlockDeserializer).
             4. Verificar integridad.
             5. Calcular Target de dificultad.
             6. Verificar PoW (hash_int <= target).
-            7. Validar la integridad de TODAS las transacciones.
-            8. Retornar True si todo es válido.
+            7. Validar el tamaño máximo de bloque (Config.BLOCK_MAX_SIZE_BYTES, medido con TransactionUtils.estimate_size).
+            8. Validar la integridad de TODAS las transacciones (salvo las posiciones ya verificadas, ver VerifiedTxCache).
+            9. Retornar True si todo es válido.
 '''
 
 import time
+from typing import Optional, Set
 
 # --- Importación de Configuración Centralizada ---
 from config import Config
@@ -25,12 +28,13 @@ from core.models.block import Block
 from core.hashing.block_hasher import BlockHasher
 from core.dto.block_hashing_data import BlockHashingData
 from core.validators.transaction_validator import TransactionValidator
+from core.utils.transaction_utils import TransactionUtils
 from core.utils.difficulty_utils import DifficultyUtils
 
 class BlockValidator:
 
     @staticmethod
-    def verify(block: Block) -> bool: 
+    def verify(block: Block, verified_positions: Optional[Set[int]] = None) -> bool: 
         
         # Validación de Tiempo Futuro (Drift Tolerance)
         # Usamos la configuración centralizada (ej. 7200 seg = 2 horas)
@@ -39,26 +43,33 @@ class BlockValidator:
         if block.timestamp > max_allowed_timestamp:
             return False
             
-        hashing_dto: BlockHashingData = BlockHashingData(
-            index = block.index,
-            timestamp = block.timestamp,
-            previous_hash = block.previous_hash,
-            bits = block.bits, 
-            merkle_root = block.merkle_root,
-            nonce = block.nonce
-        )
-        
-        recalculated_hash: str = BlockHasher.calculate(hashing_dto)
-        
-        if recalculated_hash != block.hash:
-            return False
+        recalculated_hash: str = block.hash
+
+        if not block.integrity_verified:
+            hashing_dto: BlockHashingData = BlockHashingData(
+                index = block.index,
+                timestamp = block.timestamp,
+                previous_hash = block.previous_hash,
+                bits = block.bits, 
+                merkle_root = block.merkle_root,
+                nonce = block.nonce
+            )
+            
+            recalculated_hash = BlockHasher.calculate(hashing_dto)
+            
+            if recalculated_hash != block.hash:
+                return False
 
         target: int = DifficultyUtils.bits_to_target(block.bits)
         
         if int(recalculated_hash, 16) > target:
             return False
 
-        if not all(TransactionValidator.verify(tx) for tx in block.data):
+        if sum(TransactionUtils.estimate_size(tx.entries) for tx in block.data) > Config.BLOCK_MAX_SIZE_BYTES:
+            return False
+
+        skip: Set[int] = verified_positions or set()
+        if not all(position in skip or TransactionValidator.verify(tx) for position, tx in enumerate(block.data)):
             return False
 
         return True
\ No newline at end of file
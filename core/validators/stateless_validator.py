@@ -0,0 +1,169 @@
+# network_of_interactive_nodes/core/validators/stateless_validator.py
+'''
+class StatelessValidator:
+    Agrupa las validaciones que NO dependen del estado del nodo (cadena, mempool).
+    Son las más costosas en CPU (re-hasheo, Merkle, PoW, ECDSA) y por eso se ejecutan
+    en el pool de validación (hilos), fuera del event loop.
+
+    Methods:
+        verify_block(block, public_key_map, verified_cache) -> bool: Validación sin estado de un Bloque.
+            1. Consultar la caché: las TXs ya verificadas no se re-hashean ni re-verifican.
+               (Se omiten por posición: la entrada de la caché incluye la firma, y otra copia del mismo
+                'tx_hash' con otra firma en el mismo bloque se verifica igual.)
+            2. Verificar PoW, hash e integridad de las TXs restantes (Delega a BlockValidator).
+            3. Verificar en paralelo las firmas restantes cuyo dueño tiene clave registrada (BatchSignatureVerifier).
+            4. Si el bloque es válido, registrar en la caché sus TXs verificadas.
+
+        verify_tx(tx, public_key_map, verified_cache) -> bool: Validación sin estado de una Transacción.
+            1. Si está firmada: exigir entries y una clave registrada para el dueño.
+            2. Si ya está en la caché: aceptar sin re-verificar.
+            3. Validar integridad del hash (Delega a TransactionValidator).
+            4. Validar la firma (Delega a TransactionVerifier).
+            5. Registrar la TX en la caché.
+
+        verify_txs(txs, public_key_map, verified_cache) -> List[bool]: Validación sin estado de un lote de TXs independientes.
+            1. Aplicar a cada TX las reglas de 'verify_tx' salvo la firma (entries, clave registrada, caché, integridad).
+            2. Verificar todas las firmas pendientes en UN lote (BatchSignatureVerifier, sin parada temprana).
+            3. Registrar en la caché las TXs válidas.
+            4. Retornar el resultado por TX, en el orden del lote.
+
+        has_unknown_signer(tx, public_key_map) -> bool: True si la TX está firmada por un dueño sin clave registrada
+            (se rechaza, pero puede ser honesta: la clave aún no llegó a este nodo).
+
+        fails_proof_of_work(block) -> bool: True si el hash del bloque (ya verificado contra su header) no cumple
+            el objetivo de 'bits'. Es el único fallo que comparte cualquier copia con ese mismo hash.
+'''
+
+import logging
+from typing import Dict, List, Optional, Set
+from Crypto.PublicKey.ECC import EccKey
+
+# Importaciones de la arquitectura
+from core.models.block import Block
+from core.models.transaction import Transaction
+from core.validators.block_validator import BlockValidator
+from core.validators.transaction_validator import TransactionValidator
+from core.validators.transaction_verifier import TransactionVerifier
+from core.validators.batch_signature_verifier import BatchSignatureVerifier
+from core.validators.verified_tx_cache import VerifiedTxCache
+from core.utils.difficulty_utils import DifficultyUtils
+from core.dto.signature_check import SignatureCheck
+
+class StatelessValidator:
+
+    @staticmethod
+    def verify_block(block: Block, public_key_map: Dict[str, EccKey], verified_cache: Optional[VerifiedTxCache] = None) -> bool:
+
+        verified_positions: Set[int] = set()
+        if verified_cache is not None:
+            verified_positions = {
+                position for position, tx in enumerate(block.data)
+                if StatelessValidator._is_cacheable(tx, public_key_map)
+                and verified_cache.contains(tx, StatelessValidator._signer_key(tx, public_key_map))
+            }
+
+        if not BlockValidator.verify(block, verified_positions):
+            logging.warning(f'Error Consenso: Bloque {block.index} inválido (PoW o Integridad).')
+            return False
+
+        signatures = BatchSignatureVerifier.verify_block_signatures(block, public_key_map, verified_positions)
+        if signatures.first_failure is not None:
+            logging.warning(f'Firma inválida en TX {block.data[signatures.first_failure].tx_hash}')
+            return False
+
+        if verified_cache is not None:
+            for position, tx in enumerate(block.data):
+                if position not in verified_positions and StatelessValidator._is_cacheable(tx, public_key_map):
+                    verified_cache.add(tx, StatelessValidator._signer_key(tx, public_key_map))
+
+        return True
+
+    @staticmethod
+    def verify_tx(tx: Transaction, public_key_map: Dict[str, EccKey], verified_cache: Optional[VerifiedTxCache] = None) -> bool:
+
+        public_key = StatelessValidator._signer_key(tx, public_key_map)
+
+        if tx.signature is not None:
+            if not tx.entries:
+                logging.warning(f'Consenso: TX {tx.tx_hash} rechazada (firmada pero sin entries).')
+                return False
+
+            if not public_key:
+                logging.warning(f'Consenso: TX {tx.tx_hash} rechazada (Firma inválida).')
+                return False
+
+        if verified_cache is not None and verified_cache.contains(tx, public_key):
+            return True
+
+        if not TransactionValidator.verify(tx):
+            logging.warning(f'Consenso: TX {tx.tx_hash} rechazada (Integridad fallida).')
+            return False
+
+        if tx.signature is not None and public_key is not None:
+            if not TransactionVerifier.verify(public_key, tx.tx_hash, tx.signature):
+                logging.warning(f'Consenso: TX {tx.tx_hash} rechazada (Firma inválida).')
+                return False
+
+        if verified_cache is not None:
+            verified_cache.add(tx, public_key)
+        return True
+
+    @staticmethod
+    def verify_txs(txs: List[Transaction], public_key_map: Dict[str, EccKey], verified_cache: Optional[VerifiedTxCache] = None) -> List[bool]:
+
+        results: List[bool] = [False] * len(txs)
+        checks: List[SignatureCheck] = []
+        positions: List[int] = []
+
+        for position, tx in enumerate(txs):
+            public_key = StatelessValidator._signer_key(tx, public_key_map)
+
+            if tx.signature is not None and (not tx.entries or not public_key):
+                logging.warning(f'Consenso: TX {tx.tx_hash} rechazada (Firma inválida o sin entries).')
+                continue
+
+            if verified_cache is not None and verified_cache.contains(tx, public_key):
+                results[position] = True
+                continue
+
+            if not TransactionValidator.verify(tx):
+                logging.warning(f'Consenso: TX {tx.tx_hash} rechazada (Integridad fallida).')
+                continue
+
+            if tx.signature is not None and public_key is not None:
+                checks.append(SignatureCheck(public_key = public_key, tx_hash = tx.tx_hash, signature = tx.signature))
+                positions.append(position)
+            else:
+                results[position] = True
+
+        signatures = BatchSignatureVerifier.verify_batch(checks, stop_on_failure = False)
+        for check_index, position in enumerate(positions):
+            results[position] = signatures.results[check_index] is True
+            if not results[position]:
+                logging.warning(f'Consenso: TX {txs[position].tx_hash} rechazada (Firma inválida).')
+
+        if verified_cache is not None:
+            for tx, is_valid in zip(txs, results):
+                if is_valid: verified_cache.add(tx, StatelessValidator._signer_key(tx, public_key_map))
+
+        return results
+
+    @staticmethod
+    def has_unknown_signer(tx: Transaction, public_key_map: Dict[str, EccKey]) -> bool:
+        return tx.signature is not None and bool(tx.entries) and StatelessValidator._signer_key(tx, public_key_map) is None
+
+    @staticmethod
+    def fails_proof_of_work(block: Block) -> bool:
+        return block.integrity_verified and int(block.hash, 16) > DifficultyUtils.bits_to_target(block.bits)
+
+    # --- Helpers ---
+
+    @staticmethod
+    def _signer_key(tx: Transaction, public_key_map: Dict[str, EccKey]) -> Optional[EccKey]:
+        if tx.signature is None or not tx.entries: return None
+        return public_key_map.get(tx.entries[0].source_id)
+
+    @staticmethod
+    def _is_cacheable(tx: Transaction, public_key_map: Dict[str, EccKey]) -> bool:
+        '''Sin firma, o firmada con clave registrada (una TX firmada sin clave conocida no está 'completamente' validada).'''
+        return tx.signature is None or StatelessValidator._signer_key(tx, public_key_map) is not None
\ No newline at end of file
@@ -5,6 +5,8 @@ class TransactionValidator:
 
     Methods:
         verify(tx: Transaction) -> bool: Ejecuta una validación completa de la transacción.
+            0. Si la TX ya viene verificada del deserializador ('integrity_verified'), no repetir el hasheo
+               (ese hasheo ya se hizo fuera del event loop: ver TransactionDeserializer).
             1. Validar la integridad de cada DataEntry.
             2. Ensamblar el DTO (TransactionHashingData) para el hasher de la transacción.
             3. Llamar al Hasher para recalcular el hash de la transacción.
@@ -23,6 +25,9 @@ class TransactionValidator:
     @staticmethod
     def verify(tx: Transaction) -> bool:
 
+        if tx.integrity_verified:
+            return True
+
         entries_are_valid: bool = all(DataEntryValidator.verify(e) for e in tx.entries)
         
         hashing_dto: TransactionHashingData = TransactionHashingData(
@@ -7,30 +7,95 @@ class TransactionVerifier:
     desbloquea el "ScriptPubKey" (Clave Pública).
 
     *** ACTUALIZACIÓN: Sincronizado con TransactionSigner (Manejo de bytes crudos). ***
+    *** ACTUALIZACIÓN: Motor de verificación intercambiable (ISignatureBackend) con contexto por clave. ***
+
+    Attributes:
+        _backend            (ISignatureBackend):    Motor activo (por defecto pycryptodome).
+        _contexts           (OrderedDict):          LRU de contextos por clave (id -> (clave, contexto)).
+        _benchmark_report   (Dict):                 Resultado del último benchmark de motores.
 
     Methods:
         verify(public_key, tx_hash, signature_hex) -> bool:
             Punto de entrada. Orquesta la ejecución del script de validación estándar (P2PKH).
+
+        get_context(public_key) -> Any:
+            Contexto de verificación de una clave (se construye una vez y se reutiliza; ej. tablas precalculadas).
+
+        verify_with(context, tx_hash, signature_hex) -> bool:
+            Igual que 'verify', pero con un contexto ya obtenido (lotes de firmas).
+
+        configure_backend(preference, samples) -> Dict[str, Any]: Selección del motor al arrancar.
+            1. 'auto': medir todos los motores disponibles con Config.SIGNATURE_VERIFY_WORKERS hilos y quedarse
+               con el más rápido (SignatureBackendBenchmark).
+            2. Nombre concreto: usarlo si está disponible (si no, se mantiene el actual).
+            3. Reportar verificaciones/segundo en un hilo y las medidas con el pool (no una extrapolación lineal).
+
+        get_backend_report() -> Dict[str, Any]: Motor activo y resultados del benchmark (métricas).
             
-        _op_check_sig(public_key, message_hash, signature_bytes) -> bool:
-            Implementación del OpCode OP_CHECKSIG (Verificación ECDSA pura).
+        _op_check_sig(context, message, signature_bytes) -> bool:
+            Implementación del OpCode OP_CHECKSIG (Verificación ECDSA pura, delegada al motor).
 '''
 
 import logging
-from typing import Any 
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
 from Crypto.PublicKey.ECC import EccKey
-from Crypto.Signature import DSS
-from Crypto.Hash import SHA256
 from binascii import unhexlify
 
+# Importaciones de la arquitectura
+from core.interfaces.i_signature_backend import ISignatureBackend
+from core.security.pycryptodome_signature_backend import PycryptodomeSignatureBackend
+from core.security.ecdsa_signature_backend import EcdsaSignatureBackend
+from core.security.signature_backend_benchmark import SignatureBackendBenchmark
+
+# Importacion de la configuracion
+from config import Config
+
 class TransactionVerifier:
 
+    AVAILABLE_BACKENDS: List[ISignatureBackend] = [PycryptodomeSignatureBackend(), EcdsaSignatureBackend()]
+
+    _backend: ISignatureBackend = AVAILABLE_BACKENDS[0]
+    _contexts: 'OrderedDict[int, Tuple[EccKey, Any]]' = OrderedDict()
+    _contexts_lock: threading.Lock = threading.Lock()
+    _benchmark_report: Dict[str, Dict[str, Any]] = {}
+
     @staticmethod
     def verify(public_key: EccKey, tx_hash: str, signature_hex: str) -> bool:
         '''
         Ejecuta la validación estándar (Simulación de P2PKH).
         Equivalente a: OP_DUP OP_HASH160 <pubKey> OP_EQUALVERIFY OP_CHECKSIG
         '''
+        try:
+            context = TransactionVerifier.get_context(public_key)
+        except (ValueError, TypeError, AttributeError) as e:
+            logging.debug(f"Verifier: Clave pública no válida: {e}")
+            return False
+
+        return TransactionVerifier.verify_with(context, tx_hash, signature_hex)
+
+    @staticmethod
+    def get_context(public_key: EccKey) -> Any:
+        key_id = id(public_key)
+
+        with TransactionVerifier._contexts_lock:
+            cached = TransactionVerifier._contexts.get(key_id)
+            if cached is not None and cached[0] is public_key:
+                TransactionVerifier._contexts.move_to_end(key_id)
+                return cached[1]
+
+        # Construcción fuera del candado (el precálculo puede tardar algunos ms).
+        context = TransactionVerifier._backend.prepare(public_key)
+
+        with TransactionVerifier._contexts_lock:
+            TransactionVerifier._contexts[key_id] = (public_key, context)
+            while len(TransactionVerifier._contexts) > Config.SIGNATURE_KEY_CONTEXT_CACHE_SIZE:
+                TransactionVerifier._contexts.popitem(last = False)
+        return context
+
+    @staticmethod
+    def verify_with(context: Any, tx_hash: str, signature_hex: str) -> bool:
         try:
             # 1. Preparar los datos (La "Pila")
             # IMPORTANTE: Debe coincidir exactamente con la lógica del TransactionSigner.
@@ -41,13 +106,12 @@ class TransactionVerifier:
                 # Fallback defensivo si el hash no es hex válido (para compatibilidad)
                 raw_hash_bytes = tx_hash.encode('utf-8')
 
-            message_hash_obj = SHA256.new(raw_hash_bytes)
             signature_bytes = unhexlify(signature_hex)
 
             # 2. Ejecutar Operación Criptográfica (OP_CHECKSIG)
             return TransactionVerifier._op_check_sig(
-                public_key=public_key, 
-                message_hash_obj=message_hash_obj, 
+                context=context, 
+                message=raw_hash_bytes, 
                 signature_bytes=signature_bytes
             )
 
@@ -58,21 +122,52 @@ class TransactionVerifier:
             logging.error(f"Verifier: Error crítico en motor de scripts: {e}")
             return False
 
+    # --- Selección del Motor ---
+
+    @staticmethod
+    def configure_backend(preference: str = Config.SIGNATURE_BACKEND, samples: int = Config.SIGNATURE_BENCHMARK_SAMPLES) -> Dict[str, Any]:
+        backends = TransactionVerifier.AVAILABLE_BACKENDS
+
+        workers = Config.SIGNATURE_VERIFY_WORKERS
+        if preference == 'auto':
+            selected, report = SignatureBackendBenchmark.select_fastest(backends, samples, workers)
+        else:
+            report = SignatureBackendBenchmark.run(backends, samples, workers)
+            selected = next((b for b in backends if b.name == preference and report[b.name].get('correct')), TransactionVerifier._backend)
+            if selected.name != preference:
+                logging.warning(f"Verifier: Motor '{preference}' no disponible. Se mantiene '{selected.name}'.")
+
+        TransactionVerifier._set_backend(selected)
+        TransactionVerifier._benchmark_report = report
+
+        for name, result in report.items():
+            if result.get('correct'):
+                logging.info(f"Verifier: Motor '{name}': {result['verifications_per_sec_per_core']} verif/s en un hilo, "
+                             f"{result['verifications_per_sec']} con {workers} hilos (preparación por clave: {result['prepare_ms']} ms).")
+        rate = report[selected.name].get('verifications_per_sec', 0.0)
+        logging.info(f"Verifier: Motor seleccionado '{selected.name}' ({rate:.0f} verif/s medidas con {workers} hilos).")
+
+        return TransactionVerifier.get_backend_report()
+
+    @staticmethod
+    def get_backend_report() -> Dict[str, Any]:
+        return {
+            'backend': TransactionVerifier._backend.name,
+            'workers': Config.SIGNATURE_VERIFY_WORKERS,
+            'benchmark': TransactionVerifier._benchmark_report
+        }
+
+    @staticmethod
+    def _set_backend(backend: ISignatureBackend) -> None:
+        with TransactionVerifier._contexts_lock:
+            TransactionVerifier._backend = backend
+            TransactionVerifier._contexts.clear() # Los contextos son propios de cada motor
+
     # --- Implementación de OpCodes (Instrucciones del Intérprete) ---
 
     @staticmethod
-    def _op_check_sig(public_key: EccKey, message_hash_obj: Any, signature_bytes: bytes) -> bool:
+    def _op_check_sig(context: Any, message: bytes, signature_bytes: bytes) -> bool:
         '''
-        OP_CHECKSIG: Verifica una firma ECDSA contra un mensaje y una clave pública.
+        OP_CHECKSIG: Verifica una firma ECDSA contra un mensaje y una clave pública (ya ligada al contexto del motor).
         '''
-        try:
-            # Usamos el estándar FIPS-186-3 para ECDSA (Curva NIST P-256 / secp256r1)
-            # Nota: RFC 6979 se usa para firmar (generar k), pero la verificación
-            # sigue el estándar matemático normal ECDSA.
-            verifier = DSS.new(public_key, 'fips-186-3') # type: ignore
-            
-            verifier.verify(message_hash_obj, signature_bytes)
-            return True
-        except ValueError:
-            # La firma no es válida para esta clave y mensaje
-            return False
\ No newline at end of file
+        return TransactionVerifier._backend.verify(context, message, signature_bytes)
\ No newline at end of file
@@ -0,0 +1,104 @@
+# network_of_interactive_nodes/core/validators/verified_tx_cache.py
+'''
+class VerifiedTxCache:
+    Caché LRU acotada de transacciones que ya pasaron la validación completa (integridad + firma).
+    Una TX que llegó por gossip y luego aparece dentro de un bloque no vuelve a re-hashearse
+    ni a verificar su firma ECDSA.
+
+    La clave es (tx_hash, signature, huella de la clave pública del firmante):
+    si cambia la firma o la clave registrada del dueño, la entrada deja de coincidir.
+    El 'tx_hash' es seguro como identidad del contenido porque toda Transaction se construye
+    recalculando su hash (TransactionFactory / TransactionDeserializer) y es inmutable.
+
+    Attributes:
+        _capacity       (int):                              Máximo de entradas (Config.VERIFIED_TX_CACHE_SIZE).
+        _entries        (OrderedDict[Tuple, None]):         Entradas en orden LRU (la más reciente al final).
+        _fingerprints   (OrderedDict[int, Tuple[EccKey, str]]): LRU de huellas por objeto clave (id -> (clave, huella)).
+                                                            Acotada: el KeyRegistry puede re-parsear claves (objetos nuevos).
+        _hits / _misses (int):                              Contadores para la métrica de acierto.
+        _lock           (threading.Lock):                   Candado (la usan los hilos del pool de validación).
+
+    Methods:
+        contains(tx, public_key) -> bool: Consulta (cuenta acierto/fallo y refresca la posición LRU).
+        add(tx, public_key): Registra una TX validada (expulsa la menos reciente si está llena).
+        hit_rate() -> float: Proporción de aciertos sobre consultas.
+        get_stats() -> Dict[str, Any]: Métricas (tamaño, capacidad, aciertos, fallos, hit_rate).
+'''
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from Crypto.PublicKey.ECC import EccKey
+
+# Importaciones de la arquitectura
+from core.models.transaction import Transaction
+
+# Importacion de la configuracion
+from config import Config
+
+_CacheKey = Tuple[str, Optional[str], Optional[str]]
+
+class VerifiedTxCache:
+
+    def __init__(self, capacity: int = Config.VERIFIED_TX_CACHE_SIZE):
+        self._capacity = capacity
+        self._entries: 'OrderedDict[_CacheKey, None]' = OrderedDict()
+        self._fingerprints: 'OrderedDict[int, Tuple[EccKey, str]]' = OrderedDict()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._lock = threading.Lock()
+
+    def contains(self, tx: Transaction, public_key: Optional[EccKey]) -> bool:
+        key = self._make_key(tx, public_key)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return True
+            self._misses += 1
+            return False
+
+    def add(self, tx: Transaction, public_key: Optional[EccKey]) -> None:
+        key = self._make_key(tx, public_key)
+        with self._lock:
+            self._entries[key] = None
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._capacity:
+                self._entries.popitem(last = False)
+
+    def hit_rate(self) -> float:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return self._hits / lookups if lookups else 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        hit_rate = self.hit_rate()
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'capacity': self._capacity,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': round(hit_rate, 4)
+            }
+
+    # --- Helpers ---
+
+    def _make_key(self, tx: Transaction, public_key: Optional[EccKey]) -> _CacheKey:
+        if tx.signature is None or public_key is None:
+            return (tx.tx_hash, tx.signature, None)
+        return (tx.tx_hash, tx.signature, self._fingerprint(public_key))
+
+    def _fingerprint(self, public_key: EccKey) -> str:
+        # Exportar el punto es caro (~100 µs): se memoriza por objeto (las claves viven en el mapa del nodo).
+        cached = self._fingerprints.get(id(public_key))
+        if cached is not None and cached[0] is public_key:
+            return cached[1]
+
+        point = public_key.pointQ
+        fingerprint = f'{int(point.x):x}:{int(point.y):x}'
+        with self._lock:
+            self._fingerprints[id(public_key)] = (public_key, fingerprint)
+            while len(self._fingerprints) > Config.SIGNATURE_KEY_CONTEXT_CACHE_SIZE:
+                self._fingerprints.popitem(last = False)
+        return fingerprint
\ No newline at end of file
@@ -0,0 +1,214 @@
+# network_of_interactive_nodes/identity/key_registry.py
+'''
+class KeyRegistry(MutableMapping[str, EccKey]):
+    Registro persistente e indexado de claves públicas (dirección P2PKH -> clave pública DER) en SQLite.
+    Reemplaza el escaneo de '*.pem' al arrancar: el arranque es O(1) y las claves se cargan bajo demanda.
+
+    Se comporta como el 'public_key_map' (Dict[str, EccKey]) que esperan los gestores:
+    'get(address)' consulta primero una LRU de EccKey ya parseadas y, si falla, el índice SQLite.
+    Las claves nuevas (ej. sensores) se registran en caliente con 'register' sin reiniciar el nodo.
+
+    Attributes:
+        _db_path        (str):                          Ruta del archivo SQLite.
+        _connection     (sqlite3.Connection):           Conexión compartida (protegida por '_lock').
+        _cache          (OrderedDict[str, EccKey]):     LRU de claves parseadas (las direcciones desconocidas no se cachean:
+                                                        otra herramienta puede registrarlas en el mismo archivo).
+        _cache_size     (int):                          Capacidad de la LRU (Config.KEY_REGISTRY_CACHE_SIZE).
+        _lock           (threading.Lock):               Candado de SQLite y la LRU (la consultan los hilos del pool de validación).
+                                                        El parseo DER de 'get' se hace fuera: no serializa a esos hilos.
+        _deletions      (int):                          Bajas hechas (una consulta que parseó fuera del candado no
+                                                        cachea una clave borrada mientras tanto).
+
+    Methods:
+        register(public_key) -> str: Registra (o actualiza) una clave. Retorna su dirección.
+            1. Derivar la dirección P2PKH (AddressFactory).
+            2. Exportar la clave a DER y guardarla (INSERT OR REPLACE, índice por dirección).
+            3. Actualizar la LRU.
+
+        register_pem(pem_data) -> str: Registra una clave desde PEM (pública o privada: se guarda solo la pública).
+
+        import_pem_files(paths) -> int: Alta incremental desde archivos '*.pem' (una transacción SQLite). Idempotente:
+            se recuerda la fecha de modificación de cada archivo importado y solo se leen los nuevos o modificados,
+            así que puede llamarse en cada arranque (las herramientas que solo escriben un '.pem' no tocan el registro).
+            Retorna las claves importadas en esta llamada.
+
+        import_public_keys(rows) -> int: Alta masiva de pares (dirección, clave DER) ya calculados (una transacción SQLite).
+
+        get(address) -> Optional[EccKey]: Consulta perezosa (LRU -> SQLite -> parseo DER, este último sin el candado).
+
+        close(): Cierra la conexión.
+'''
+
+import os
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Iterable, Iterator, Optional, Tuple
+from Crypto.PublicKey import ECC
+from Crypto.PublicKey.ECC import EccKey
+
+from identity.address_factory import AddressFactory
+
+# Importacion de la configuracion
+from config import Config
+
+class KeyRegistry(MutableMapping[str, EccKey]):
+
+    def __init__(self, db_path: str, cache_size: int = Config.KEY_REGISTRY_CACHE_SIZE):
+        self._db_path = db_path
+        self._cache_size = cache_size
+        self._cache: 'OrderedDict[str, EccKey]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._deletions = 0
+
+        self._connection = sqlite3.connect(db_path, check_same_thread = False)
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS public_keys ('
+            'address TEXT PRIMARY KEY, '
+            'public_key_der BLOB NOT NULL, '
+            'registered_at INTEGER NOT NULL DEFAULT (CAST(strftime(\'%s\', \'now\') AS INTEGER)))'
+        )
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS imported_pem_files ('
+            'path TEXT PRIMARY KEY, '
+            'mtime_ns INTEGER NOT NULL)'
+        )
+        self._connection.commit()
+        logging.info(f'Registro de claves: {len(self)} claves indexadas en {db_path}.')
+
+    # --- Registro ---
+
+    def register(self, public_key: EccKey) -> str:
+        public_key = public_key.public_key() if public_key.has_private() else public_key
+        address = AddressFactory.generate_p2pkh(public_key)
+        der_bytes: bytes = public_key.export_key(format = 'DER')
+
+        with self._lock:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO public_keys (address, public_key_der) VALUES (?, ?)',
+                (address, der_bytes)
+            )
+            self._connection.commit()
+            self._remember(address, public_key)
+
+        return address
+
+    def register_pem(self, pem_data: str) -> str:
+        return self.register(ECC.import_key(pem_data))
+
+    def import_pem_files(self, paths: Iterable[str]) -> int:
+        with self._lock:
+            imported = dict(self._connection.execute('SELECT path, mtime_ns FROM imported_pem_files'))
+
+        rows = []
+        files = []
+        for path in paths:
+            try:
+                full_path = os.path.abspath(path)
+                mtime_ns = os.stat(full_path).st_mtime_ns
+                if imported.get(full_path) == mtime_ns: continue # Ya importado y sin cambios
+
+                with open(full_path, 'rt') as f:
+                    key = ECC.import_key(f.read().strip())
+                public_key = key.public_key() if key.has_private() else key
+                rows.append((AddressFactory.generate_p2pkh(public_key), public_key.export_key(format = 'DER')))
+                files.append((full_path, mtime_ns))
+            except (OSError, ValueError) as e:
+                logging.warning(f'Registro de claves: {path} omitido ({e}).')
+
+        if not rows: return 0
+        with self._lock:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO public_keys (address, public_key_der) VALUES (?, ?)', rows
+            )
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO imported_pem_files (path, mtime_ns) VALUES (?, ?)', files
+            )
+            self._connection.commit()
+            for address, _der in rows:
+                self._cache.pop(address, None)
+
+        return len(rows)
+
+    def import_public_keys(self, rows: Iterable[Tuple[str, bytes]]) -> int:
+        rows = list(rows)
+
+        with self._lock:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO public_keys (address, public_key_der) VALUES (?, ?)', rows
+            )
+            self._connection.commit()
+            for address, _der in rows:
+                self._cache.pop(address, None)
+
+        return len(rows)
+
+    # --- Consulta (Interfaz de Mapa) ---
+
+    def get(self, address: str, default: Optional[EccKey] = None) -> Optional[EccKey]: # type: ignore[override]
+        with self._lock:
+            cached = self._cache.get(address)
+            if cached is not None:
+                self._cache.move_to_end(address)
+                return cached
+
+            row = self._connection.execute(
+                'SELECT public_key_der FROM public_keys WHERE address = ?', (address,)
+            ).fetchone()
+            deletions = self._deletions
+        if row is None:
+            return default
+
+        public_key: EccKey = ECC.import_key(row[0])
+        with self._lock:
+            if self._deletions == deletions: self._remember(address, public_key)
+
+        return public_key
+
+    def __getitem__(self, address: str) -> EccKey:
+        public_key = self.get(address)
+        if public_key is None:
+            raise KeyError(address)
+        return public_key
+
+    def __setitem__(self, address: str, public_key: EccKey) -> None:
+        expected_address = AddressFactory.generate_p2pkh(public_key.public_key() if public_key.has_private() else public_key)
+        if expected_address != address:
+            raise ValueError(f'La dirección {address} no corresponde a la clave ({expected_address}).')
+        self.register(public_key)
+
+    def __delitem__(self, address: str) -> None:
+        with self._lock:
+            cursor = self._connection.execute('DELETE FROM public_keys WHERE address = ?', (address,))
+            self._connection.commit()
+            self._cache.pop(address, None)
+            self._deletions += 1
+        if cursor.rowcount == 0:
+            raise KeyError(address)
+
+    def __contains__(self, address: object) -> bool:
+        return isinstance(address, str) and self.get(address) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            addresses = [row[0] for row in self._connection.execute('SELECT address FROM public_keys')]
+        return iter(addresses)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM public_keys').fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    # --- Helpers ---
+
+    def _remember(self, address: str, public_key: EccKey) -> None:
+        '''Guarda en la LRU (llamar con el candado tomado).'''
+        self._cache[address] = public_key
+        self._cache.move_to_end(address)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last = False)
\ No newline at end of file
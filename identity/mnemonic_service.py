@@ -4,9 +4,19 @@ class MnemonicService:
     Implementación del estándar BIP-39 para generar claves desde palabras humanas.
     
     *** CORRECCIÓN: Importa 'ECC' (módulo) en lugar de 'EccKey' para usar .construct() ***
+
+    Methods:
+        generate_new_mnemonic(strength) -> str: Genera una frase BIP-39 nueva.
+        mnemonic_to_private_key(mnemonic_phrase, passphrase) -> EccKey: Frase -> semilla (PBKDF2) -> clave única.
+        mnemonic_to_seed(mnemonic_phrase, passphrase) -> bytes: Solo el estiramiento PBKDF2 (costoso, hacerlo UNA vez).
+        derive_indexed_private_key(seed_bytes, index) -> EccKey: Clave determinista número 'index' de una semilla
+            (flotas de sensores: una frase -> N identidades, sin repetir el PBKDF2 por identidad).
+            1. HMAC-SHA256(semilla, etiqueta || index).
+            2. Reducir al rango válido de escalares P-256 [1, n-1].
 '''
 
 import hashlib
+import hmac
 from mnemonic import Mnemonic
 # [IMPORTANTE] Importamos el MÓDULO completo 'ECC', no solo la clase
 from Crypto.PublicKey import ECC 
@@ -14,6 +24,10 @@ from Crypto.PublicKey import ECC
 class MnemonicService:
     
     _LANGUAGE = 'english'
+
+    # Orden de la curva P-256 y etiqueta de dominio de la derivación indexada
+    _P256_ORDER: int = 0xFFFFFFFF00000000FFFFFFFFFFFFFFFFBCE6FAADA7179E84F3B9CAC2FC632551
+    _INDEXED_DERIVATION_TAG: bytes = b'network_of_interactive_nodes/sensor/'
     
     @staticmethod
     def generate_new_mnemonic(strength: int = 128) -> str:
@@ -22,12 +36,7 @@ class MnemonicService:
 
     @staticmethod
     def mnemonic_to_private_key(mnemonic_phrase: str, passphrase: str = "") -> ECC.EccKey:
-        mnemo = Mnemonic(MnemonicService._LANGUAGE)
-        
-        if not mnemo.check(mnemonic_phrase):
-            raise ValueError("La frase semilla es inválida.")
-
-        seed_bytes = mnemo.to_seed(mnemonic_phrase, passphrase=passphrase)
+        seed_bytes = MnemonicService.mnemonic_to_seed(mnemonic_phrase, passphrase)
         
         # Derivación simple (Seed -> SHA256 -> Private Key Integer)
         private_key_bytes = hashlib.sha256(seed_bytes).digest()
@@ -37,4 +46,26 @@ class MnemonicService:
         # Usamos ECC.construct (del módulo), NO EccKey.construct
         ecc_key = ECC.construct(curve='P-256', d=private_key_int)
         
-        return ecc_key
\ No newline at end of file
+        return ecc_key
+
+    @staticmethod
+    def mnemonic_to_seed(mnemonic_phrase: str, passphrase: str = "") -> bytes:
+        mnemo = Mnemonic(MnemonicService._LANGUAGE)
+        
+        if not mnemo.check(mnemonic_phrase):
+            raise ValueError("La frase semilla es inválida.")
+
+        # PBKDF2-HMAC-SHA512 (2048 iteraciones): el paso costoso de BIP-39
+        return mnemo.to_seed(mnemonic_phrase, passphrase=passphrase)
+
+    @staticmethod
+    def derive_indexed_private_key(seed_bytes: bytes, index: int) -> ECC.EccKey:
+        if index < 0:
+            raise ValueError("El índice de derivación debe ser >= 0.")
+
+        message = MnemonicService._INDEXED_DERIVATION_TAG + index.to_bytes(8, 'big')
+        digest = hmac.new(seed_bytes, message, hashlib.sha256).digest()
+
+        # Escalar en [1, n-1] (nunca 0)
+        private_key_int = int.from_bytes(digest, 'big') % (MnemonicService._P256_ORDER - 1) + 1
+        return ECC.construct(curve='P-256', d=private_key_int)
\ No newline at end of file
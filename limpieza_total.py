@@ -9,7 +9,7 @@ def mostrar_menu():
     print("Este script eliminará archivos generados por la red.")
     print("Selecciona qué deseas borrar:\n")
     print("  [1] Solo Historial (Blockchain y Mempool) -> Mantiene tus claves.")
-    print("  [2] TODO (Historial + Claves .pem)        -> Reinicio de fábrica total.")
+    print("  [2] TODO (Historial + Claves .pem + Registro de claves) -> Reinicio de fábrica total.")
     print("  [3] Cancelar")
     print("="*50)
 
@@ -41,10 +41,28 @@ def borrar_historial():
     else:
         print("Operación cancelada.")
 
+def borrar_registro_claves():
+    # Índice SQLite de claves públicas (se reconstruye desde los .pem al arrancar)
+    registros = glob.glob("key_registry.db*")
+    
+    if not registros:
+        print("✅ No hay registro de claves que borrar.")
+        return
+
+    for item in registros:
+        try:
+            os.remove(item)
+            print(f"🗑️  Eliminado: {item}")
+        except Exception as e:
+            print(f"❌ Error eliminando {item}: {e}")
+
 def borrar_todo():
     # Borra historial primero
     borrar_historial()
     
+    # El registro de claves guarda las públicas de todas las identidades
+    borrar_registro_claves()
+    
     # Ahora busca las claves
     claves = glob.glob("*.pem")
     
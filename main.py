@@ -11,7 +11,7 @@ import logging
 import sys
 import os
 import glob
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Any, List, Tuple, Optional
 
 # Configuración de Imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -31,9 +31,11 @@ from core.nodes.wallet_node import WalletNode
 # Identidad y Persistencia
 from identity.key_persistence import KeyPersistence
 from identity.address_factory import AddressFactory
+from identity.key_registry import KeyRegistry
 from Crypto.PublicKey.ECC import EccKey
 from core.persistence.strategies.json_strategy import JsonStrategy
 from core.managers.persistence_manager import PersistenceManager
+from core.validators.transaction_verifier import TransactionVerifier
 from config import Config
 
 # --- LECTURA DE ARGUMENTOS ---
@@ -68,18 +70,18 @@ async def main() -> None:
     mempool = Mempool()
     consensus = ConsensusManager(blockchain=blockchain)
     
-    # Carga dinámica de llaves
-    public_key_map: Dict[str, EccKey] = {} 
-    try:
-        pem_files = glob.glob("*.pem")
-        for key_path in pem_files:
-            try:
-                k = KeyPersistence.ensure_key_exists(key_path)
-                addr = AddressFactory.generate_p2pkh(k.public_key())
-                public_key_map[addr] = k.public_key()
-            except Exception: pass
-    except Exception as e:
-        logging.warning(f"Error cargando llaves: {e}")
+    # Registro de llaves (índice persistente, carga perezosa)
+    public_key_map = KeyRegistry(Config.KEY_REGISTRY_PATH)
+    # Alta de los '*.pem' nuevos o modificados (los ya importados no se vuelven a leer)
+    imported = public_key_map.import_pem_files(glob.glob("*.pem"))
+    if imported: logging.info(f"Registro de llaves: {imported} llaves importadas desde archivos .pem.")
+
+    # Motor de verificación de firmas (benchmark de arranque)
+    if ROLE != "SPV":
+        try:
+            TransactionVerifier.configure_backend()
+        except Exception as e:
+            logging.warning(f"Benchmark de firmas omitido (Error: {e}). Se usa el motor por defecto.")
 
     # 3. IDENTIDAD PROPIA
     private_key: Optional[EccKey] = None
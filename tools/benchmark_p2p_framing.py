@@ -0,0 +1,157 @@
+'''
+Script: tools/benchmark_p2p_framing.py
+----------------------------------------------------------------------
+Propósito: Medir el rendimiento (throughput) de la recepción de mensajes P2P grandes ('block').
+
+Compara:
+    1. ANTES   (StreamReader): readexactly(header) + readexactly(payload) + concatenación + deserialize.
+    2. DESPUÉS (P2PProtocol):  recv_into a buffer reutilizable + cortes con memoryview + deserialize_payload.
+
+Se reportan dos medidas:
+    - Solo framing: lectura + corte del frame + checksum (lo que cambia entre ambas versiones).
+    - Completo:     framing + decodificación JSON del payload (dominada por json.loads).
+      Ambas versiones decodifican igual: aquí la diferencia queda dentro del ruido de medición
+      (se mide el framing, no se espera una mejora en la decodificación).
+
+Cada medida es la mejor de varias rondas alternadas (ANTES/DESPUÉS), con el recolector de basura
+detenido: una sola ronda varía ±15% entre ejecuciones.
+
+El mensaje debe caber en Config.NETWORK_MAX_PAYLOAD_SIZE (si no, P2PProtocol cierra la conexión).
+
+Uso:
+    python tools/benchmark_p2p_framing.py [num_txs_por_bloque] [repeticiones] [rondas]
+----------------------------------------------------------------------
+'''
+
+import sys
+import os
+import time
+import gc
+import asyncio
+import hashlib
+from typing import Any, Dict, List
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.p2p.p2p_message_serializer import P2PMessageSerializer
+from core.p2p.p2p_message_deserializer import P2PMessageDeserializer
+from core.p2p.p2p_protocol import P2PProtocol
+from core.p2p.payloads.block_payload import BlockPayload
+from config import Config
+
+# Tamaño de lectura típico del socket (asyncio usa 64 KB en los transportes de selector)
+CHUNK_SIZE: int = 64 * 1024
+
+def _build_block_message(num_txs: int) -> bytes:
+    '''Construye un mensaje 'block' sintético (solo importa el tamaño y forma del JSON).'''
+    transactions: List[Dict[str, Any]] = []
+    for i in range(num_txs):
+        entry = {
+            'source_id': f'sensor_{i:06d}', 'data_type': 'TEMPERATURE', 'value': os.urandom(64).hex(),
+            'timestamp': 1700000000.0 + i, 'previous_hash': None, 'nonce': i,
+            'metadata': {'unit': 'C'}, 'data_hash': os.urandom(32).hex()
+        }
+        transactions.append({
+            'entries': [entry], 'timestamp': 1700000000.0 + i, 'tx_hash': os.urandom(32).hex(),
+            'signature': os.urandom(64).hex(), 'fee': 0, 'size_bytes': 90, 'fee_rate': 0.0
+        })
+
+    block_data = {
+        'index': 1, 'timestamp': 1700000000, 'previous_hash': '0' * 64, 'bits': '20ffffff',
+        'merkle_root': '0' * 64, 'data': transactions, 'nonce': 0, 'hash': '0' * 64, 'mining_time': None
+    }
+    return P2PMessageSerializer.serialize('block', BlockPayload(block_data = block_data))
+
+def _checksum_only(payload: bytes | memoryview) -> bytes:
+    return hashlib.sha256(hashlib.sha256(payload).digest()).digest()[:4]
+
+async def _run_stream_reader(message: bytes, repetitions: int, decode: bool) -> float:
+    reader = asyncio.StreamReader(limit = 2 ** 32)
+    start = time.perf_counter()
+
+    for _ in range(repetitions):
+        for offset in range(0, len(message), CHUNK_SIZE):
+            reader.feed_data(message[offset:offset + CHUNK_SIZE])
+
+        header_data = await reader.readexactly(P2PMessageSerializer.HEADER_SIZE)
+        payload_size = int.from_bytes(header_data[12:16], 'little')
+        payload_data = await reader.readexactly(payload_size)
+        full_packet = header_data + payload_data
+
+        if decode: P2PMessageDeserializer.deserialize(full_packet)
+        else: _checksum_only(full_packet[P2PMessageSerializer.HEADER_SIZE:])
+
+    return time.perf_counter() - start
+
+async def _run_protocol(message: bytes, repetitions: int, decode: bool) -> float:
+    received: List[int] = []
+
+    def on_frame(_connection: P2PProtocol, command: bytes, checksum: bytes, payload_view: memoryview) -> None:
+        if decode: P2PMessageDeserializer.deserialize_payload(command, checksum, payload_view)
+        else: _checksum_only(payload_view)
+        received.append(len(payload_view))
+
+    protocol = P2PProtocol(
+        on_connection_made = lambda _c: None,
+        on_frame = on_frame,
+        on_connection_lost = lambda _c: None,
+        peer_id = 'benchmark:0'
+    )
+    message_view = memoryview(message)
+    start = time.perf_counter()
+
+    for _ in range(repetitions):
+        offset = 0
+        while offset < len(message):
+            buffer = protocol.get_buffer(-1)
+            nbytes = min(len(buffer), CHUNK_SIZE, len(message) - offset)
+            if nbytes <= 0:
+                buffer.release()
+                raise RuntimeError('Benchmark inválido: el protocolo dejó de aceptar datos (conexión cerrada).')
+            buffer[:nbytes] = message_view[offset:offset + nbytes] # Simula 'sock.recv_into'
+            buffer.release()
+            protocol.buffer_updated(nbytes)
+            offset += nbytes
+
+    elapsed = time.perf_counter() - start
+    if len(received) != repetitions:
+        raise RuntimeError('Benchmark inválido: no se recibieron todos los frames.')
+    return elapsed
+
+def _best_of(rounds: int, message: bytes, repetitions: int, decode: bool) -> tuple[float, float]:
+    '''Mejor tiempo de cada versión en 'rounds' rondas alternadas, sin recolector de basura.'''
+    before, after = float('inf'), float('inf')
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            before = min(before, asyncio.run(_run_stream_reader(message, repetitions, decode)))
+            after = min(after, asyncio.run(_run_protocol(message, repetitions, decode)))
+            gc.collect()
+    finally:
+        gc.enable()
+    return before, after
+
+def main():
+    num_txs = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    repetitions = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    rounds = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+
+    message = _build_block_message(num_txs)
+    payload_size = len(message) - P2PMessageSerializer.HEADER_SIZE
+    if payload_size > Config.NETWORK_MAX_PAYLOAD_SIZE:
+        sys.exit(f'Error: el mensaje ({payload_size} bytes) supera NETWORK_MAX_PAYLOAD_SIZE ({Config.NETWORK_MAX_PAYLOAD_SIZE}). Use menos TXs.')
+    total_mb = len(message) * repetitions / (1024 * 1024)
+
+    print('--- BENCHMARK DE FRAMING P2P (mensaje block) ---')
+    print(f'Tamaño del mensaje: {len(message) / (1024 * 1024):.2f} MB | Repeticiones: {repetitions} | Rondas: {rounds}')
+
+    for label, decode in (('Solo framing', False), ('Completo', True)):
+        before, after = _best_of(rounds, message, repetitions, decode)
+
+        print(f'\n[{label}]')
+        print(f'\tANTES   (StreamReader + concat):     {total_mb / before:8.1f} MB/s ({before:.3f}s)')
+        print(f'\tDESPUÉS (P2PProtocol + memoryview): {total_mb / after:8.1f} MB/s ({after:.3f}s)')
+
+if __name__ == '__main__':
+    main()
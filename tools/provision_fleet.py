@@ -0,0 +1,143 @@
+# network_of_interactive_nodes/tools/provision_fleet.py
+'''
+Script: tools/provision_fleet.py
+----------------------------------------------------------------------
+Propósito: Aprovisionamiento OFFLINE y en lote de identidades para una flota de sensores (ESP32).
+           Genera N identidades en un pool de procesos, en una sola pasada, y reporta el throughput.
+
+Modos:
+    - Aleatorio (por defecto): cada identidad es una clave nueva (KeyFactory).
+    - Determinista (--mnemonic): la identidad 'i' se deriva de UNA frase semilla + índice.
+      El estiramiento PBKDF2 de la frase se hace UNA sola vez (en el proceso principal);
+      los workers solo aplican la derivación indexada (MnemonicService.derive_indexed_private_key).
+
+Pasos:
+    1. (Determinista) Convertir la frase en semilla (MnemonicService.mnemonic_to_seed).
+    2. Repartir los índices en lotes entre los procesos del pool.
+    3. Cada worker: generar/derivar la clave, derivar la dirección y escribir el PEM.
+    4. Escribir el manifiesto de la flota (índice, dirección, archivo PEM, clave pública DER).
+    5. (Opcional, --registry) Registrar todas las claves públicas en el KeyRegistry (una transacción).
+    6. Reportar el throughput (identidades/s).
+
+Uso:
+    python tools/provision_fleet.py 1000 --out-dir fleet
+    python tools/provision_fleet.py 1000 --mnemonic "frase ..." --start-index 0 --registry key_registry.db
+----------------------------------------------------------------------
+'''
+
+import sys
+import os
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from identity.key_factory import KeyFactory
+from identity.address_factory import AddressFactory
+from identity.mnemonic_service import MnemonicService
+
+# (índice, dirección, archivo PEM, clave pública DER en hex)
+ProvisionedIdentity = Tuple[int, str, str, str]
+
+MANIFEST_FILE_NAME: str = 'fleet_manifest.json'
+BATCH_SIZE: int = 64
+
+def _provision_batch(indices: List[int], seed_bytes: Optional[bytes], out_dir: str, prefix: str) -> List[ProvisionedIdentity]:
+    '''Worker: genera (o deriva) un lote de identidades y escribe sus PEM.'''
+    provisioned: List[ProvisionedIdentity] = []
+
+    for index in indices:
+        if seed_bytes is None:
+            private_key = KeyFactory.generate_private_key()
+        else:
+            private_key = MnemonicService.derive_indexed_private_key(seed_bytes, index)
+
+        public_key = private_key.public_key()
+        address = AddressFactory.generate_p2pkh(public_key)
+
+        file_name = f'{prefix}_{index:06d}.pem'
+        # El PEM contiene la clave privada: solo legible por el propietario
+        descriptor = os.open(os.path.join(out_dir, file_name), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(descriptor, 'wt') as f:
+            f.write(private_key.export_key(format = 'PEM'))
+
+        provisioned.append((index, address, file_name, public_key.export_key(format = 'DER').hex()))
+
+    return provisioned
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description = 'Aprovisionamiento en lote de identidades de sensores.')
+    parser.add_argument('count', type = int, help = 'Número de identidades a generar.')
+    parser.add_argument('--out-dir', default = 'fleet', help = 'Directorio de salida (PEM + manifiesto).')
+    parser.add_argument('--prefix', default = 'sensor', help = 'Prefijo de los archivos PEM.')
+    parser.add_argument('--workers', type = int, default = os.cpu_count() or 1, help = 'Procesos del pool.')
+    parser.add_argument('--mnemonic', default = None, help = 'Frase semilla BIP-39 (modo determinista).')
+    parser.add_argument('--passphrase', default = '', help = 'Passphrase opcional de la frase semilla.')
+    parser.add_argument('--start-index', type = int, default = 0, help = 'Primer índice de derivación.')
+    parser.add_argument('--registry', default = None, help = 'Ruta del KeyRegistry (SQLite) donde registrar las claves.')
+    return parser.parse_args()
+
+def main():
+    args = _parse_args()
+    if args.count <= 0 or args.workers <= 0 or args.start_index < 0:
+        sys.exit('Error: count y workers deben ser > 0, start-index >= 0.')
+
+    print('--- APROVISIONAMIENTO DE FLOTA (OFFLINE) ---')
+    os.makedirs(args.out_dir, exist_ok = True)
+    start = time.perf_counter()
+
+    # 1. Estiramiento PBKDF2 una sola vez
+    seed_bytes: Optional[bytes] = None
+    if args.mnemonic is not None:
+        try:
+            seed_bytes = MnemonicService.mnemonic_to_seed(args.mnemonic, args.passphrase)
+        except ValueError as e:
+            sys.exit(f'Error: {e}')
+
+    # 2-3. Pool de procesos por lotes
+    indices = list(range(args.start_index, args.start_index + args.count))
+    batches = [indices[i:i + BATCH_SIZE] for i in range(0, len(indices), BATCH_SIZE)]
+    provisioned: List[ProvisionedIdentity] = []
+
+    with ProcessPoolExecutor(max_workers = args.workers) as executor:
+        futures = [executor.submit(_provision_batch, batch, seed_bytes, args.out_dir, args.prefix) for batch in batches]
+        for future in futures:
+            provisioned.extend(future.result())
+
+    # 4. Manifiesto
+    manifest = {
+        'mode': 'mnemonic' if seed_bytes is not None else 'random',
+        'start_index': args.start_index,
+        'count': len(provisioned),
+        'identities': [
+            {'index': index, 'address': address, 'pem_file': file_name, 'public_key_der': der_hex}
+            for index, address, file_name, der_hex in provisioned
+        ]
+    }
+    manifest_path = os.path.join(args.out_dir, MANIFEST_FILE_NAME)
+    with open(manifest_path, 'wt') as f:
+        json.dump(manifest, f, indent = 2)
+
+    # 5. Registro masivo (opcional)
+    if args.registry is not None:
+        from identity.key_registry import KeyRegistry
+        registry = KeyRegistry(args.registry)
+        try:
+            registry.import_public_keys((address, bytes.fromhex(der_hex)) for _i, address, _f, der_hex in provisioned)
+        finally:
+            registry.close()
+
+    # 6. Reporte
+    elapsed = time.perf_counter() - start
+    print(f'Identidades generadas: {len(provisioned)} ({manifest["mode"]}) con {args.workers} procesos.')
+    print(f'\tManifiesto:  {manifest_path}')
+    if args.registry is not None:
+        print(f'\tRegistro:    {args.registry}')
+    print(f'\tTiempo:      {elapsed:.3f}s')
+    print(f'\tThroughput:  {len(provisioned) / elapsed:.1f} identidades/s')
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file